@@ -1,5 +1,5 @@
 import os
-from test_sqlite import *  # NOQA
+from settings import *  # NOQA
 
 DATABASES = {
     "default": {
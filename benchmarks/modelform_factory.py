@@ -0,0 +1,57 @@
+"""
+Compare building a model form class on every call, like the editing views
+used to, with cached_modelform_factory().
+
+run it from the project directory: `python benchmarks/modelform_factory.py`
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+settings.configure(
+    INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth"],
+    DATABASES={},
+)
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.forms.models import modelform_factory  # noqa: E402
+
+from django_async_extensions.forms.models import (  # noqa: E402
+    AsyncModelForm,
+    cached_modelform_factory,
+    clear_modelform_cache,
+)
+
+FIELDS = ["username", "first_name", "last_name", "email", "is_active"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    clear_modelform_cache()
+    benchmarks = {
+        "modelform_factory": lambda: modelform_factory(
+            User, form=AsyncModelForm, fields=FIELDS
+        ),
+        "cached_modelform_factory": lambda: cached_modelform_factory(
+            User, fields=FIELDS
+        ),
+    }
+    for name, func in benchmarks.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        sys.stdout.write("%-26s %8.2f us per call\n" % (name, best / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+import asyncio
+import copy
+import weakref
+
+from django.core.exceptions import EmptyResultSet, SynchronousOnlyOperation
+from django.db import connections, router
+from django.db.models import Model, signals
+from django.db.models.query import ModelIterable
+
+from django_async_extensions.utils.tasks import create_background_task
+
+
+class _PendingBatch:
+    def __init__(self, rows=None):
+        self.rows = [] if rows is None else rows
+        self.timer = None
+        self.tasks = set()
+
+
+class AsyncBulkCreateBatcher:
+    """
+    Collect instances created concurrently (e.g: by different requests) and
+    insert them with one abulk_create() call once `max_size` instances are
+    waiting or `max_delay` seconds passed since the first one.
+
+    If the bulk insert fails every instance is saved on its own, so each
+    caller gets its saved instance or the error for its own row.
+    """
+
+    def __init__(self, model, using=None, max_size=100, max_delay=0.005):
+        self.model = model
+        self.using = using
+        self.max_size = max_size
+        self.max_delay = max_delay
+        # futures and timers belong to an event loop, keep a batch per loop.
+        self._batches = weakref.WeakKeyDictionary()
+
+    def _get_batch(self, loop):
+        try:
+            return self._batches[loop]
+        except KeyError:
+            batch = self._batches[loop] = _PendingBatch()
+            return batch
+
+    async def acreate(self, obj):
+        """Insert obj with the next batch and return it once it's saved."""
+        loop = asyncio.get_running_loop()
+        batch = self._get_batch(loop)
+        future = loop.create_future()
+        batch.rows.append((obj, future))
+        if len(batch.rows) >= self.max_size:
+            self._flush(loop, batch)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self.max_delay, self._flush, loop, batch)
+        return await future
+
+    async def aflush(self):
+        """Insert the waiting instances now and wait for pending inserts."""
+        loop = asyncio.get_running_loop()
+        batch = self._get_batch(loop)
+        self._flush(loop, batch)
+        if batch.tasks:
+            await asyncio.wait(set(batch.tasks))
+
+    def _flush(self, loop, batch):
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        rows, batch.rows = batch.rows, []
+        if rows:
+            task = create_background_task(loop, self._ainsert(rows))
+            batch.tasks.add(task)
+            task.add_done_callback(batch.tasks.discard)
+
+    async def _ainsert(self, rows):
+        objs = [obj for obj, _ in rows]
+        try:
+            await self.model._default_manager.db_manager(self.using).abulk_create(objs)
+        except Exception as e:
+            if len(rows) == 1:
+                _set_exception(rows[0][1], e)
+                return
+            # find out which rows failed.
+            for obj, future in rows:
+                try:
+                    await obj.asave(force_insert=True, using=self.using)
+                except Exception as error:
+                    _set_exception(future, error)
+                else:
+                    _set_result(future, obj)
+        else:
+            for obj, future in rows:
+                _set_result(future, obj)
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future, exception):
+    if not future.done():
+        future.set_exception(exception)
+
+
+_batchers = {}
+
+
+def get_bulk_create_batcher(model, using=None, max_size=100, max_delay=0.005):
+    """Return the process-wide batcher for the given model and options."""
+    key = (model, using, max_size, max_delay)
+    try:
+        return _batchers[key]
+    except KeyError:
+        batcher = _batchers[key] = AsyncBulkCreateBatcher(
+            model, using, max_size, max_delay
+        )
+        return batcher
+
+
+class AsyncObjectLoader:
+    """
+    Collect lookups of single objects by a unique field (the primary key by
+    default) made concurrently (e.g: by different requests) and load them
+    with one `field__in` query per queryset, once `max_size` lookups are
+    waiting or `max_delay` seconds passed since the first one (by default at
+    the next iteration of the event loop).
+    """
+
+    def __init__(self, model, field="pk", max_size=100, max_delay=0):
+        self.model = model
+        self.field = model._meta.pk if field == "pk" else model._meta.get_field(field)
+        if not self.field.unique:
+            raise ValueError("%s isn't a unique field." % self.field)
+        self.lookup = field
+        self.max_size = max_size
+        self.max_delay = max_delay
+        # futures and timers belong to an event loop, keep a batch per loop.
+        self._batches = weakref.WeakKeyDictionary()
+
+    def _get_batch(self, loop):
+        try:
+            return self._batches[loop]
+        except KeyError:
+            # the querysets and the futures waiting for each value, by query.
+            batch = self._batches[loop] = _PendingBatch({})
+            return batch
+
+    async def aload(self, queryset, value):
+        """
+        Return the object of queryset whose field is value, loaded with the
+        next batch. Raise queryset.model.DoesNotExist if there's none.
+        """
+        value = self.field.to_python(value)
+        query = queryset.query
+        if (
+            query.select_for_update
+            or query.is_sliced
+            or queryset._iterable_class is not ModelIterable
+        ):
+            return await queryset.aget(**{self.lookup: value})
+        try:
+            sql, params = query.get_compiler(queryset.db).as_sql()
+            key = (queryset.db, sql, tuple(params))
+            hash(key)
+        except (EmptyResultSet, SynchronousOnlyOperation, TypeError):
+            return await queryset.aget(**{self.lookup: value})
+
+        loop = asyncio.get_running_loop()
+        batch = self._get_batch(loop)
+        future = loop.create_future()
+        # lookups using the same queryset share a query.
+        _, values = batch.rows.setdefault(key, (queryset, {}))
+        values.setdefault(value, []).append(future)
+        if sum(len(values) for _, values in batch.rows.values()) >= self.max_size:
+            self._flush(loop, batch)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self.max_delay, self._flush, loop, batch)
+        return await future
+
+    def _flush(self, loop, batch):
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        rows, batch.rows = batch.rows, {}
+        for queryset, values in rows.values():
+            task = create_background_task(loop, self._aselect(queryset, values))
+            batch.tasks.add(task)
+            task.add_done_callback(batch.tasks.discard)
+
+    async def _aselect(self, queryset, values):
+        try:
+            objs = [
+                obj
+                async for obj in queryset.filter(
+                    **{"%s__in" % self.lookup: list(values)}
+                )
+            ]
+        except Exception as e:
+            for futures in values.values():
+                for future in futures:
+                    _set_exception(future, e)
+            return
+        found = {getattr(obj, self.field.attname): obj for obj in objs}
+        for value, futures in values.items():
+            obj = found.get(value)
+            for i, future in enumerate(futures):
+                if obj is None:
+                    _set_exception(
+                        future,
+                        queryset.model.DoesNotExist(
+                            "%s matching query does not exist."
+                            % queryset.model._meta.object_name
+                        ),
+                    )
+                else:
+                    # each lookup gets its own instance.
+                    _set_result(future, obj if i == 0 else copy.copy(obj))
+
+
+_loaders = {}
+
+
+def get_object_loader(model, field="pk", max_size=100, max_delay=0):
+    """Return the process-wide loader for the given model and options."""
+    key = (model, field, max_size, max_delay)
+    try:
+        return _loaders[key]
+    except KeyError:
+        loader = _loaders[key] = AsyncObjectLoader(model, field, max_size, max_delay)
+        return loader
+
+
+def can_bulk_save(model):
+    """
+    Return True if instances of model can be written with bulk_create() and
+    bulk_update() instead of save(): those don't call save() or send the
+    pre_save/post_save signals, and don't support multi-table inheritance.
+    """
+    return not (
+        model._meta.parents
+        or model.save is not Model.save
+        or model.asave is not Model.asave
+        or signals.pre_save.has_listeners(model)
+        or signals.post_save.has_listeners(model)
+    )
+
+
+def can_batch_create(obj, using=None):
+    """
+    Return True if saving obj with bulk_create() behaves like obj.save(), see
+    can_bulk_save(). On some backends bulk_create() doesn't set
+    auto-incremented primary keys either.
+    """
+    model = obj.__class__
+    using = using or router.db_for_write(model, instance=obj)
+    return can_bulk_save(model) and not (
+        obj.pk is None
+        and not connections[using].features.can_return_rows_from_bulk_insert
+    )
@@ -0,0 +1,174 @@
+import asyncio
+import copy
+import hashlib
+import weakref
+
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import signals
+
+from django_async_extensions.utils.memo import aget_memoized
+
+KEY_PREFIX = "django_async_extensions.object"
+
+# cache aliases the objects of each model are cached in.
+_cached_models = {}
+# lookups in progress, for each event loop.
+_loading = weakref.WeakKeyDictionary()
+
+
+def can_cache_queryset(queryset):
+    """
+    Return True if the objects of queryset can be cached by their lookup
+    alone: the queryset isn't filtered (filters may depend on the request),
+    and loads every field of the model and nothing else.
+    """
+    query = queryset.query
+    return not (
+        query.has_filters()
+        or query.select_related
+        or query.deferred_loading != (frozenset(), True)
+        or query.annotations
+        or query.extra
+        or query.distinct
+        or query.select_for_update
+        or queryset._prefetch_related_lookups
+    )
+
+
+def _object_key(model, using, pk):
+    return "%s:%s:%s:pk:%s" % (KEY_PREFIX, using, model._meta.label_lower, pk)
+
+
+def _lookup_key(model, using, field, value):
+    digest = hashlib.md5(str(value).encode(), usedforsecurity=False).hexdigest()
+    return "%s:%s:%s:%s:%s" % (
+        KEY_PREFIX,
+        using,
+        model._meta.label_lower,
+        field.name,
+        digest,
+    )
+
+
+def register_cached_model(model, cache_alias="default"):
+    """
+    Remove the objects of model from the cache when they're saved or deleted.
+    Called by the views caching objects, call it in processes (e.g: workers)
+    that only write objects.
+    """
+    aliases = _cached_models.setdefault(model._meta.concrete_model, set())
+    if cache_alias not in aliases:
+        aliases.add(cache_alias)
+        dispatch_uid = "django_async_extensions.db.cache.%s" % model._meta.label
+        signals.post_save.connect(
+            _invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid
+        )
+        signals.post_delete.connect(
+            _invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid
+        )
+
+
+def _invalidate(sender, instance, using, **kwargs):
+    invalidate_cached_object(sender, instance.pk, using)
+
+
+def invalidate_cached_object(model, pk, using):
+    """Remove the object of model with the given pk from the caches."""
+    key = _object_key(model._meta.concrete_model, using, pk)
+    for alias in _cached_models.get(model._meta.concrete_model, ()):
+        caches[alias].delete(key)
+
+
+async def ainvalidate_cached_object(model, pk, using):
+    """Async version of invalidate_cached_object()."""
+    key = _object_key(model._meta.concrete_model, using, pk)
+    for alias in _cached_models.get(model._meta.concrete_model, ()):
+        await caches[alias].adelete(key)
+
+
+async def aget_cached_object(queryset, lookups, timeout=300, cache_alias="default"):
+    """
+    Return the object of queryset matching lookups (a dict of field names, or
+    "pk", and values), read through the cache for `timeout` seconds.
+
+    The object is cached under its primary key and removed from the cache
+    when it's saved or deleted (post_save/post_delete), other lookups map to
+    the primary key. Concurrent lookups of an uncached object share one
+    query. Querysets that can't be cached (see can_cache_queryset()) are
+    queried directly.
+    """
+    filtered = queryset.filter(**lookups)
+    model = queryset.model
+    opts = model._meta
+    try:
+        fields = {
+            name: opts.pk if name == "pk" else opts.get_field(name) for name in lookups
+        }
+        values = {
+            name: field.to_python(lookups[name]) for name, field in fields.items()
+        }
+    except (FieldDoesNotExist, ValidationError):
+        return await aget_memoized(filtered)
+    if (
+        not lookups
+        or not can_cache_queryset(queryset)
+        or any(not field.concrete for field in fields.values())
+    ):
+        return await aget_memoized(filtered)
+
+    register_cached_model(model, cache_alias)
+    cache = caches[cache_alias]
+    concrete_model = opts.concrete_model
+    using = queryset.db
+    pk = values.get("pk")
+    if pk is None:
+        name, value = next(iter(values.items()))
+        pk = await cache.aget(_lookup_key(concrete_model, using, fields[name], value))
+    if pk is not None:
+        obj = await cache.aget(_object_key(concrete_model, using, pk))
+        if obj is not None and all(
+            getattr(obj, fields[name].attname) == value
+            for name, value in values.items()
+        ):
+            return obj
+
+    async def load():
+        obj = await aget_memoized(filtered)
+        await cache.aset(_object_key(concrete_model, using, obj.pk), obj, timeout)
+        for name, value in values.items():
+            if name != "pk":
+                key = _lookup_key(concrete_model, using, fields[name], value)
+                await cache.aset(key, obj.pk, timeout)
+        return obj
+
+    key = (cache_alias, using, concrete_model, tuple(sorted(values.items())))
+    return await _asingle_flight(key, load)
+
+
+async def _asingle_flight(key, load):
+    loop = asyncio.get_running_loop()
+    loading = _loading.setdefault(loop, {})
+    try:
+        future = loading[key]
+    except KeyError:
+        pass
+    else:
+        # each lookup gets its own instance.
+        return copy.copy(await asyncio.shield(future))
+    future = loading[key] = loop.create_future()
+    try:
+        obj = await load()
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            # retrieved by the concurrent lookups, if any.
+            future.exception()
+        raise
+    else:
+        future.set_result(obj)
+        return obj
+    finally:
+        del loading[key]
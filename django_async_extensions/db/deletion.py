@@ -0,0 +1,147 @@
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.db import router, transaction
+from django.db.models import (
+    CASCADE,
+    DO_NOTHING,
+    SET_DEFAULT,
+    SET_NULL,
+    Model,
+    QuerySet,
+    signals,
+)
+from django.db.models.deletion import get_candidate_relations_to_delete
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def can_fast_delete(model):
+    """
+    Return True if deleting instances of model (and what they cascade to)
+    doesn't need the objects in memory: no pre_delete/post_delete receivers,
+    no generic relations, no multi-table inheritance, and only CASCADE,
+    SET_NULL, SET_DEFAULT and DO_NOTHING relations without cycles.
+    """
+    return _can_fast_delete(model, set())
+
+
+def _can_fast_delete(model, path):
+    if model in path:
+        # a cycle could cascade forever without looking at the rows.
+        return False
+    opts = model._meta
+    if (
+        opts.parents
+        or opts.private_fields
+        or signals.pre_delete.has_listeners(model)
+        or signals.post_delete.has_listeners(model)
+    ):
+        return False
+    path = path | {model}
+    for related in get_candidate_relations_to_delete(opts):
+        field = related.field
+        on_delete = field.remote_field.on_delete
+        if len(field.foreign_related_fields) != 1:
+            return False
+        if on_delete is CASCADE:
+            if not _can_fast_delete(related.related_model, path):
+                return False
+        elif on_delete not in (SET_NULL, SET_DEFAULT, DO_NOTHING):
+            return False
+    return True
+
+
+async def afast_delete(obj_or_queryset, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Delete a model instance or the objects of a queryset without fetching
+    them: the cascades are followed with queries on primary keys only, at
+    most batch_size rows at a time, in one transaction.
+
+    Fall back to adelete() when the deletion needs the objects, see
+    can_fast_delete(). Return the same value as adelete().
+    """
+    if isinstance(obj_or_queryset, QuerySet):
+        queryset = obj_or_queryset
+        model = queryset.model
+        if not can_fast_delete(model):
+            return await queryset.adelete()
+        using = queryset.db
+        return await sync_to_async(_delete_queryset)(queryset, using, batch_size)
+    obj = obj_or_queryset
+    model = obj.__class__
+    if (
+        model.delete is not Model.delete
+        or model.adelete is not Model.adelete
+        or not can_fast_delete(model)
+    ):
+        return await obj.adelete()
+    if obj.pk is None:
+        raise ValueError(
+            "%s object can't be deleted because its %s attribute is set "
+            "to None." % (model._meta.object_name, model._meta.pk.attname)
+        )
+    using = router.db_for_write(model, instance=obj)
+    result = await sync_to_async(_delete_pks)(model, [obj.pk], using, batch_size)
+    setattr(obj, model._meta.pk.attname, None)
+    return result
+
+
+def _has_cascades(model):
+    return any(
+        related.field.remote_field.on_delete is not DO_NOTHING
+        for related in get_candidate_relations_to_delete(model._meta)
+    )
+
+
+def _delete_queryset(queryset, using, batch_size):
+    if queryset.query.is_sliced:
+        raise TypeError("Cannot use 'limit' or 'offset' with delete().")
+    counter = Counter()
+    if not _has_cascades(queryset.model):
+        # a single DELETE.
+        counter[queryset.model._meta.label] = queryset._raw_delete(using)
+        return _deleted(counter)
+    pks = queryset.using(using).order_by().values_list("pk", flat=True)
+    with transaction.atomic(using=using, savepoint=False):
+        # each batch is deleted before the next one is fetched.
+        while batch := list(pks[:batch_size]):
+            _collect_deleted(counter, queryset.model, batch, using, batch_size)
+    return _deleted(counter)
+
+
+def _delete_pks(model, pks, using, batch_size):
+    counter = Counter()
+    with transaction.atomic(using=using, savepoint=False):
+        _collect_deleted(counter, model, pks, using, batch_size)
+    return _deleted(counter)
+
+
+def _collect_deleted(counter, model, pks, using, batch_size):
+    """Delete the objects of model with the given pks and their cascades."""
+    for related in get_candidate_relations_to_delete(model._meta):
+        field = related.field
+        on_delete = field.remote_field.on_delete
+        related_model = related.related_model
+        children = related_model._base_manager.using(using).filter(
+            **{"%s__pk__in" % field.name: pks}
+        )
+        if on_delete is CASCADE:
+            if _has_cascades(related_model):
+                child_pks = children.order_by().values_list("pk", flat=True)
+                while batch := list(child_pks[:batch_size]):
+                    _collect_deleted(counter, related_model, batch, using, batch_size)
+            else:
+                counter[related_model._meta.label] += children._raw_delete(using)
+        elif on_delete is SET_NULL:
+            children.update(**{field.name: None})
+        elif on_delete is SET_DEFAULT:
+            children.update(**{field.name: field.get_default()})
+    counter[model._meta.label] += (
+        model._base_manager.using(using).filter(pk__in=pks)._raw_delete(using)
+    )
+
+
+def _deleted(counter):
+    counter = {label: count for label, count in counter.items() if count}
+    return sum(counter.values()), counter
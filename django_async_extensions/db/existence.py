@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+
+from django.core.exceptions import ValidationError
+from django.db.models import signals
+
+from django_async_extensions.utils.tasks import create_background_task
+
+logger = logging.getLogger("django_async_extensions.existence")
+
+
+class BloomFilter:
+    """
+    A set of values answering "maybe present" or "definitely absent", using
+    a fixed amount of memory sized for `capacity` values with a false
+    positive rate of about `error_rate`.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.size / 8))
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(str(value).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class ExistenceIndex:
+    """
+    An in-memory Bloom filter of the values of a field (the primary key by
+    default) of every row of model, so lookups of values that definitely
+    don't exist can be answered without a query.
+
+    The index is built with a streaming scan of the table, by abuild() or in
+    the background on first use, kept up to date with post_save and rebuilt
+    every `rebuild_interval` seconds (which also forgets deleted rows).
+    """
+
+    def __init__(
+        self,
+        model,
+        field="pk",
+        capacity=100_000,
+        error_rate=0.01,
+        rebuild_interval=300,
+        using=None,
+        chunk_size=2000,
+    ):
+        self.model = model
+        self.field = model._meta.pk if field == "pk" else model._meta.get_field(field)
+        self.lookup = field
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.using = using
+        self.chunk_size = chunk_size
+        self._filter = None
+        self._started_at = None
+        self._pending = None
+        self._task = None
+        signals.post_save.connect(self._saved, sender=model)
+
+    def _saved(self, sender, instance, **kwargs):
+        self.add(getattr(instance, self.field.attname))
+
+    def add(self, value):
+        """
+        Add a value to the index, e.g: after writing a row with a method that
+        doesn't send post_save, like bulk_create() or update().
+        """
+        value = self.field.to_python(value)
+        if self._filter is not None:
+            self._filter.add(value)
+        if self._pending is not None:
+            self._pending.append(value)
+
+    async def abuild(self):
+        """Scan the table and replace the index with a new one."""
+        queryset = self.model._base_manager.db_manager(self.using).all()
+        # a failed build is retried after rebuild_interval too.
+        self._started_at = time.monotonic()
+        self._pending = []
+        try:
+            count = await queryset.acount()
+            bloom = BloomFilter(
+                max(self.capacity, math.ceil(count * 1.25)), self.error_rate
+            )
+            async for value in queryset.values_list(
+                self.field.attname, flat=True
+            ).aiterator(chunk_size=self.chunk_size):
+                bloom.add(value)
+            # rows saved during the scan.
+            for value in self._pending:
+                bloom.add(value)
+        finally:
+            self._pending = None
+        self._filter = bloom
+
+    def might_contain(self, value):
+        """
+        Return False if no row has value, True if one may have it or the
+        index isn't built yet. Start building it in the background when it's
+        missing or older than rebuild_interval.
+        """
+        if self._started_at is None or (
+            time.monotonic() - self._started_at > self.rebuild_interval
+        ):
+            self._start_build()
+        if self._filter is None:
+            return True
+        try:
+            value = self.field.to_python(value)
+        except ValidationError:
+            # a lookup with this value can't match a row.
+            return False
+        return value in self._filter
+
+    def _start_build(self):
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = create_background_task(loop, self.abuild())
+        self._task.add_done_callback(_log_build_error)
+
+
+def _log_build_error(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Building an existence index failed.", exc_info=task.exception())
@@ -0,0 +1,190 @@
+from asgiref.sync import sync_to_async
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.paginator import Page
+from django.db.models import QuerySet
+from django.db.models.query import ModelIterable
+from django.template import TemplateDoesNotExist
+from django.template.loader import select_template
+
+from django_async_extensions.db.relations import (
+    _get_relation,
+    get_page_item_paths,
+    get_relation_lookup,
+)
+from django_async_extensions.utils.templates import ITERATED, get_variable_paths
+
+# the root of the context variables holding pages of the objects, see
+# aplan_view_queryset().
+PAGE = "page"
+
+# the plans of each view, template and model.
+_plans = {}
+# the views may use a paginator making Pages, which templates can iterate.
+_page = Page((), 1, None)
+
+
+class QueryPlan:
+    """
+    The fields and relations to load for a model: `only` is the fields
+    passed to only(), None to load every field, `select_related` and
+    `prefetch_related` the relations passed to those methods.
+    """
+
+    def __init__(self, only=None, select_related=(), prefetch_related=()):
+        self.only = only
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
+
+    def __repr__(self):
+        return "<%s: only=%r select_related=%r prefetch_related=%r>" % (
+            self.__class__.__name__,
+            self.only,
+            self.select_related,
+            self.prefetch_related,
+        )
+
+    def apply(self, queryset):
+        """
+        Return queryset loading the planned fields and relations. Fields or
+        relations the queryset already chose are left as they are.
+        """
+        if queryset._iterable_class is not ModelIterable:
+            return queryset
+        query = queryset.query
+        if self.select_related and query.select_related is not True:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only is not None and query.deferred_loading == (frozenset(), True):
+            queryset = queryset.only(*self.only)
+        return queryset
+
+
+def _get_field(model, name):
+    opts = model._meta
+    if name == "pk":
+        return opts.pk
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    # get_field() finds foreign keys by their attname too.
+    if field.concrete and name in (field.name, field.attname):
+        return field
+    return None
+
+
+def get_query_plan(model, paths):
+    """
+    Return the QueryPlan loading what paths (sequences of attribute names, see
+    get_variable_paths()) use on instances of model: the fields they read,
+    foreign keys and one-to-one fields with select_related() and other
+    relations with prefetch_related(). Every field is loaded if the paths use
+    an instance directly (e.g: `{{ object }}`) or attributes which aren't
+    fields (e.g: methods).
+    """
+    only = set()
+    select_related = set()
+    prefetch_related = set()
+    load_all = False
+
+    def use_instance(model, prefix):
+        nonlocal load_all
+        if prefix:
+            only.update(
+                "__".join(prefix + [field.name])
+                for field in model._meta.concrete_fields
+            )
+        else:
+            load_all = True
+
+    for path in paths:
+        current = model
+        prefix = []
+        for i, name in enumerate(path):
+            if name == ITERATED:
+                break
+            relation = _get_relation(current, name)
+            if relation is None:
+                field = _get_field(current, name)
+                if field is None:
+                    # e.g: a method, which may use any field.
+                    use_instance(current, prefix)
+                else:
+                    only.add("__".join(prefix + [field.name]))
+                break
+            if relation.related_model is None:
+                # a generic foreign key, its model depends on the row.
+                only.add("__".join(prefix + [relation.ct_field]))
+                only.add("__".join(prefix + [relation.fk_field]))
+                prefetch_related.add("__".join(prefix + [name]))
+                break
+            if relation.concrete and (relation.many_to_one or relation.one_to_one):
+                only.add("__".join(prefix + [name]))
+                prefix.append(name)
+                select_related.add("__".join(prefix))
+                current = relation.related_model
+                continue
+            lookup = get_relation_lookup(current, path[i:])
+            if lookup is not None:
+                prefetch_related.add("__".join(prefix + [lookup]))
+            break
+        else:
+            # e.g: {{ object }} or {{ object.parent }}.
+            use_instance(current, prefix)
+    return QueryPlan(
+        only=None if load_all else sorted(only),
+        select_related=sorted(select_related),
+        prefetch_related=sorted(prefetch_related),
+    )
+
+
+async def aplan_view_queryset(view, queryset, roots, only_fields=True):
+    """
+    Return queryset with the QueryPlan of the template of view applied.
+    `roots` maps the context variables holding the objects of queryset to
+    the path leading to them, e.g: {"object": (), "object_list": ()}, or to
+    PAGE for pages of them, e.g: {"page_obj": PAGE}, see get_page_item_paths().
+    With only_fields=False every field is loaded, only the relations of the
+    plan are.
+
+    The plan is made once for each view class, template and model.
+    """
+    if not isinstance(queryset, QuerySet) or not hasattr(view, "get_template_names"):
+        return queryset
+    try:
+        template_names = tuple(view.get_template_names())
+    except ImproperlyConfigured:
+        return queryset
+    key = (
+        view.__class__,
+        template_names,
+        view.template_engine,
+        queryset.model,
+        tuple(sorted(roots.items())),
+    )
+    try:
+        plan = _plans[key]
+    except KeyError:
+        try:
+            template = await sync_to_async(select_template)(
+                template_names, using=view.template_engine
+            )
+        except TemplateDoesNotExist:
+            # raised again when rendering.
+            return queryset
+        variable_paths = get_variable_paths(template)
+        paths = set()
+        for name, root in roots.items():
+            if root == PAGE:
+                # e.g: {% for entry in page_obj %}.
+                paths.update(get_page_item_paths(_page, variable_paths.get(name, ())))
+                continue
+            for path in variable_paths.get(name, ()):
+                if path[: len(root)] == root:
+                    paths.add(path[len(root) :])
+        plan = _plans[key] = get_query_plan(queryset.model, paths)
+    if not only_fields:
+        plan = QueryPlan(None, plan.select_related, plan.prefetch_related)
+    return plan.apply(queryset)
@@ -0,0 +1,147 @@
+from asgiref.sync import sync_to_async
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Page
+from django.db.models import Model, QuerySet, prefetch_related_objects
+from django.db.models.query import ModelIterable
+
+from django_async_extensions.core.paginator import AsyncPage
+from django_async_extensions.utils.templates import get_variable_paths
+
+
+def _get_relation(model, name):
+    opts = model._meta
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        pass
+    else:
+        # get_field() also finds reverse relations by their query name and
+        # foreign keys by their attname.
+        if field.is_relation and not field.auto_created and field.name == name:
+            return field
+    for rel in opts.related_objects:
+        if rel.get_accessor_name() == name:
+            return rel
+    return None
+
+
+def get_relation_lookup(model, path):
+    """
+    Return the prefetch_related() lookup for the relations of model followed
+    by path (a sequence of attribute names), or None. Many-valued relations
+    are followed when they're iterated with `all`, e.g: ("book_set", "all",
+    "publisher", "name") gives "book_set__publisher".
+    """
+    parts = []
+    path = list(path)
+    i = 0
+    while i < len(path) and model is not None:
+        name = path[i]
+        relation = _get_relation(model, name)
+        if relation is None:
+            break
+        if relation.one_to_many or relation.many_to_many:
+            # e.g: {{ author.book_set.count }} doesn't load the books.
+            if path[i + 1 : i + 2] != ["all"]:
+                break
+            i += 1
+        parts.append(name)
+        # None for generic foreign keys, their model depends on the row.
+        model = relation.related_model
+        i += 1
+    return "__".join(parts) or None
+
+
+def get_relation_lookups(model, paths):
+    """Return the sorted lookups of get_relation_lookup() for paths."""
+    lookups = {get_relation_lookup(model, path) for path in paths}
+    lookups.discard(None)
+    return sorted(lookups)
+
+
+def get_page_item_paths(page, paths):
+    """
+    Return the paths, used on page (a Page or an AsyncPage, e.g: `page_obj`),
+    that are used on the objects of the page: the ones through its
+    object_list, and for a Page, which templates can iterate, the ones used on
+    its items, but not its attributes (e.g: `{{ page_obj.number }}`).
+    """
+    item_paths = set()
+    for path in paths:
+        if path[:1] == ("object_list",):
+            item_paths.add(path[1:])
+        elif isinstance(page, Page) and (not path or not hasattr(page, path[0])):
+            item_paths.add(path)
+    return item_paths
+
+
+def _get_model(value):
+    if isinstance(value, Model):
+        return value.__class__
+    if isinstance(value, QuerySet):
+        return value.model
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], Model):
+        return value[0].__class__
+    return None
+
+
+def _is_deferred(obj, lookup):
+    # loading a deferred foreign key would cost a query per object.
+    relation = _get_relation(obj.__class__, lookup.split("__")[0])
+    return getattr(relation, "attname", None) in obj.get_deferred_fields()
+
+
+async def _ainstances(value):
+    if isinstance(value, Model):
+        return [value]
+    if isinstance(value, QuerySet):
+        if value._iterable_class is not ModelIterable:
+            return []
+        # fills the result cache of the queryset the template iterates.
+        return [obj async for obj in value]
+    if isinstance(value, (list, tuple)):
+        return [obj for obj in value if isinstance(obj, Model)]
+    return []
+
+
+async def aprefetch_relations(objs, lookups):
+    """
+    Load the relations of objs (instances of one model) given by lookups in
+    one batch of queries each, like prefetch_related().
+    """
+    if objs and lookups:
+        await sync_to_async(prefetch_related_objects)(list(objs), *lookups)
+
+
+async def aprefetch_template_relations(template, context):
+    """
+    Load the relations template follows on the model instances and querysets
+    of context before rendering it, in one batch of queries each, instead of
+    one query per object while rendering. See get_variable_paths().
+    """
+    # the instances of each model and the lookups they need.
+    batches = {}
+    for name, paths in get_variable_paths(template).items():
+        value = context.get(name)
+        if isinstance(value, (Page, AsyncPage)):
+            # e.g: {% for book in page_obj.object_list %}.
+            paths = get_page_item_paths(value, paths)
+            value = value.object_list
+        model = _get_model(value)
+        lookups = get_relation_lookups(model, paths) if model is not None else []
+        if not lookups:
+            continue
+        for obj in await _ainstances(value):
+            objs, obj_lookups = batches.setdefault(obj.__class__, ({}, set()))
+            objs[id(obj)] = obj
+            obj_lookups.update(
+                lookup for lookup in lookups if not _is_deferred(obj, lookup)
+            )
+
+    def prefetch():
+        for objs, lookups in batches.values():
+            prefetch_related_objects(list(objs.values()), *sorted(lookups))
+
+    if batches:
+        await sync_to_async(prefetch)()
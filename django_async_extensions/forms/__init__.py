@@ -1,4 +1,8 @@
-from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.forms.models import (
+    AsyncInlineFormSet,
+    AsyncModelForm,
+    AsyncModelFormSet,
+)
 
 
-__all__ = ("AsyncModelForm",)
+__all__ = ("AsyncInlineFormSet", "AsyncModelForm", "AsyncModelFormSet")
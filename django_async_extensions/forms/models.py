@@ -1,13 +1,53 @@
+import asyncio
+import copy
+import weakref
 from itertools import chain
 
 from asgiref.sync import sync_to_async
 
-from django.forms.models import ModelForm
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db import router, transaction
+from django.db.models import (
+    DateField,
+    FileField,
+    ManyToManyField,
+    Model,
+    UniqueConstraint,
+    signals,
+)
+from django.db.models.fields.files import FieldFile
+from django.forms.models import (
+    BaseInlineFormSet,
+    BaseModelFormSet,
+    ModelChoiceField,
+    ModelForm,
+    ModelMultipleChoiceField,
+    inlineformset_factory,
+    modelform_factory,
+    modelformset_factory,
+)
 
-from django_async_extensions.forms.utils import AsyncRenderableFormMixin
+from django_async_extensions.db.batching import can_batch_create, can_bulk_save
+from django_async_extensions.forms.utils import (
+    AsyncRenderableFormMixin,
+    _aload_choices,
+)
 
 
 class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
+    # save an existing instance with update_fields limited to the fields that
+    # changed since the form was created, and skip the query if none did.
+    save_only_changed_fields = False
+    # skip the queries checking unique fields and unique constraints, for
+    # when the database is left to handle the conflicts.
+    skip_unique_validation = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._initial_instance_values = (
+            None if self.instance._state.adding else _instance_values(self.instance)
+        )
+
     @classmethod
     async def from_async(cls, *args, **kwargs):
         return await sync_to_async(cls)(*args, **kwargs)
@@ -22,7 +62,26 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
         return self.is_bound and not await self.aerrors
 
     async def afull_clean(self):
-        return await sync_to_async(self.full_clean)()
+        prefetched = await self._aprefetch_model_choices()
+        for name, (instances, objs) in prefetched.items():
+            _use_prefetched_choices(self.fields[name], instances, objs)
+        try:
+            return await sync_to_async(self.full_clean)()
+        finally:
+            for name in prefetched:
+                _forget_prefetched_choices(self.fields[name])
+
+    async def _aprefetch_model_choices(self):
+        """
+        Fetch the objects submitted to the model choice fields of this form
+        concurrently, with one query per queryset.
+
+        Return a dict mapping field names to the fetched objects, both as a
+        dict keyed by the string value of the submitted key and as a list in
+        the order of the queryset.
+        """
+        prefetched = await _aprefetch_model_choices([self])
+        return {name: objs for (_, name), objs in prefetched.items()}
 
     async def _asave_m2m(self):
         """
@@ -35,6 +94,7 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
         # Note that for historical reasons we want to include also
         # private_fields here. (GenericRelation was previously a fake
         # m2m field).
+        pending = []
         for f in chain(opts.many_to_many, opts.private_fields):
             if not hasattr(f, "save_form_data"):
                 continue
@@ -43,11 +103,81 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
             if exclude and f.name in exclude:
                 continue
             if f.name in cleaned_data:
-                # TODO: when an async version of save_form_data is available,
-                #  replace this to await that instead.
-                await sync_to_async(f.save_form_data)(
-                    self.instance, cleaned_data[f.name]
-                )
+                pending.append(f)
+        if not pending:
+            return
+
+        def save_m2m():
+            for f in pending:
+                if _can_diff_m2m(f):
+                    _set_m2m_diff(self.instance, f, cleaned_data[f.name])
+                else:
+                    # custom fields, custom through models and fields with
+                    # m2m_changed receivers need django's own set() behaviour.
+                    f.save_form_data(self.instance, cleaned_data[f.name])
+
+        # the transactions of the writes need one thread, save every field in
+        # one trip to it.
+        await sync_to_async(save_m2m)()
+
+    def _post_clean(self):
+        if not self.skip_unique_validation:
+            return super()._post_clean()
+        instance = self.instance
+        instance.validate_constraints = lambda exclude=None: (
+            _validate_non_unique_constraints(instance, exclude)
+        )
+        try:
+            super()._post_clean()
+        finally:
+            del instance.validate_constraints
+
+    def validate_unique(self):
+        if not self.skip_unique_validation:
+            super().validate_unique()
+
+    def get_changed_model_fields(self):
+        """
+        Return the names of the instance's concrete fields whose value changed
+        since the form was created, or None if the instance is being added.
+        """
+        if self._initial_instance_values is None or self.instance._state.adding:
+            return None
+        initial = self._initial_instance_values
+        changed = []
+        for field in self.instance._meta.concrete_fields:
+            if field.attname not in initial:
+                continue
+            value = self.instance.__dict__.get(field.attname)
+            if isinstance(field, FileField):
+                if isinstance(value, FieldFile) and value._committed:
+                    value = value.name
+                elif not (value is None or isinstance(value, str)):
+                    # a new file was assigned.
+                    changed.append(field.name)
+                    continue
+            if value != initial[field.attname]:
+                changed.append(field.name)
+        return changed
+
+    def _get_update_fields(self):
+        """
+        Return the update_fields to save the instance with, None to save every
+        field.
+        """
+        if not self.save_only_changed_fields:
+            return None
+        changed = self.get_changed_model_fields()
+        if changed:
+            # fields updated by pre_save() only get written if listed.
+            changed.extend(
+                field.name
+                for field in self.instance._meta.concrete_fields
+                if isinstance(field, DateField)
+                and field.auto_now
+                and field.name not in changed
+            )
+        return changed
 
     async def asave(self, commit=True):
         """
@@ -55,8 +185,7 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
         a save_m2m() method to the form which can be called after the instance
         is saved manually at a later time. Return the model instance.
         """
-        await sync_to_async(self.full_clean)()
-        if self.errors:
+        if await self.aerrors:
             raise ValueError(
                 "The %s could not be %s because the data didn't validate."
                 % (
@@ -66,7 +195,12 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
             )
         if commit:
             # If committing, save the instance and the m2m data immediately.
-            await self.instance.asave()
+            update_fields = self._get_update_fields()
+            if update_fields is None:
+                await self.instance.asave()
+            elif update_fields:
+                await self.instance.asave(update_fields=update_fields)
+                self._initial_instance_values = _instance_values(self.instance)
             await self._asave_m2m()
         else:
             # If not committing, add a method to the form to allow deferred
@@ -75,3 +209,483 @@ class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
         return self.instance
 
     asave.alters_data = True
+
+
+class AsyncModelFormSet(AsyncRenderableFormMixin, BaseModelFormSet):
+    """
+    A model formset validated and saved with the async ORM: new objects are
+    inserted with abulk_create(), changed objects are updated with
+    abulk_update() limited to the changed fields, and deleted objects are
+    removed with one filtered adelete().
+    """
+
+    # the number of objects written per query by abulk_create() and
+    # abulk_update(), None for as many as the database allows.
+    batch_size = None
+
+    async def aload_queryset(self):
+        """
+        Evaluate the queryset of the formset, so building the forms doesn't
+        query the database.
+        """
+        queryset = self.get_queryset()
+        await sync_to_async(len)(queryset)
+        return queryset
+
+    async def aload_choices(self):
+        await self.aload_queryset()
+        await _aload_choices(
+            chain.from_iterable(form.fields.values() for form in self.forms),
+            self.choices_cache_timeout,
+        )
+
+    @property
+    async def aerrors(self):
+        if self._errors is None:
+            await self.afull_clean()
+        return self._errors
+
+    async def ais_valid(self):
+        if not self.is_bound:
+            return False
+        await self.aerrors
+        # every form is cleaned by now, this doesn't query the database.
+        return self.is_valid()
+
+    async def afull_clean(self):
+        await self.aload_queryset()
+        forms = self.forms
+        # the submitted objects of every form are fetched together.
+        prefetched = await _aprefetch_model_choices(forms)
+        for (form, name), (instances, objs) in prefetched.items():
+            _use_prefetched_choices(form.fields[name], instances, objs)
+        try:
+            return await sync_to_async(self.full_clean)()
+        finally:
+            for form, name in prefetched:
+                _forget_prefetched_choices(form.fields[name])
+
+    async def asave(self, commit=True):
+        """
+        Save model instances for every form, adding and changing instances
+        as necessary, and return the list of instances.
+        """
+        await self.aerrors
+        # let save() prepare the instances (and call save_new(),
+        # save_existing() and delete_existing()) without writing them.
+        instances = self.save(commit=False)
+        if not commit:
+
+            async def asave_m2m():
+                await asyncio.gather(*(_asave_m2m(form) for form in self.saved_forms))
+
+            self.asave_m2m = asave_m2m
+            return instances
+        del self.save_m2m
+
+        using = router.db_for_write(self.model)
+        await self._adelete_objects(self.deleted_objects, using)
+        changed_forms = []
+        new_forms = []
+        for form in self.saved_forms:
+            if form.instance._state.adding:
+                new_forms.append(form)
+            else:
+                changed_forms.append(form)
+        await self._aupdate_objects(changed_forms, using)
+        await self._acreate_objects(new_forms, using)
+        await asyncio.gather(*(_asave_m2m(form) for form in self.saved_forms))
+        return instances
+
+    asave.alters_data = True
+
+    async def _adelete_objects(self, objs, using):
+        if not objs:
+            return
+        model = self.model
+        if model.delete is not Model.delete or model.adelete is not Model.adelete:
+            for obj in objs:
+                await obj.adelete()
+            return
+        await (
+            model._default_manager.db_manager(using)
+            .filter(pk__in=[obj.pk for obj in objs])
+            .adelete()
+        )
+        for obj in objs:
+            setattr(obj, model._meta.pk.attname, None)
+
+    async def _aupdate_objects(self, forms, using):
+        if not can_bulk_save(self.model):
+            for form in forms:
+                await form.instance.asave()
+            return
+        opts = self.model._meta
+        groups = {}
+        for form in forms:
+            obj = form.instance
+            if hasattr(form, "get_changed_model_fields"):
+                fields = form.get_changed_model_fields()
+            else:
+                fields = [f.name for f in opts.concrete_fields if not f.primary_key]
+            if not fields:
+                continue
+            if opts.pk.name in fields:
+                # a changed primary key makes save() insert a new row.
+                await obj.asave()
+                continue
+            for field in opts.concrete_fields:
+                if isinstance(field, DateField) and field.auto_now:
+                    # bulk_update() doesn't call pre_save().
+                    field.pre_save(obj, add=False)
+                    if field.name not in fields:
+                        fields.append(field.name)
+            groups.setdefault(tuple(sorted(fields)), []).append(form)
+        manager = self.model._default_manager.db_manager(using)
+        for fields, group in groups.items():
+            await manager.abulk_update(
+                [form.instance for form in group], fields, batch_size=self.batch_size
+            )
+            for form in group:
+                if hasattr(form, "_initial_instance_values"):
+                    form._initial_instance_values = _instance_values(form.instance)
+
+    async def _acreate_objects(self, forms, using):
+        objs = [form.instance for form in forms]
+        if not objs:
+            return
+        if not all(can_batch_create(obj, using) for obj in objs):
+            for obj in objs:
+                await obj.asave()
+            return
+        await self.model._default_manager.db_manager(using).abulk_create(
+            objs, batch_size=self.batch_size
+        )
+
+
+class AsyncInlineFormSet(AsyncModelFormSet, BaseInlineFormSet):
+    """
+    An inline formset validated and saved with the async ORM, see
+    AsyncModelFormSet.
+    """
+
+
+def async_modelformset_factory(
+    model, form=AsyncModelForm, formset=AsyncModelFormSet, **kwargs
+):
+    """
+    Return an AsyncModelFormSet for the given model, takes the same arguments
+    as django's modelformset_factory().
+    """
+    return modelformset_factory(model, form=form, formset=formset, **kwargs)
+
+
+def async_inlineformset_factory(
+    parent_model, model, form=AsyncModelForm, formset=AsyncInlineFormSet, **kwargs
+):
+    """
+    Return an AsyncInlineFormSet for the given models, takes the same
+    arguments as django's inlineformset_factory().
+    """
+    return inlineformset_factory(
+        parent_model, model, form=form, formset=formset, **kwargs
+    )
+
+
+# the models with cached form classes. The classes are stored on their model,
+# the form classes referencing the model only form a reference cycle, so
+# they're garbage collected with it (e.g. models defined in isolated test
+# apps), which a mapping from the model to its form classes would prevent.
+_CACHE_ATTR = "_async_modelform_classes"
+_modelform_cache = weakref.WeakSet()
+
+
+def cached_modelform_factory(model, form=AsyncModelForm, fields=None, widgets=None):
+    """
+    Like django's modelform_factory(), but return the same class for the same
+    arguments instead of building a new one on every call.
+    """
+    try:
+        key = (
+            form,
+            fields if isinstance(fields, str) or fields is None else tuple(fields),
+            None if widgets is None else tuple(sorted(widgets.items())),
+        )
+        hash(key)
+    except TypeError:
+        # unhashable arguments, don't cache.
+        return modelform_factory(model, form=form, fields=fields, widgets=widgets)
+
+    form_classes = model.__dict__.get(_CACHE_ATTR)
+    if form_classes is None:
+        form_classes = {}
+        setattr(model, _CACHE_ATTR, form_classes)
+        _modelform_cache.add(model)
+    try:
+        return form_classes[key]
+    except KeyError:
+        form_class = modelform_factory(model, form=form, fields=fields, widgets=widgets)
+        form_classes[key] = form_class
+        return form_class
+
+
+def clear_modelform_cache():
+    """Forget every form class built by cached_modelform_factory()."""
+    for model in list(_modelform_cache):
+        model.__dict__.get(_CACHE_ATTR, {}).clear()
+    _modelform_cache.clear()
+
+
+def _validate_non_unique_constraints(instance, exclude=None):
+    """Like Model.validate_constraints(), but skip the unique constraints."""
+    using = router.db_for_write(instance.__class__, instance=instance)
+    errors = {}
+    for model_class, model_constraints in instance.get_constraints():
+        for constraint in model_constraints:
+            if isinstance(constraint, UniqueConstraint):
+                continue
+            try:
+                constraint.validate(model_class, instance, exclude=exclude, using=using)
+            except ValidationError as e:
+                errors = e.update_error_dict(errors)
+    if errors:
+        raise ValidationError(errors)
+
+
+def _instance_values(instance):
+    """
+    Return a copy of the loaded concrete field values of a model instance,
+    keyed by attname. Deferred fields are left out.
+    """
+    values = {}
+    for field in instance._meta.concrete_fields:
+        if field.primary_key or field.attname not in instance.__dict__:
+            continue
+        value = instance.__dict__[field.attname]
+        if isinstance(field, FileField):
+            value = getattr(value, "name", value)
+        values[field.attname] = value
+    return copy.deepcopy(values)
+
+
+async def _aprefetch_model_choices(forms):
+    """
+    Fetch the objects submitted to the model choice fields of the given forms
+    concurrently, with one query per queryset shared by all the forms.
+
+    Return a dict mapping (form, field name) pairs to the fetched objects,
+    both as a dict keyed by the string value of the submitted key and as a
+    list in the order of the queryset.
+    """
+    groups = {}
+    for form in forms:
+        if not form.is_bound:
+            continue
+        for name, field in form.fields.items():
+            if field.disabled or not isinstance(field, ModelChoiceField):
+                continue
+            if field.queryset is None:
+                continue
+            values = _submitted_choice_values(
+                field,
+                field.widget.value_from_datadict(
+                    form.data, form.files, form.add_prefix(name)
+                ),
+            )
+            if not values:
+                continue
+            queryset = field.queryset
+            key = field.to_field_name or "pk"
+            try:
+                group_key = (queryset.model, queryset.db, key, str(queryset.query))
+            except EmptyResultSet:
+                continue
+            group = groups.setdefault(group_key, (queryset, key, set(), []))
+            group[2].update(values)
+            group[3].append((form, name))
+
+    async def fetch(queryset, key, values):
+        return [obj async for obj in queryset.filter(**{"%s__in" % key: values})]
+
+    groups = list(groups.values())
+    results = await asyncio.gather(
+        *(fetch(queryset, key, values) for queryset, key, values, _ in groups)
+    )
+    prefetched = {}
+    for (_, key, _, fields), objs in zip(groups, results):
+        instances = {str(getattr(obj, key)): obj for obj in objs}
+        for form_field in fields:
+            prefetched[form_field] = (instances, objs)
+    return prefetched
+
+
+def _submitted_choice_values(field, value):
+    """
+    Return the submitted values of a model choice field that are worth
+    looking up, values that can't be used in a query are left for the field
+    to report.
+    """
+    if isinstance(field, ModelMultipleChoiceField):
+        if not isinstance(value, (list, tuple)):
+            return set()
+        values = value
+    else:
+        values = [value]
+    key = field.to_field_name or "pk"
+    submitted = set()
+    for value in values:
+        if value in field.empty_values:
+            continue
+        if isinstance(value, field.queryset.model):
+            value = getattr(value, key)
+        try:
+            field.validate_no_null_characters(value)
+            field.queryset.filter(**{key: value})
+            hash(value)
+        except (ValueError, TypeError, ValidationError):
+            continue
+        submitted.add(value)
+    return submitted
+
+
+def _use_prefetched_choices(field, instances, objs):
+    """
+    Make the field resolve the submitted values from the prefetched objects,
+    falling back to a query for anything that wasn't fetched.
+    """
+    key = field.to_field_name or "pk"
+    if isinstance(field, ModelMultipleChoiceField):
+        check_values = field._check_values
+
+        def _check_values(value):
+            try:
+                selected = {str(val) for val in value}
+            except TypeError:
+                return check_values(value)
+            if not selected.issubset(instances):
+                return check_values(value)
+            queryset = field.queryset.filter(**{"%s__in" % key: value})
+            queryset._result_cache = [
+                obj for obj in objs if str(getattr(obj, key)) in selected
+            ]
+            queryset._prefetch_done = True
+            return queryset
+
+        field._check_values = _check_values
+    else:
+        to_python = field.to_python
+
+        def _to_python(value):
+            if value in field.empty_values:
+                return None
+            if isinstance(value, field.queryset.model):
+                value = getattr(value, key)
+            try:
+                return instances[str(value)]
+            except (KeyError, TypeError):
+                return to_python(value)
+
+        field.to_python = _to_python
+
+
+def _forget_prefetched_choices(field):
+    field.__dict__.pop("to_python", None)
+    field.__dict__.pop("_check_values", None)
+
+
+async def aclean_forms(forms):
+    """
+    Clean the given bound forms: the objects submitted to their model choice
+    fields are fetched together, one query per queryset, then the forms are
+    cleaned in one thread.
+    """
+    prefetched = await _aprefetch_model_choices(forms)
+    for (form, name), (instances, objs) in prefetched.items():
+        _use_prefetched_choices(form.fields[name], instances, objs)
+
+    def full_clean():
+        for form in forms:
+            form.full_clean()
+
+    try:
+        await sync_to_async(full_clean)()
+    finally:
+        for form, name in prefetched:
+            _forget_prefetched_choices(form.fields[name])
+
+
+async def _asave_m2m(form):
+    if hasattr(form, "_asave_m2m"):
+        await form._asave_m2m()
+    else:
+        await sync_to_async(form._save_m2m)()
+
+
+def _can_diff_m2m(field):
+    """
+    Return True if the field can be saved by diffing its through table,
+    without going through the related manager.
+    """
+    if not isinstance(field, ManyToManyField):
+        return False
+    if type(field).save_form_data is not ManyToManyField.save_form_data:
+        return False
+    remote_field = field.remote_field
+    through = remote_field.through
+    if not through._meta.auto_created:
+        return False
+    if remote_field.symmetrical and remote_field.model == field.model:
+        return False
+    return not signals.m2m_changed.has_listeners(through)
+
+
+def _set_m2m_diff(instance, field, objs):
+    """
+    Like ``getattr(instance, field.name).set(objs)`` without the related
+    manager and m2m_changed.
+
+    The current rows of the through table are fetched with one query, then
+    only the missing rows are inserted and only the stale rows are deleted,
+    in one transaction.
+    """
+    through = field.remote_field.through
+    source_field = through._meta.get_field(field.m2m_field_name())
+    target_field = through._meta.get_field(field.m2m_reverse_field_name())
+    source_id = source_field.get_foreign_related_value(instance)[0]
+    if source_id is None:
+        raise ValueError(
+            '"%r" needs to have a value for field "%s" before this '
+            "many-to-many relationship can be used."
+            % (instance, source_field.target_field.attname)
+        )
+    target_ids = set()
+    for obj in objs:
+        if isinstance(obj, field.related_model):
+            target_ids.add(target_field.get_foreign_related_value(obj)[0])
+        else:
+            target_ids.add(target_field.get_prep_value(obj))
+
+    db = router.db_for_write(through, instance=instance)
+    # like set(), in one transaction, ignoring rows inserted concurrently.
+    with transaction.atomic(using=db, savepoint=False):
+        rows = through._default_manager.using(db).filter(
+            **{source_field.attname: source_id}
+        )
+        old_ids = set(rows.values_list(target_field.attname, flat=True))
+        stale_ids = old_ids - target_ids
+        if stale_ids:
+            rows.filter(**{"%s__in" % target_field.attname: stale_ids}).delete()
+        missing_ids = target_ids - old_ids
+        if missing_ids:
+            through._default_manager.using(db).bulk_create(
+                [
+                    through(
+                        **{
+                            source_field.attname: source_id,
+                            target_field.attname: target_id,
+                        }
+                    )
+                    for target_id in missing_ids
+                ],
+                ignore_conflicts=True,
+            )
@@ -1,19 +1,122 @@
+import asyncio
+import time
+
 from asgiref.sync import sync_to_async
 
+from django.core.exceptions import EmptyResultSet
+from django.forms.models import ModelChoiceField, ModelChoiceIterator
+from django.forms.widgets import ChoiceWidget
 from django.utils.safestring import mark_safe
 
+# rendered choice lists shared between form instances, see
+# AsyncRenderableFormMixin.choices_cache_timeout.
+_choices_cache = {}
+_CHOICES_CACHE_MAX_ENTRIES = 1000
+
+
+def clear_choices_cache():
+    """Forget every choice list cached by AsyncRenderableFormMixin."""
+    _choices_cache.clear()
+
+
+def _choices_cache_key(field):
+    queryset = field.queryset
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        return None
+    return (
+        type(field),
+        field.to_field_name,
+        field.empty_label,
+        queryset.db,
+        queryset.model._meta.label,
+        query,
+    )
+
+
+async def _aload_field_choices(field, timeout):
+    key = None
+    if timeout:
+        key = _choices_cache_key(field)
+        cached = _choices_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            field.widget.choices = cached[1]
+            return
+
+    objs = [obj async for obj in field.queryset.all()]
+    iterator = field.iterator(field)
+    choices = []
+    if field.empty_label is not None:
+        choices.append(("", field.empty_label))
+    # labels may follow relations or run queries, build them off the loop.
+    choices.extend(
+        await sync_to_async(lambda: [iterator.choice(obj) for obj in objs])()
+    )
+    field.widget.choices = choices
+
+    if key is not None:
+        if len(_choices_cache) >= _CHOICES_CACHE_MAX_ENTRIES:
+            _choices_cache.pop(next(iter(_choices_cache)))
+        _choices_cache[key] = (time.monotonic() + timeout, choices)
+
+
+def _needs_choices(field):
+    return (
+        isinstance(field, ModelChoiceField)
+        and field.queryset is not None
+        and not hasattr(field, "_choices")
+        and isinstance(field.widget, ChoiceWidget)
+        and field.iterator.__iter__ is ModelChoiceIterator.__iter__
+    )
+
+
+async def _aload_choices(fields, timeout):
+    """
+    Load the choices of the model choice fields concurrently, fields with the
+    same queryset (e.g: the same field of the forms of a formset) share one
+    query.
+    """
+    groups = {}
+    for field in fields:
+        if _needs_choices(field):
+            groups.setdefault(_choices_cache_key(field) or field, []).append(field)
+
+    async def load(field, *others):
+        await _aload_field_choices(field, timeout)
+        for other in others:
+            other.widget.choices = field.widget.choices
+
+    await asyncio.gather(*(load(*group) for group in groups.values()))
+
 
 class AsyncRenderableMixin:
     async def arender(self, template_name=None, context=None, renderer=None):
         renderer = renderer or self.renderer
         template = template_name or self.template_name
-        context = context or self.get_context()
         return mark_safe(  # noqa:S308
-            await sync_to_async(renderer.render)(template, context)
+            await sync_to_async(
+                lambda: renderer.render(template, context or self.get_context())
+            )()
         )
 
 
 class AsyncRenderableFormMixin(AsyncRenderableMixin):
+    # number of seconds the choices of model choice fields are cached for,
+    # None disables the cache.
+    choices_cache_timeout = None
+
+    async def aload_choices(self):
+        """
+        Evaluate the querysets of the model choice fields concurrently, so
+        rendering the form doesn't run a query per field.
+        """
+        await _aload_choices(self.fields.values(), self.choices_cache_timeout)
+
+    async def arender(self, template_name=None, context=None, renderer=None):
+        await self.aload_choices()
+        return await super().arender(template_name, context, renderer)
+
     async def aas_p(self):
         """Render as <p> elements."""
         return await self.arender(self.template_name_p)
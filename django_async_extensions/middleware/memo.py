@@ -0,0 +1,13 @@
+from django_async_extensions.middleware.base import AsyncMiddlewareMixin
+from django_async_extensions.utils.memo import request_memo
+
+
+class RequestMemoMiddleware(AsyncMiddlewareMixin):
+    """
+    Memoize lookups (e.g: get_object() of the generic views) for the lifetime
+    of each request, see django_async_extensions.utils.memo.
+    """
+
+    async def __call__(self, request):
+        with request_memo():
+            return await super().__call__(request)
@@ -0,0 +1,126 @@
+import asyncio
+import contextvars
+from contextlib import contextmanager
+
+from django.core.exceptions import EmptyResultSet, SynchronousOnlyOperation
+from django.db.models import Model
+
+_request_memo = contextvars.ContextVar("request_memo", default=None)
+
+
+class RequestMemo:
+    """
+    Values memoized for the lifetime of one request, and an identity map
+    keeping one instance per database row.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._instances = {}
+
+    async def aget_or_set(self, key, func, *args, **kwargs):
+        """
+        Return the value memoized under key, or await func(*args, **kwargs)
+        and memoize its result. Concurrent calls for the same key share one
+        call, errors aren't memoized.
+        """
+        try:
+            future = self._values[key]
+        except KeyError:
+            pass
+        else:
+            return await asyncio.shield(future)
+        future = self._values[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await func(*args, **kwargs)
+        except BaseException as e:
+            del self._values[key]
+            if not isinstance(e, asyncio.CancelledError):
+                future.set_exception(e)
+                # retrieved by the concurrent callers, if any.
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        future.set_result(value)
+        return value
+
+    def add_instance(self, obj):
+        """
+        Return the instance already mapped to the row of obj, or map obj to
+        its row and return it.
+        """
+        mapped = self._instances.setdefault(_row_key(obj), obj)
+        if mapped is not obj and mapped.get_deferred_fields() != (
+            obj.get_deferred_fields()
+        ):
+            # different fields were loaded.
+            return obj
+        return mapped
+
+    def discard_row(self, model, using, pk):
+        """Forget the instance and the memoized values for a row."""
+        key = (model._meta.concrete_model, using, pk)
+        self._instances.pop(key, None)
+        for value_key, future in list(self._values.items()):
+            if (
+                future.done()
+                and not future.cancelled()
+                and future.exception() is None
+                and isinstance(future.result(), Model)
+                and _row_key(future.result()) == key
+            ):
+                del self._values[value_key]
+
+    def clear(self):
+        self._values.clear()
+        self._instances.clear()
+
+
+def _row_key(obj):
+    return (obj._meta.concrete_model, obj._state.db, obj.pk)
+
+
+def get_request_memo():
+    """Return the memo of the current request, None outside of request_memo()."""
+    return _request_memo.get()
+
+
+@contextmanager
+def request_memo():
+    """Memoize lookups in a new RequestMemo while the block runs."""
+    memo = RequestMemo()
+    token = _request_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _request_memo.reset(token)
+
+
+async def amemoize(key, func, *args, **kwargs):
+    """
+    Return the result of func(*args, **kwargs), memoized under key for the
+    current request.
+    """
+    memo = _request_memo.get()
+    if memo is None:
+        return await func(*args, **kwargs)
+    return await memo.aget_or_set(key, func, *args, **kwargs)
+
+
+async def aget_memoized(queryset):
+    """
+    Return queryset.aget(), memoized for the current request by the SQL of the
+    query, through the identity map of the request.
+    """
+    memo = _request_memo.get()
+    if memo is None or queryset.query.select_for_update:
+        return await queryset.aget()
+    try:
+        sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+        key = ("aget", queryset.db, sql, tuple(params))
+        hash(key)
+    except (EmptyResultSet, SynchronousOnlyOperation, TypeError):
+        return await queryset.aget()
+    obj = await memo.aget_or_set(key, queryset.aget)
+    return memo.add_instance(obj)
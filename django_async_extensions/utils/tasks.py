@@ -0,0 +1,154 @@
+import asyncio
+import contextvars
+import functools
+import logging
+
+from asgiref.sync import async_to_sync
+from django.db import transaction
+
+logger = logging.getLogger("django_async_extensions.tasks")
+
+
+def create_background_task(loop, coro):
+    """
+    Schedule coro on loop in an empty context, a task outliving the code
+    starting it shouldn't keep that code's context variables (e.g: the
+    request memo, asgiref's thread sensitive context) alive.
+    """
+    return contextvars.Context().run(loop.create_task, coro)
+
+
+class AsyncTaskQueue:
+    """
+    An in-process, bounded queue of async tasks run by `workers` worker tasks
+    on the event loop, so side effects (e.g: webhooks, search index updates)
+    don't add latency to the requests triggering them.
+
+    A failing task is retried `retries` times, waiting `retry_delay` seconds
+    before the first retry and twice as long before each following one.
+    """
+
+    def __init__(self, workers=4, max_size=1000, retries=0, retry_delay=0.1):
+        self.workers = workers
+        self.max_size = max_size
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._loop = None
+        self._queue = None
+        self._workers = []
+
+    def start(self):
+        """Start the workers on the running event loop, if not started yet."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # the queue and the workers belong to the loop they were created in.
+        self._loop = loop
+        self._queue = asyncio.Queue(self.max_size)
+        self._workers = [
+            create_background_task(loop, self._awork()) for _ in range(self.workers)
+        ]
+
+    def enqueue(self, func, *args, **kwargs):
+        """
+        Queue func(*args, **kwargs). func is a coroutine function, or a
+        coroutine object, which can't be retried.
+
+        This can be called from other threads once the queue is started,
+        without a started queue (e.g: under WSGI, where every request gets its
+        own event loop) the task is run right away in the calling thread.
+        From the event loop raise asyncio.QueueFull if the queue is full, from
+        other threads the task is logged and dropped.
+        """
+        item = (func, args, kwargs)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is None or self._loop.is_closed():
+                async_to_sync(self._arun)(func, args, kwargs)
+            else:
+                self._loop.call_soon_threadsafe(self._put, item)
+        else:
+            self.start()
+            self._queue.put_nowait(item)
+
+    async def aenqueue(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs), waiting for room in the queue."""
+        self.start()
+        await self._queue.put((func, args, kwargs))
+
+    def enqueue_after_commit(self, func, *args, using=None, **kwargs):
+        """
+        Queue func(*args, **kwargs) once the current transaction on the
+        `using` database commits, right away outside of a transaction.
+        """
+        transaction.on_commit(
+            functools.partial(self.enqueue, func, *args, **kwargs),
+            using=using,
+            robust=True,
+        )
+
+    async def adrain(self, timeout=None):
+        """
+        Wait (at most `timeout` seconds) for the queued tasks to finish, then
+        stop the workers. Call it before shutting down.
+        """
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Dropping %d queued tasks after %s seconds.",
+                self._queue.qsize(),
+                timeout,
+            )
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._loop = self._queue = None
+            self._workers = []
+
+    def _put(self, item):
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.error("The task queue is full, dropping %r.", item[0])
+
+    async def _awork(self):
+        while True:
+            func, args, kwargs = await self._queue.get()
+            try:
+                await self._arun(func, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    async def _arun(self, func, args, kwargs):
+        if asyncio.iscoroutine(func):
+            attempts = 1
+        else:
+            attempts = self.retries + 1
+        for attempt in range(attempts):
+            try:
+                if asyncio.iscoroutine(func):
+                    await func
+                else:
+                    await func(*args, **kwargs)
+                return
+            except Exception:
+                if attempt == attempts - 1:
+                    logger.exception("Task %r failed.", func)
+                    return
+            await asyncio.sleep(self.retry_delay * 2**attempt)
+
+
+default_task_queue = AsyncTaskQueue()
+
+
+def enqueue_after_commit(func, *args, using=None, **kwargs):
+    """
+    Queue func(*args, **kwargs) in the default task queue once the current
+    transaction commits.
+    """
+    default_task_queue.enqueue_after_commit(func, *args, using=using, **kwargs)
@@ -0,0 +1,147 @@
+import weakref
+
+from django.template import TemplateDoesNotExist
+from django.template.base import FilterExpression, NodeList, Variable
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+from django.template.smartif import TokenBase
+
+# the last element of the paths of iterated variables, templates can't use
+# attributes starting with an underscore.
+ITERATED = "__iter__"
+
+# the variable paths of each template.
+_template_paths = weakref.WeakKeyDictionary()
+
+
+def get_variable_paths(template):
+    """
+    Return the attribute paths the Django template uses on each variable of
+    its context, as a dict of variable names and sets of tuples, e.g:
+    `{{ object.author.name }}` gives {"object": {("author", "name")}}.
+
+    Loop variables and `{% with %}` aliases are resolved to the variables
+    they come from, so `{% for book in object_list %}{{ book.author }}`
+    gives {"object_list": {(ITERATED,), ("author",)}}. An empty path means
+    the value itself is used (e.g: `{{ book }}`).
+
+    Templates extended or included by a constant name are analysed too.
+    `template` is a template of the Django backend, or a
+    django.template.Template, for other templates return an empty dict.
+    """
+    template = getattr(template, "template", template)
+    if not hasattr(template, "nodelist"):
+        return {}
+    try:
+        return _template_paths[template]
+    except KeyError:
+        pass
+    paths = {}
+    _collect(template.nodelist, {}, paths, template.engine, set(), set())
+    _template_paths[template] = paths
+    return paths
+
+
+def _collect(nodelist, aliases, paths, engine, overridden, seen):
+    for node in nodelist:
+        if isinstance(node, ForNode):
+            sequence = _record(node.sequence, aliases, paths, suffix=(ITERATED,))
+            loop_aliases = dict(aliases)
+            for name in node.loopvars:
+                # the items of the sequence, unpacked items can't be followed.
+                loop_aliases[name] = sequence if len(node.loopvars) == 1 else None
+            _collect(node.nodelist_loop, loop_aliases, paths, engine, overridden, seen)
+            _collect(node.nodelist_empty, aliases, paths, engine, overridden, seen)
+        elif isinstance(node, WithNode):
+            with_aliases = dict(aliases)
+            for name, expression in node.extra_context.items():
+                with_aliases[name] = _record(expression, aliases, paths)
+            _collect(node.nodelist, with_aliases, paths, engine, overridden, seen)
+        elif isinstance(node, IfNode):
+            for condition, branch in node.conditions_nodelists:
+                _record_all(condition, aliases, paths)
+                _collect(branch, aliases, paths, engine, overridden, seen)
+        elif isinstance(node, BlockNode):
+            if node.name not in overridden:
+                _collect(node.nodelist, aliases, paths, engine, overridden, seen)
+        elif isinstance(node, ExtendsNode):
+            _collect(node.nodelist, aliases, paths, engine, overridden, seen)
+            # the blocks of the parent overridden by this template aren't used.
+            blocks = {
+                block.name for block in node.nodelist.get_nodes_by_type(BlockNode)
+            }
+            _collect_template(
+                node.parent_name, aliases, paths, engine, overridden | blocks, seen
+            )
+        elif isinstance(node, IncludeNode):
+            include_aliases = {} if node.isolated_context else dict(aliases)
+            for name, expression in node.extra_context.items():
+                include_aliases[name] = _record(expression, aliases, paths)
+            _collect_template(
+                node.template, include_aliases, paths, engine, set(), seen
+            )
+        else:
+            _record_all(list(node.__dict__.values()), aliases, paths)
+            for attr in node.child_nodelists:
+                child = getattr(node, attr, None)
+                if child is not None:
+                    _collect(child, aliases, paths, engine, overridden, seen)
+
+
+def _record(expression, aliases, paths, suffix=()):
+    """
+    Record the path of the variable of expression (and of its filter
+    arguments), return the full path of the variable, or None.
+    """
+    for _, args in expression.filters:
+        for _, arg in args:
+            _record_variable(arg, aliases, paths)
+    return _record_variable(expression.var, aliases, paths, suffix)
+
+
+def _record_variable(variable, aliases, paths, suffix=()):
+    if not isinstance(variable, Variable) or variable.lookups is None:
+        return None
+    root, *rest = variable.lookups
+    if root in aliases:
+        if aliases[root] is None:
+            return None
+        path = aliases[root] + tuple(rest)
+    else:
+        path = variable.lookups
+    paths.setdefault(path[0], set()).add(tuple(path[1:]) + suffix)
+    return tuple(path)
+
+
+def _record_all(value, aliases, paths):
+    # find the expressions of other tags (e.g: {% url %} arguments).
+    if isinstance(value, NodeList):
+        return
+    if isinstance(value, FilterExpression):
+        _record(value, aliases, paths)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            _record_all(item, aliases, paths)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _record_all(item, aliases, paths)
+    elif isinstance(value, TokenBase):
+        for attr in ("value", "first", "second"):
+            _record_all(getattr(value, attr, None), aliases, paths)
+
+
+def _collect_template(expression, aliases, paths, engine, overridden, seen):
+    # only templates with a constant name can be found before rendering.
+    name = expression.var
+    if expression.filters or not isinstance(name, str) or name in seen:
+        return
+    try:
+        template = engine.get_template(name)
+    except TemplateDoesNotExist:
+        return
+    # the templates being analysed, for recursive includes.
+    seen.add(name)
+    try:
+        _collect(template.nodelist, aliases, paths, engine, overridden, seen)
+    finally:
+        seen.discard(name)
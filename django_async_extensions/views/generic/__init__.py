@@ -3,6 +3,10 @@ from django_async_extensions.views.generic.base import (
     AsyncTemplateView,
     AsyncRedirectView,
 )
+from django_async_extensions.views.generic.bulk import (
+    AsyncBulkDeleteView,
+    AsyncBulkImportView,
+)
 from django_async_extensions.views.generic.dates import (
     AsyncArchiveIndexView,
     AsyncDateDetailView,
@@ -16,6 +20,7 @@ from django_async_extensions.views.generic.detail import AsyncDetailView
 from django_async_extensions.views.generic.edit import (
     AsyncCreateView,
     AsyncDeleteView,
+    AsyncFormSetView,
     AsyncFormView,
     AsyncUpdateView,
 )
@@ -26,6 +31,8 @@ __all__ = [
     "AsyncView",
     "AsyncTemplateView",
     "AsyncRedirectView",
+    "AsyncBulkDeleteView",
+    "AsyncBulkImportView",
     "AsyncArchiveIndexView",
     "AsyncYearArchiveView",
     "AsyncMonthArchiveView",
@@ -37,6 +44,7 @@ __all__ = [
     "AsyncFormView",
     "AsyncCreateView",
     "AsyncDeleteView",
+    "AsyncFormSetView",
     "AsyncListView",
     "AsyncUpdateView",
 ]
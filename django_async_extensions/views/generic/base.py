@@ -4,6 +4,7 @@ from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_asy
 
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpResponse, HttpResponseNotAllowed
+from django.template.loader import select_template
 
 from django.utils.decorators import classonlymethod
 from django.utils.functional import classproperty
@@ -14,6 +15,8 @@ from django.views.generic.base import (
     RedirectView,
 )
 
+from django_async_extensions.db.relations import aprefetch_template_relations
+
 logger = logging.getLogger("django.request")
 
 
@@ -127,6 +130,10 @@ class AsyncView(View):
 
 
 class AsyncTemplateResponseMixin(TemplateResponseMixin):
+    # load the relations the template follows on the objects of the context
+    # before rendering, in one query per relation instead of one per object.
+    prefetch_template_relations = False
+
     async def render_to_response(self, context, **response_kwargs):
         """
         Return a response, using the `response_class` for this view, with a
@@ -135,9 +142,15 @@ class AsyncTemplateResponseMixin(TemplateResponseMixin):
         Pass response_kwargs to the constructor of the response class.
         """
         response_kwargs.setdefault("content_type", self.content_type)
+        template = self.get_template_names()
+        if self.prefetch_template_relations:
+            template = await sync_to_async(select_template)(
+                template, using=self.template_engine
+            )
+            await aprefetch_template_relations(template, context)
         return await sync_to_async(self.response_class)(
             request=self.request,
-            template=self.get_template_names(),
+            template=template,
             context=context,
             using=self.template_engine,
             **response_kwargs,
@@ -0,0 +1,362 @@
+import codecs
+import csv
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import (
+    ImproperlyConfigured,
+    SynchronousOnlyOperation,
+    ValidationError,
+)
+from django.db import router
+from django.db.models import ProtectedError, RestrictedError
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+
+from django_async_extensions.db.batching import can_batch_create
+from django_async_extensions.db.deletion import afast_delete
+from django_async_extensions.forms.models import (
+    AsyncModelForm,
+    _asave_m2m,
+    aclean_forms,
+    cached_modelform_factory,
+)
+from django_async_extensions.views.generic.base import AsyncView
+from django_async_extensions.views.generic.list import AsyncMultipleObjectMixin
+
+JSONL_CONTENT_TYPES = {
+    "application/jsonl",
+    "application/x-jsonlines",
+    "application/x-ndjson",
+    "application/json-seq",
+}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+
+class AsyncBulkImportView(AsyncView):
+    """
+    Import the rows of a JSON Lines or CSV upload, validating each row with a
+    model form and inserting the valid ones in batches.
+
+    The upload is read incrementally, a batch at a time, and a report with the
+    errors of each invalid row is streamed back while the import runs.
+    """
+
+    model = None
+    fields = None
+    form_class = None
+    base_form_class = AsyncModelForm
+    # the number of rows validated and inserted together.
+    batch_size = 500
+    # "jsonl" or "csv", None to tell from the content type or file name.
+    import_format = None
+    # the name of the file in a multipart/form-data upload, other uploads
+    # are read from the request body.
+    file_field_name = "file"
+    encoding = "utf-8"
+    csv_dialect = "excel"
+
+    async def get_form_class(self):
+        """Return the form class used to validate each row."""
+        if self.fields is not None and self.form_class:
+            raise ImproperlyConfigured(
+                "Specifying both 'fields' and 'form_class' is not permitted."
+            )
+        if self.form_class:
+            return self.form_class
+        if self.model is None or self.fields is None:
+            raise ImproperlyConfigured(
+                "%s requires either 'form_class' or both 'model' and 'fields'."
+                % self.__class__.__name__
+            )
+        try:
+            return cached_modelform_factory(
+                self.model, fields=self.fields, form=self.base_form_class
+            )
+        except SynchronousOnlyOperation:
+            return await sync_to_async(cached_modelform_factory)(
+                self.model, fields=self.fields, form=self.base_form_class
+            )
+
+    def get_form_kwargs(self, row):
+        """Return the keyword arguments for instantiating the form of a row."""
+        return {"data": row}
+
+    def get_upload(self):
+        """
+        Return the uploaded file-like object and its content type and name.
+        """
+        request = self.request
+        if request.content_type == "multipart/form-data":
+            upload = request.FILES.get(self.file_field_name)
+            if upload is None:
+                return None, None, None
+            return upload, upload.content_type, upload.name
+        # the request is read as a stream, without loading request.body.
+        return request, request.content_type, None
+
+    def get_import_format(self, content_type, name):
+        """Return the format of the upload, "jsonl" or "csv"."""
+        if self.import_format is not None:
+            return self.import_format
+        if content_type in JSONL_CONTENT_TYPES:
+            return "jsonl"
+        if content_type in CSV_CONTENT_TYPES:
+            return "csv"
+        if name and name.lower().endswith(".csv"):
+            return "csv"
+        if name and name.lower().endswith((".jsonl", ".ndjson")):
+            return "jsonl"
+        return None
+
+    def iter_rows(self, upload, import_format):
+        """
+        Yield (line number, row) for each row of the upload, row is a dict of
+        the row's data or the ValueError raised parsing it.
+        """
+        lines = codecs.iterdecode(upload, self.encoding)
+        if import_format == "csv":
+            reader = csv.DictReader(lines, dialect=self.csv_dialect)
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except (csv.Error, ValueError) as e:
+                    yield reader.line_num, ValueError(str(e))
+                    continue
+                if None in row:
+                    yield reader.line_num, ValueError("Too many values.")
+                else:
+                    yield reader.line_num, row
+        else:
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield number, ValueError(str(e))
+                    continue
+                if isinstance(row, dict):
+                    yield number, row
+                else:
+                    yield number, ValueError("Expected a JSON object.")
+
+    async def post(self, request, *args, **kwargs):
+        upload, content_type, name = self.get_upload()
+        if upload is None:
+            return self.error_response("No file was uploaded.")
+        import_format = self.get_import_format(content_type, name)
+        if import_format not in ("jsonl", "csv"):
+            return self.error_response("Unsupported import format.")
+        form_class = await self.get_form_class()
+        rows = self.iter_rows(upload, import_format)
+        return StreamingHttpResponse(
+            self.aimport_rows(form_class, rows),
+            content_type="application/x-ndjson",
+        )
+
+    def error_response(self, message):
+        """Return a 400 response for an upload that can't be imported."""
+        return _bad_request({"error": message})
+
+    async def aimport_rows(self, form_class, rows):
+        """
+        Validate and insert the rows a batch at a time, yield a report line
+        for each row that couldn't be imported and a summary at the end.
+        """
+        read_batch = sync_to_async(
+            lambda: list(islice(rows, self.batch_size)), thread_sensitive=False
+        )
+        created = failed = 0
+        while batch := await read_batch():
+            errors, forms = await self.avalidate_batch(form_class, batch)
+            save_errors = await self.asave_batch(forms)
+            created += len(forms) - len(save_errors)
+            errors.extend(save_errors)
+            failed += len(errors)
+            for line, error in sorted(errors, key=lambda error: error[0]):
+                yield _report_line({"line": line, "errors": error})
+        yield _report_line({"created": created, "failed": failed})
+
+    async def avalidate_batch(self, form_class, batch):
+        """
+        Validate the rows of a batch, return the errors of the invalid rows and
+        a dict mapping the line number of the valid rows to their form.
+        """
+        errors = []
+        forms = {}
+        for line, row in batch:
+            if isinstance(row, Exception):
+                errors.append((line, _errors(row)))
+            else:
+                forms[line] = form_class(**self.get_form_kwargs(row))
+        await aclean_forms(list(forms.values()))
+        for line, form in list(forms.items()):
+            if form.errors:
+                errors.append((line, form.errors.get_json_data()))
+                del forms[line]
+        return errors, forms
+
+    async def asave_batch(self, forms):
+        """Save the forms of a batch, return the errors of the failed rows."""
+        if not forms:
+            return []
+        objs = [form.instance for form in forms.values()]
+        model = objs[0].__class__
+        using = router.db_for_write(model)
+        # a custom asave() on the form can't be replaced by the bulk insert.
+        if all(
+            getattr(type(form), "asave", None) is AsyncModelForm.asave
+            and can_batch_create(form.instance, using)
+            for form in forms.values()
+        ):
+            try:
+                await model._default_manager.db_manager(using).abulk_create(
+                    objs, batch_size=self.batch_size
+                )
+            except Exception:
+                # find out which rows failed by saving them one by one.
+                return await self._asave_forms(forms)
+            for form in forms.values():
+                await _asave_m2m(form)
+            return []
+        return await self._asave_forms(forms)
+
+    async def _asave_forms(self, forms):
+        errors = []
+        for line, form in forms.items():
+            try:
+                if hasattr(form, "asave"):
+                    await form.asave()
+                else:
+                    await sync_to_async(form.save)()
+            except Exception as e:
+                errors.append((line, _errors(e)))
+        return errors
+
+
+class AsyncBulkDeleteView(AsyncMultipleObjectMixin, AsyncView):
+    """
+    Delete the objects selected by primary key (or every object) among the
+    ones returned by get_queryset(), in batches, streaming the progress.
+    """
+
+    # the number of objects deleted per query (and per transaction).
+    batch_size = 500
+    # delete the batches with afast_delete() instead of adelete().
+    fast_delete = False
+    # the POST parameter with the primary keys of the selected objects.
+    selection_field = "pk"
+    # the POST parameter selecting every object of get_queryset().
+    select_all_field = "all"
+
+    async def post(self, request, *args, **kwargs):
+        queryset = await self.get_queryset()
+        try:
+            selection = self.get_selection(queryset)
+        except ValidationError as e:
+            return _bad_request({"error": e.messages})
+        if selection is None:
+            total = await queryset.acount()
+        else:
+            found = {
+                pk
+                async for pk in queryset.filter(pk__in=selection).values_list(
+                    "pk", flat=True
+                )
+            }
+            missing = [pk for pk in selection if pk not in found]
+            if missing:
+                return _bad_request(
+                    {
+                        "error": "Some of the selected objects don't exist.",
+                        "missing": [str(pk) for pk in missing],
+                    }
+                )
+            total = len(selection)
+        return StreamingHttpResponse(
+            self.adelete_objects(queryset, selection, total),
+            content_type="application/x-ndjson",
+        )
+
+    async def delete(self, request, *args, **kwargs):
+        return await self.post(request, *args, **kwargs)
+
+    def get_selection(self, queryset):
+        """
+        Return the list of selected primary keys, or None if every object is
+        selected. Raise ValidationError for an invalid selection.
+        """
+        request = self.request
+        data = request.POST if request.method == "POST" else request.GET
+        if data.get(self.select_all_field):
+            return None
+        pk_field = queryset.model._meta.pk
+        selection = []
+        for value in data.getlist(self.selection_field):
+            pk = pk_field.to_python(value)
+            if pk not in selection:
+                selection.append(pk)
+        if not selection:
+            raise ValidationError("No objects were selected.")
+        return selection
+
+    async def adelete_objects(self, queryset, selection, total):
+        """
+        Delete the selected objects a batch at a time, yield a line with the
+        progress after each batch and a summary at the end.
+        """
+        label = queryset.model._meta.label
+        deleted = 0
+        counter = {}
+        if selection is None:
+            pks = queryset.order_by().values_list("pk", flat=True)
+            batches = _apk_batches(pks, self.batch_size)
+        else:
+            batches = _alist_batches(selection, self.batch_size)
+        async for batch in batches:
+            try:
+                _, batch_counter = await self.adelete_batch(
+                    queryset.filter(pk__in=batch)
+                )
+            except (ProtectedError, RestrictedError) as e:
+                yield _report_line({"error": e.args[0], "deleted": deleted})
+                return
+            for model_label, count in batch_counter.items():
+                counter[model_label] = counter.get(model_label, 0) + count
+            deleted += batch_counter.get(label, 0)
+            yield _report_line({"deleted": deleted, "total": total})
+        yield _report_line({"deleted": deleted, "total": total, "objects": counter})
+
+    async def adelete_batch(self, queryset):
+        """Delete the objects of a batch, return the same value as adelete()."""
+        if self.fast_delete:
+            return await afast_delete(queryset, batch_size=self.batch_size)
+        return await queryset.order_by().adelete()
+
+
+async def _apk_batches(pks, batch_size):
+    # each batch is deleted before the next one is fetched.
+    while batch := [pk async for pk in pks[:batch_size]]:
+        yield batch
+
+
+async def _alist_batches(pks, batch_size):
+    for start in range(0, len(pks), batch_size):
+        yield pks[start : start + batch_size]
+
+
+def _bad_request(data):
+    return HttpResponseBadRequest(
+        _report_line(data), content_type="application/x-ndjson"
+    )
+
+
+def _report_line(data):
+    return json.dumps(data).encode() + b"\n"
+
+
+def _errors(exception):
+    return {"__all__": [{"message": str(exception), "code": ""}]}
@@ -1,8 +1,13 @@
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import models
 from django.http import Http404
+from django.utils.decorators import classonlymethod
 from django.utils.translation import gettext as _
 
+from django_async_extensions.db.batching import get_object_loader
+from django_async_extensions.db.cache import aget_cached_object, register_cached_model
+from django_async_extensions.db.planner import aplan_view_queryset
+from django_async_extensions.utils.memo import aget_memoized
 from django_async_extensions.views.generic.base import (
     AsyncView,
     AsyncContextMixin,
@@ -22,6 +27,41 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
     slug_url_kwarg = "slug"
     pk_url_kwarg = "pk"
     query_pk_and_slug = False
+    # read the object looked up by pk or slug through the cache, for
+    # object_cache_timeout seconds.
+    object_cache = False
+    object_cache_timeout = 300
+    object_cache_alias = "default"
+    # an ExistenceIndex of the model answering lookups of objects that
+    # definitely don't exist with a 404 without a query.
+    existence_index = None
+    # load the objects looked up by pk or a unique slug field by concurrent
+    # requests together, with one query per batch of up to
+    # batch_lookups_max_size lookups, waiting at most batch_lookups_max_delay
+    # seconds (by default until the next iteration of the event loop).
+    batch_lookups = False
+    batch_lookups_max_size = 100
+    batch_lookups_max_delay = 0
+    # load only the fields and relations the template uses, see
+    # django_async_extensions.db.planner.
+    plan_queries = False
+    # defer the fields the template doesn't use, views reading other fields
+    # outside of the template (e.g: with a model form) turn this off.
+    plan_only_fields = True
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        if initkwargs.get("object_cache", cls.object_cache):
+            # invalidate the cache on writes made before the first lookup.
+            model = initkwargs.get("model", cls.model)
+            queryset = initkwargs.get("queryset", cls.queryset)
+            if model is None and queryset is not None:
+                model = queryset.model
+            if model is not None:
+                register_cached_model(
+                    model, initkwargs.get("object_cache_alias", cls.object_cache_alias)
+                )
+        return super().as_view(**initkwargs)
 
     async def get_object(self, queryset=None):
         """
@@ -34,17 +74,18 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
         # like DateDetailView
         if queryset is None:
             queryset = await self.get_queryset()
+        lookups = {}
 
         # Next, try looking up by primary key.
         pk = self.kwargs.get(self.pk_url_kwarg)
         slug = self.kwargs.get(self.slug_url_kwarg)
         if pk is not None:
-            queryset = queryset.filter(pk=pk)
+            lookups["pk"] = pk
 
         # Next, try looking up by slug.
         if slug is not None and (pk is None or self.query_pk_and_slug):
             slug_field = self.get_slug_field()
-            queryset = queryset.filter(**{slug_field: slug})
+            lookups[slug_field] = slug
 
         # If none of those are defined, it's an error.
         if pk is None and slug is None:
@@ -53,16 +94,67 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
                 "pk or a slug in the URLconf." % self.__class__.__name__
             )
 
+        not_found = Http404(
+            _("No %(verbose_name)s found matching the query")
+            % {"verbose_name": queryset.model._meta.verbose_name}
+        )
+        if self.existence_index is not None and not self.index_might_contain(
+            queryset, lookups
+        ):
+            raise not_found
+
         try:
             # Get the single item from the filtered queryset
-            obj = await queryset.aget()
+            if self.object_cache:
+                obj = await aget_cached_object(
+                    queryset,
+                    lookups,
+                    timeout=self.object_cache_timeout,
+                    cache_alias=self.object_cache_alias,
+                )
+            elif self.batch_lookups and self.can_batch_lookups(queryset, lookups):
+                ((lookup, value),) = lookups.items()
+                loader = get_object_loader(
+                    queryset.model,
+                    lookup,
+                    max_size=self.batch_lookups_max_size,
+                    max_delay=self.batch_lookups_max_delay,
+                )
+                obj = await loader.aload(queryset, value)
+            else:
+                obj = await aget_memoized(queryset.filter(**lookups))
         except queryset.model.DoesNotExist:
-            raise Http404(
-                _("No %(verbose_name)s found matching the query")
-                % {"verbose_name": queryset.model._meta.verbose_name}
-            )
+            raise not_found
         return obj
 
+    def can_batch_lookups(self, queryset, lookups):
+        """Return True if the object can be loaded with others in a batch."""
+        if len(lookups) != 1:
+            return False
+        (lookup,) = lookups
+        if lookup == "pk":
+            return True
+        try:
+            field = queryset.model._meta.get_field(lookup)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and field.unique
+
+    def index_might_contain(self, queryset, lookups):
+        """
+        Return False if existence_index knows no row matches lookups, True if
+        the lookups must be queried.
+        """
+        index = self.existence_index
+        if (
+            index.lookup not in lookups
+            or index.model._meta.concrete_model
+            is not queryset.model._meta.concrete_model
+            or index.using not in (None, queryset.db)
+        ):
+            return True
+        return index.might_contain(lookups[index.lookup])
+
     async def get_queryset(self):
         """
         Return the `QuerySet` that will be used to look up the object.
@@ -74,14 +166,38 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
         # and `await` on an ORM call without needing to rewrite `get_object`
         if self.queryset is None:
             if self.model:
-                return self.model._default_manager.all()
+                queryset = self.model._default_manager.all()
             else:
                 raise ImproperlyConfigured(
                     "%(cls)s is missing a QuerySet. Define "
                     "%(cls)s.model, %(cls)s.queryset, or override "
                     "%(cls)s.get_queryset()." % {"cls": self.__class__.__name__}
                 )
-        return self.queryset.all()
+        else:
+            queryset = self.queryset.all()
+        if self.plan_queries:
+            queryset = await self.plan_queryset(queryset)
+        return queryset
+
+    async def plan_queryset(self, queryset):
+        """
+        Return queryset loading only the fields and relations the template
+        uses on the object.
+        """
+        if getattr(self, "template_name_field", None):
+            # the template depends on the object.
+            return queryset
+        if not hasattr(self, "object"):
+            # the default template name depends on it, the object isn't
+            # looked up yet.
+            self.object = None
+        roots = {
+            "object": (),
+            self.context_object_name or queryset.model._meta.model_name: (),
+        }
+        return await aplan_view_queryset(
+            self, queryset, roots, only_fields=self.plan_only_fields
+        )
 
     def get_slug_field(self):
         """Get the name of a slug field to be used to look up by slug."""
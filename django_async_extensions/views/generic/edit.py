@@ -1,10 +1,38 @@
-from asgiref.sync import sync_to_async
-from django.core.exceptions import ImproperlyConfigured, SynchronousOnlyOperation
-from django.forms import Form
-from django.forms import models as model_forms
-from django.http import HttpResponseRedirect
-
-from django_async_extensions.forms.models import AsyncModelForm
+import datetime
+import functools
+from io import BytesIO
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import (
+    BadRequest,
+    ImproperlyConfigured,
+    SynchronousOnlyOperation,
+)
+from django.db import OperationalError, connections, router, transaction
+from django.db.models import AutoField, DateTimeField
+from django.db.models.sql import InsertQuery
+from django.forms import CheckboxInput, Form
+from django.http import Http404, HttpResponse, HttpResponseRedirect, QueryDict
+from django.http.multipartparser import MultiPartParserError
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.datastructures import MultiValueDict
+from django.utils.http import parse_etags, quote_etag
+
+from django_async_extensions.db.batching import (
+    can_batch_create,
+    get_bulk_create_batcher,
+)
+from django_async_extensions.db.cache import ainvalidate_cached_object
+from django_async_extensions.db.deletion import DEFAULT_BATCH_SIZE, afast_delete
+from django_async_extensions.forms.models import (
+    AsyncModelForm,
+    AsyncModelFormSet,
+    async_modelformset_factory,
+    cached_modelform_factory,
+)
+from django_async_extensions.utils.memo import get_request_memo
+from django_async_extensions.utils.tasks import default_task_queue
 from django_async_extensions.views.generic.base import (
     AsyncView,
     AsyncContextMixin,
@@ -15,15 +43,86 @@ from django_async_extensions.views.generic.detail import (
     AsyncBaseDetailView,
     AsyncSingleObjectTemplateResponseMixin,
 )
+from django_async_extensions.views.signals import object_deleted, object_saved
+
+
+async def _ais_valid(form):
+    """
+    Validate the form with its async interface if it has one, so database
+    backed validation doesn't run synchronously.
+    """
+    if hasattr(form, "ais_valid"):
+        return await form.ais_valid()
+    return form.is_valid()
 
 
-class AsyncFormMixin(AsyncContextMixin):
+class AsyncTaskQueueMixin:
+    """
+    Run side effects (e.g: webhooks, search index updates) in a task queue
+    once the transaction commits and the response is sent.
+    """
+
+    # the AsyncTaskQueue used by enqueue_after_commit(), None for the default.
+    task_queue = None
+    # run the receivers of the object_saved/object_deleted signals in the
+    # task queue after the response is sent.
+    defer_signals = False
+
+    def get_task_queue(self):
+        """Return the task queue used by enqueue_after_commit()."""
+        if self.task_queue is None:
+            return default_task_queue
+        return self.task_queue
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.after_response_tasks = []
+        response = await super().dispatch(request, *args, **kwargs)
+        if self.after_response_tasks:
+            self.get_task_queue().start()
+            # HttpResponse.close() is called once the response is sent.
+            response._resource_closers.append(self._enqueue_after_response)
+        return response
+
+    async def enqueue_after_commit(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) in the task queue once the current
+        transaction commits and the response is sent.
+        """
+        # register on the connection used by the async ORM.
+        await sync_to_async(transaction.on_commit)(
+            functools.partial(self.after_response_tasks.append, (func, args, kwargs))
+        )
+
+    async def send_signal(self, signal, **kwargs):
+        """
+        Send signal with the request and the view, running the async
+        receivers concurrently and logging the errors of the receivers
+        instead of raising them.
+        """
+        kwargs.update(request=self.request, view=self)
+        if self.defer_signals:
+            await self.enqueue_after_commit(signal.asend_robust, **kwargs)
+        else:
+            await signal.asend_robust(**kwargs)
+
+    def _enqueue_after_response(self):
+        queue = self.get_task_queue()
+        for func, args, kwargs in self.after_response_tasks:
+            queue.enqueue(func, *args, **kwargs)
+
+
+class AsyncFormMixin(AsyncTaskQueueMixin, AsyncContextMixin):
     """Provide a way to show and handle a form in a request."""
 
     initial = {}
     form_class = None
     success_url = None
     prefix = None
+    # answer invalid submissions asking for it (with fragment_header or
+    # fragment_param) with only the form's HTML instead of the whole page.
+    form_fragments = False
+    fragment_header = "X-Form-Fragment"
+    fragment_param = "fragment"
 
     def get_initial(self):
         """Return the initial data to use for forms on this view."""
@@ -58,8 +157,32 @@ class AsyncFormMixin(AsyncContextMixin):
                     "files": self.request.FILES,
                 }
             )
+        elif self.request.method == "PATCH":
+            data, files = self.get_patch_data()
+            kwargs.update({"data": data, "files": files})
         return kwargs
 
+    def get_patch_data(self):
+        """
+        Return the data and files sent in the body of a PATCH request, django
+        only parses the body of POST requests.
+        """
+        request = self.request
+        if request.content_type == "multipart/form-data":
+            # parse the stream like POST does, request.body is limited to
+            # DATA_UPLOAD_MAX_MEMORY_SIZE and would reject large uploads.
+            stream = BytesIO(request.body) if hasattr(request, "_body") else request
+            try:
+                return request.parse_file_upload(request.META, stream)
+            except MultiPartParserError as e:
+                raise BadRequest("Malformed multipart body.") from e
+        elif request.content_type == "application/x-www-form-urlencoded":
+            return (
+                QueryDict(request.body, encoding=request.encoding),
+                MultiValueDict(),
+            )
+        return QueryDict(encoding=request.encoding), MultiValueDict()
+
     def get_success_url(self):
         """Return the URL to redirect to after processing a valid form."""
         if not self.success_url:
@@ -72,8 +195,35 @@ class AsyncFormMixin(AsyncContextMixin):
 
     async def form_invalid(self, form):
         """If the form is invalid, render the invalid form."""
+        if self.form_fragments:
+            if self.wants_fragment():
+                response = await self.render_form_fragment(form)
+            else:
+                response = await self.render_to_response(
+                    await self.get_context_data(form=form)
+                )
+            patch_vary_headers(response, [self.fragment_header])
+            return response
         return await self.render_to_response(await self.get_context_data(form=form))
 
+    def wants_fragment(self):
+        """Return True if the request asks for only the form's HTML."""
+        return (
+            self.fragment_header in self.request.headers
+            or self.fragment_param in self.request.GET
+        )
+
+    async def render_form_fragment(self, form):
+        """
+        Return a response with only the form rendered as <div> elements,
+        without building the context of the page.
+        """
+        if hasattr(form, "aas_div"):
+            html = await form.aas_div()
+        else:
+            html = await sync_to_async(form.as_div)()
+        return HttpResponse(html)
+
     async def get_context_data(self, **kwargs):
         """Insert the form into the context dict."""
         if "form" not in kwargs:
@@ -86,6 +236,8 @@ class AsyncModelFormMixin(AsyncFormMixin, AsyncSingleObjectMixin):
 
     base_form_class = AsyncModelForm
     fields = None
+    # the form reads every field of the object on the event loop.
+    plan_only_fields = False
 
     async def get_form_class(self):
         """Return the form class to use in this view."""
@@ -116,11 +268,11 @@ class AsyncModelFormMixin(AsyncFormMixin, AsyncSingleObjectMixin):
                 )
 
             try:
-                return model_forms.modelform_factory(
+                return cached_modelform_factory(
                     model, fields=self.fields, form=self.base_form_class
                 )
             except SynchronousOnlyOperation:
-                return await sync_to_async(model_forms.modelform_factory)(
+                return await sync_to_async(cached_modelform_factory)(
                     model, fields=self.fields, form=self.base_form_class
                 )
 
@@ -147,9 +299,24 @@ class AsyncModelFormMixin(AsyncFormMixin, AsyncSingleObjectMixin):
 
     async def form_valid(self, form):
         """If the form is valid, save the associated model."""
-        self.object = await form.asave()
+        created = form.instance._state.adding
+        self.object = await self.save_form(form)
+        await self.send_object_saved(created)
         return await super().form_valid(form)
 
+    async def save_form(self, form):
+        """Save the form and return the saved object."""
+        return await form.asave()
+
+    async def send_object_saved(self, created):
+        """Send the object_saved signal for self.object."""
+        await self.send_signal(
+            object_saved,
+            sender=type(self.object),
+            instance=self.object,
+            created=created,
+        )
+
 
 class AsyncProcessFormView(AsyncView):
     """Render a form on GET and processes it on POST."""
@@ -164,7 +331,7 @@ class AsyncProcessFormView(AsyncView):
         POST variables and then check if it's valid.
         """
         form = await self.get_form()
-        if form.is_valid():
+        if await _ais_valid(form):
             return await self.form_valid(form)
         else:
             return await self.form_invalid(form)
@@ -183,6 +350,75 @@ class AsyncFormView(AsyncTemplateResponseMixin, AsyncBaseFormView):
     """A view for displaying a form and rendering a template response."""
 
 
+# for each database vendor, the expression telling whether the row written by
+# INSERT ... ON CONFLICT DO UPDATE was inserted: on PostgreSQL the row updated
+# on conflict keeps the lock taken on it in xmax.
+_UPSERT_INSERTED_SQL = {
+    "postgresql": "(%s.xmax = 0)",
+}
+
+
+def _can_upsert_returning_inserted(using):
+    connection = connections[using]
+    return (
+        connection.vendor in _UPSERT_INSERTED_SQL
+        and connection.features.can_return_columns_from_insert
+    )
+
+
+def _upsert_returning_inserted(queryset, obj, unique_fields, update_fields):
+    """
+    Write obj with INSERT ... ON CONFLICT DO UPDATE like bulk_create(), set
+    its primary key to the one of the written row and return True if the row
+    was inserted, False if the conflicting row was updated.
+    """
+    model = queryset.model
+    opts = model._meta
+    unique_fields = [
+        opts.get_field(opts.pk.name if name == "pk" else name) for name in unique_fields
+    ]
+    update_fields = [opts.get_field(name) for name in update_fields]
+    on_conflict = queryset._check_bulk_create_options(
+        False, True, update_fields, unique_fields
+    )
+    queryset._prepare_for_bulk_create([obj])
+    fields = [field for field in opts.concrete_fields if not field.generated]
+    if obj.pk is None:
+        fields = [field for field in fields if not isinstance(field, AutoField)]
+    query = InsertQuery(
+        model,
+        on_conflict=on_conflict,
+        update_fields=update_fields,
+        unique_fields=unique_fields,
+    )
+    query.insert_values(fields, [obj])
+    compiler = query.get_compiler(using=queryset.db)
+    # the primary key of the conflicting row replaces the one of obj.
+    returning_fields = [opts.pk] + [
+        field for field in opts.db_returning_fields if field is not opts.pk
+    ]
+    compiler.returning_fields = returning_fields
+    [(sql, params)] = compiler.as_sql()
+    connection = compiler.connection
+    inserted_sql = _UPSERT_INSERTED_SQL[connection.vendor] % (
+        connection.ops.quote_name(opts.db_table)
+    )
+    with connection.cursor() as cursor:
+        # params already hold the parameters of the RETURNING clause.
+        cursor.execute("%s, %s" % (sql, inserted_sql), params)
+        *values, inserted = cursor.fetchone()
+    converters = compiler.get_converters(
+        [field.get_col(opts.db_table) for field in returning_fields]
+    )
+    if converters:
+        [values] = compiler.apply_converters([values], converters)
+    for field, value in zip(returning_fields, values):
+        setattr(obj, field.attname, value)
+    obj._state.adding = False
+    obj._state.db = queryset.db
+    return bool(inserted)
+
+
 class AsyncBaseCreateView(AsyncModelFormMixin, AsyncProcessFormView):
     """
     Base view for creating a new object instance.
@@ -190,14 +426,135 @@ class AsyncBaseCreateView(AsyncModelFormMixin, AsyncProcessFormView):
     This requires subclassing to provide a response mixin.
     """
 
+    # write with a single INSERT ... ON CONFLICT instead of checking unique
+    # fields beforehand.
+    upsert = False
+    # the fields the conflict is detected on.
+    upsert_unique_fields = None
+    # the fields updated on conflict, None for every field of the form except
+    # upsert_unique_fields, an empty sequence to leave the existing row as is.
+    upsert_update_fields = None
+
+    # insert objects created by concurrent requests together, with one
+    # abulk_create() per batch of up to batch_max_size objects, waiting at
+    # most batch_max_delay seconds for the batch to fill.
+    batch_writes = False
+    batch_max_size = 100
+    batch_max_delay = 0.005
+
     async def get(self, request, *args, **kwargs):
         self.object = None
         return await super().get(request, *args, **kwargs)
 
     async def post(self, request, *args, **kwargs):
         self.object = None
+        self.created = None
         return await super().post(request, *args, **kwargs)
 
+    async def get_form(self, form_class=None):
+        form = await super().get_form(form_class)
+        if self.upsert:
+            form.skip_unique_validation = True
+        return form
+
+    def get_upsert_unique_fields(self):
+        """Return the fields a conflicting row is detected on."""
+        if not self.upsert_unique_fields:
+            raise ImproperlyConfigured(
+                "%s.upsert requires upsert_unique_fields to be set."
+                % self.__class__.__name__
+            )
+        return list(self.upsert_unique_fields)
+
+    def get_upsert_update_fields(self, form):
+        """Return the fields to update when a conflicting row exists."""
+        if self.upsert_update_fields is not None:
+            return list(self.upsert_update_fields)
+        unique_fields = self.get_upsert_unique_fields()
+        opts = form.instance._meta
+        return [
+            field.name
+            for field in opts.concrete_fields
+            if not field.primary_key
+            and field.name not in unique_fields
+            and (field.name in form.fields or getattr(field, "auto_now", False))
+        ]
+
+    async def save_form(self, form):
+        if self.upsert:
+            return await self.aupsert_form(form)
+        if self.batch_writes:
+            obj = form.instance
+            using = router.db_for_write(obj.__class__, instance=obj)
+            # a custom asave() on the form can't be replaced by the batch.
+            if type(form).asave is AsyncModelForm.asave and can_batch_create(
+                obj, using
+            ):
+                batcher = get_bulk_create_batcher(
+                    obj.__class__,
+                    using,
+                    max_size=self.batch_max_size,
+                    max_delay=self.batch_max_delay,
+                )
+                obj = await batcher.acreate(obj)
+                await form._asave_m2m()
+                return obj
+        return await super().save_form(form)
+
+    async def send_object_saved(self, created):
+        if self.upsert:
+            # None when the upsert can't tell whether a row was inserted.
+            created = self.created
+        await super().send_object_saved(created)
+
+    async def aupsert_form(self, form):
+        """
+        Write the form's instance with a single INSERT ... ON CONFLICT and
+        return it.
+        """
+        obj = form.instance
+        model = obj.__class__
+        unique_fields = self.get_upsert_unique_fields()
+        update_fields = self.get_upsert_update_fields(form)
+        queryset = model._default_manager.using(
+            router.db_for_write(model, instance=obj)
+        )
+        if update_fields and _can_upsert_returning_inserted(queryset.db):
+            self.created = await sync_to_async(_upsert_returning_inserted)(
+                queryset, obj, unique_fields, update_fields
+            )
+            await self._aafter_upsert(form, obj)
+            return obj
+        pk = obj.pk
+        if update_fields:
+            kwargs = {
+                "update_conflicts": True,
+                "unique_fields": unique_fields,
+                "update_fields": update_fields,
+            }
+        else:
+            kwargs = {"ignore_conflicts": True}
+        await queryset.abulk_create([obj], **kwargs)
+        if pk is not None or obj.pk is None:
+            # a primary key set before the write isn't replaced by the one of
+            # the conflicting row, and none is returned when conflicts are
+            # ignored, look it up by the unique fields.
+            obj.pk = await (
+                queryset.filter(**{name: getattr(obj, name) for name in unique_fields})
+                .values_list("pk", flat=True)
+                .aget()
+            )
+            if pk is not None:
+                self.created = obj.pk == pk
+        await self._aafter_upsert(form, obj)
+        return obj
+
+    async def _aafter_upsert(self, form, obj):
+        # abulk_create() doesn't send post_save.
+        await ainvalidate_cached_object(obj.__class__, obj.pk, obj._state.db)
+        if hasattr(form, "_asave_m2m"):
+            await form._asave_m2m()
+
 
 class AsyncCreateView(AsyncSingleObjectTemplateResponseMixin, AsyncBaseCreateView):
     """
@@ -207,21 +564,235 @@ class AsyncCreateView(AsyncSingleObjectTemplateResponseMixin, AsyncBaseCreateVie
     template_name_suffix = "_form"
 
 
-class AsyncBaseUpdateView(AsyncModelFormMixin, AsyncProcessFormView):
+class AsyncVersionedObjectMixin:
+    """
+    Use a version column of the object as a precondition for writes: the
+    version is sent as an ETag, If-Match is checked against it and the object
+    is only written if its row still has the version it was read with.
+    """
+
+    # an integer field incremented on every write, or a DateTimeField set to
+    # the current time on every write.
+    version_field = None
+
+    def get_version_field(self):
+        return self.object._meta.get_field(self.version_field)
+
+    def get_etag(self, obj):
+        """Return the ETag of obj, built from its version."""
+        value = getattr(obj, self.get_version_field().attname)
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        return quote_etag(str(value))
+
+    def check_if_match(self):
+        """
+        Record the version self.object was read with and return False if the
+        request's If-Match header doesn't match it.
+        """
+        self.object_version = getattr(self.object, self.get_version_field().attname)
+        header = self.request.headers.get("If-Match")
+        if header is None:
+            return True
+        etags = parse_etags(header)
+        return "*" in etags or self.get_etag(self.object) in etags
+
+    def get_next_version(self):
+        """Return the version the object gets when it's written."""
+        if isinstance(self.get_version_field(), DateTimeField):
+            return timezone.now()
+        return self.object_version + 1
+
+    def get_versioned_queryset(self):
+        """
+        Return a queryset matching self.object only while its row has the
+        version it was read with.
+        """
+        model = type(self.object)
+        return model._base_manager.using(
+            router.db_for_write(model, instance=self.object)
+        ).filter(
+            pk=self.object.pk,
+            **{self.get_version_field().attname: self.object_version},
+        )
+
+    async def precondition_failed(self):
+        """Return the response for an object changed by another request."""
+        return HttpResponse(status=412)
+
+
+# the errors of a row lock that couldn't be acquired without waiting: the
+# SQLSTATE of PostgreSQL, the error codes of MySQL/MariaDB (lock wait timeout
+# and NOWAIT) and Oracle (ORA-00054).
+_LOCK_NOT_AVAILABLE_SQLSTATES = {"55P03"}
+_LOCK_NOT_AVAILABLE_CODES = {1205, 3572, 54}
+
+
+def _is_lock_not_available(error):
+    """Return whether the OperationalError error is a row lock conflict."""
+    cause = error.__cause__
+    if cause is None:
+        return False
+    sqlstate = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    if sqlstate is not None:
+        return sqlstate in _LOCK_NOT_AVAILABLE_SQLSTATES
+    code = cause.args[0] if cause.args else None
+    # the errors of the Oracle driver carry the code in their first argument.
+    code = getattr(code, "code", code)
+    return code in _LOCK_NOT_AVAILABLE_CODES
+
+
+class AsyncBaseUpdateView(
+    AsyncVersionedObjectMixin, AsyncModelFormMixin, AsyncProcessFormView
+):
     """
     Base view for updating an existing object.
 
     This requires subclassing to provide a response mixin.
     """
 
+    # fetch the object with select_for_update() and validate and save it in
+    # the same transaction, answering 409 Conflict when the row is locked.
+    lock_for_update = False
+    lock_nowait = True
+    lock_skip_locked = False
+
     async def get(self, request, *args, **kwargs):
         self.object = await self.get_object()
-        return await super().get(request, *args, **kwargs)
+        response = await super().get(request, *args, **kwargs)
+        if self.version_field is not None:
+            response.headers["ETag"] = self.get_etag(self.object)
+        return response
 
     async def post(self, request, *args, **kwargs):
+        if self.lock_for_update:
+            return await self.locked_update(self.get_form)
         self.object = await self.get_object()
+        if self.version_field is not None and not self.check_if_match():
+            return await self.precondition_failed()
         return await super().post(request, *args, **kwargs)
 
+    async def patch(self, request, *args, **kwargs):
+        """
+        Handle PATCH requests: validate and save only the fields that were
+        sent.
+        """
+        if self.lock_for_update:
+            return await self.locked_update(self.get_partial_form)
+        self.object = await self.get_object()
+        if self.version_field is not None and not self.check_if_match():
+            return await self.precondition_failed()
+        form = await self.get_partial_form()
+        if await _ais_valid(form):
+            return await self.form_valid(form)
+        else:
+            return await self.form_invalid(form)
+
+    async def form_valid(self, form):
+        if self.version_field is None:
+            return await super().form_valid(form)
+        if not await self.aversioned_save(form):
+            return await self.precondition_failed()
+        await self.send_object_saved(False)
+        # the object is saved, skip AsyncModelFormMixin.form_valid().
+        return await AsyncFormMixin.form_valid(self, form)
+
+    async def aversioned_save(self, form):
+        """
+        Write the form's changes and the next version with one conditional
+        UPDATE, return False if the row's version changed since it was read.
+        """
+        obj = form.instance
+        version_field = self.get_version_field()
+        update_fields = getattr(form, "_get_update_fields", lambda: None)()
+        if update_fields is None:
+            update_fields = form.cleaned_data
+        values = {}
+        for field in obj._meta.concrete_fields:
+            if field.primary_key or field == version_field:
+                continue
+            if field.name in update_fields or getattr(field, "auto_now", False):
+                values[field.attname] = field.pre_save(obj, False)
+        version = self.get_next_version()
+        values[version_field.attname] = version
+        if not await self.get_versioned_queryset().aupdate(**values):
+            return False
+        setattr(obj, version_field.attname, version)
+        # aupdate() doesn't send post_save.
+        await ainvalidate_cached_object(type(obj), obj.pk, obj._state.db)
+        if hasattr(form, "_asave_m2m"):
+            await form._asave_m2m()
+        else:
+            await sync_to_async(form._save_m2m)()
+        return True
+
+    async def locked_update(self, get_form):
+        """
+        Fetch the object with select_for_update(), then validate and save the
+        form returned by get_form() in one transaction and one thread.
+        """
+        queryset = await self.get_queryset()
+        # skip_locked never waits, it can't be combined with nowait.
+        locked_queryset = queryset.select_for_update(
+            nowait=self.lock_nowait and not self.lock_skip_locked,
+            skip_locked=self.lock_skip_locked,
+        )
+
+        def update():
+            # the async methods of the view run their queries in this thread,
+            # inside the transaction holding the lock.
+            with transaction.atomic(using=locked_queryset.db):
+                try:
+                    self.object = async_to_sync(self.get_object)(locked_queryset)
+                except OperationalError as e:
+                    if not _is_lock_not_available(e):
+                        raise
+                    # nowait: the row is locked.
+                    return None
+                except Http404:
+                    if not self.lock_skip_locked:
+                        raise
+                    # skip_locked: tell a locked row from a missing one.
+                    async_to_sync(self.get_object)(queryset)
+                    return None
+                if self.version_field is not None and not self.check_if_match():
+                    return async_to_sync(self.precondition_failed)()
+                form = async_to_sync(get_form)()
+                if form.is_valid():
+                    return async_to_sync(self.form_valid)(form)
+                return async_to_sync(self.form_invalid)(form)
+
+        response = await sync_to_async(update)()
+        if response is None:
+            return await self.lock_conflict()
+        return response
+
+    async def lock_conflict(self):
+        """Return the response for an object locked by another request."""
+        return HttpResponse(status=409)
+
+    async def get_partial_form(self):
+        """
+        Return the form to use for PATCH requests, restricted to the fields
+        present in the request.
+        """
+        form = await self.get_form()
+        for name, field in list(form.fields.items()):
+            key = form.add_prefix(name)
+            if isinstance(field.widget, CheckboxInput):
+                # a missing checkbox means False on a full form, here it
+                # means the field wasn't sent.
+                omitted = key not in form.data
+            else:
+                omitted = field.widget.value_omitted_from_data(
+                    form.data, form.files, key
+                )
+            if omitted:
+                del form.fields[name]
+        if hasattr(form, "save_only_changed_fields"):
+            form.save_only_changed_fields = True
+        return form
+
 
 class AsyncUpdateView(AsyncSingleObjectTemplateResponseMixin, AsyncBaseUpdateView):
     """View for updating an object, with a response rendered by a template."""
@@ -229,10 +800,87 @@ class AsyncUpdateView(AsyncSingleObjectTemplateResponseMixin, AsyncBaseUpdateVie
     template_name_suffix = "_form"
 
 
-class AsyncDeletionMixin:
+class AsyncModelFormSetMixin(AsyncFormMixin):
+    """Provide a way to show and handle a model formset in a request."""
+
+    initial = []
+    model = None
+    queryset = None
+    fields = None
+    exclude = None
+    # the form used for each object.
+    form_class = AsyncModelForm
+    formset_class = AsyncModelFormSet
+    # extra arguments for async_modelformset_factory(), e.g: extra, can_delete.
+    formset_kwargs = {}
+
+    async def get_queryset(self):
+        """Return the queryset of the objects edited by the formset."""
+        if self.queryset is not None:
+            return self.queryset.all()
+        if self.model is not None:
+            return self.model._default_manager.all()
+        raise ImproperlyConfigured(
+            "%(cls)s is missing a QuerySet. Define %(cls)s.model, "
+            "%(cls)s.queryset, or override %(cls)s.get_queryset()."
+            % {"cls": self.__class__.__name__}
+        )
+
+    async def get_formset_class(self):
+        """Return the formset class to use."""
+        queryset = await self.get_queryset()
+        return async_modelformset_factory(
+            queryset.model,
+            form=self.form_class,
+            formset=self.formset_class,
+            fields=self.fields,
+            exclude=self.exclude,
+            **self.formset_kwargs,
+        )
+
+    async def get_form_class(self):
+        return await self.get_formset_class()
+
+    async def get_form(self, form_class=None):
+        """Return an instance of the formset to be used in this view."""
+        if form_class is None:
+            form_class = await self.get_form_class()
+        kwargs = self.get_form_kwargs()
+        kwargs["queryset"] = await self.get_queryset()
+        return form_class(**kwargs)
+
+    async def form_valid(self, form):
+        """If the formset is valid, save the objects."""
+        self.object_list = await form.asave()
+        return await super().form_valid(form)
+
+    async def get_context_data(self, **kwargs):
+        """Insert the formset into the context dict, as formset and form."""
+        if "form" not in kwargs:
+            kwargs["form"] = await self.get_form()
+        kwargs.setdefault("formset", kwargs["form"])
+        return await super().get_context_data(**kwargs)
+
+
+class AsyncBaseFormSetView(AsyncModelFormSetMixin, AsyncProcessFormView):
+    """A base view for displaying a model formset."""
+
+
+class AsyncFormSetView(AsyncTemplateResponseMixin, AsyncBaseFormSetView):
+    """A view for displaying a model formset and rendering a template response."""
+
+
+class AsyncDeletionMixin(AsyncTaskQueueMixin, AsyncVersionedObjectMixin):
     """Provide the ability to delete objects."""
 
     success_url = None
+    # the success URL and the ETag read fields the template may not use, on
+    # the event loop.
+    plan_only_fields = False
+    # delete without loading the object's cascades into memory when no
+    # signals or python-side cascades need them, see afast_delete().
+    fast_delete = False
+    fast_delete_batch_size = DEFAULT_BATCH_SIZE
 
     async def delete(self, request, *args, **kwargs):
         """
@@ -240,10 +888,44 @@ class AsyncDeletionMixin:
         success URL.
         """
         self.object = await self.get_object()
+        if self.version_field is not None and not self.check_if_match():
+            return await self.precondition_failed()
         success_url = self.get_success_url()
-        await self.object.adelete()
+        if not await self.delete_object():
+            return await self.precondition_failed()
         return HttpResponseRedirect(success_url)
 
+    async def delete_object(self):
+        """
+        Delete self.object and send the object_deleted signal. Return False
+        if version_field is set and the object's version changed since it was
+        read.
+        """
+        pk = self.object.pk
+        if self.version_field is not None:
+            # the version check and the delete are one statement.
+            queryset = self.get_versioned_queryset()
+            if self.fast_delete:
+                deleted, _ = await afast_delete(
+                    queryset, batch_size=self.fast_delete_batch_size
+                )
+            else:
+                deleted, _ = await queryset.adelete()
+            if not deleted:
+                return False
+            setattr(self.object, self.object._meta.pk.attname, None)
+        elif self.fast_delete:
+            await afast_delete(self.object, batch_size=self.fast_delete_batch_size)
+        else:
+            await self.object.adelete()
+        memo = get_request_memo()
+        if memo is not None:
+            memo.discard_row(type(self.object), self.object._state.db, pk)
+        await self.send_signal(
+            object_deleted, sender=type(self.object), instance=self.object, pk=pk
+        )
+        return True
+
     # Add support for browsers which only accept GET and POST for now.
     async def post(self, request, *args, **kwargs):
         return await self.delete(request, *args, **kwargs)
@@ -264,21 +946,30 @@ class AsyncBaseDeleteView(AsyncDeletionMixin, AsyncFormView, AsyncBaseDetailView
 
     form_class = Form
 
+    async def get(self, request, *args, **kwargs):
+        response = await super().get(request, *args, **kwargs)
+        if self.version_field is not None:
+            response.headers["ETag"] = self.get_etag(self.object)
+        return response
+
     async def post(self, request, *args, **kwargs):
         # Set self.object before the usual form processing flow.
         # Inlined because having DeletionMixin as the first base, for
         # get_success_url(), makes leveraging super() with ProcessFormView
         # overly complex.
         self.object = await self.get_object()
+        if self.version_field is not None and not self.check_if_match():
+            return await self.precondition_failed()
         form = await self.get_form()
-        if form.is_valid():
+        if await _ais_valid(form):
             return await self.form_valid(form)
         else:
             return await self.form_invalid(form)
 
     async def form_valid(self, form):
         success_url = self.get_success_url()
-        await self.object.adelete()
+        if not await self.delete_object():
+            return await self.precondition_failed()
         return HttpResponseRedirect(success_url)
 
 
@@ -11,6 +11,7 @@ if django.VERSION < (6, 0):
 else:
     from django.core.paginator import AsyncPaginator  # type: ignore[import]
 
+from django_async_extensions.db.planner import PAGE, aplan_view_queryset
 from django_async_extensions.views.generic.base import (
     AsyncView,
     AsyncContextMixin,
@@ -30,6 +31,12 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
     paginator_class = AsyncPaginator
     page_kwarg = "page"
     ordering = None
+    # load only the fields and relations the template uses, see
+    # django_async_extensions.db.planner.
+    plan_queries = False
+    # give the template named tuples of these fields instead of model
+    # instances, the paginator still counts the queryset.
+    row_fields = None
 
     async def get_queryset(self):
         """
@@ -55,9 +62,24 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
             if isinstance(ordering, str):
                 ordering = (ordering,)
             queryset = queryset.order_by(*ordering)
+        if self.plan_queries:
+            queryset = await self.plan_queryset(queryset)
 
         return queryset
 
+    async def plan_queryset(self, queryset):
+        """
+        Return queryset loading only the fields and relations the template
+        uses on its objects.
+        """
+        # the default template name depends on it.
+        self.object_list = queryset
+        roots = {"object_list": (), "page_obj": PAGE}
+        context_object_name = self.get_context_object_name(queryset)
+        if context_object_name is not None:
+            roots[context_object_name] = ()
+        return await aplan_view_queryset(self, queryset, roots)
+
     def get_ordering(self):
         """Return the field or fields to use for ordering the queryset."""
         return self.ordering
@@ -90,6 +112,24 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
                 % {"page_number": page_number, "message": str(e)}
             )
 
+    def get_row_fields(self):
+        """
+        Return the fields of the rows given to the template, or None to give
+        it model instances.
+        """
+        return self.row_fields
+
+    def get_rows(self, object_list):
+        """
+        Return object_list as named tuples of the row fields, if any, when
+        it's a queryset.
+        """
+        row_fields = self.get_row_fields()
+        if row_fields is None or not isinstance(object_list, QuerySet):
+            return object_list
+        # prefetching doesn't apply to rows.
+        return object_list.prefetch_related(None).values_list(*row_fields, named=True)
+
     def get_paginate_by(self, queryset):
         """
         Get the number of items to paginate by, or ``None`` for no pagination.
@@ -140,6 +180,7 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
             paginator, page, queryset, is_paginated = await self.paginate_queryset(
                 queryset, page_size
             )
+            queryset = page.object_list = self.get_rows(queryset)
             context = {
                 "paginator": paginator,
                 "page_obj": page,
@@ -147,6 +188,7 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
                 "object_list": queryset,
             }
         else:
+            queryset = self.get_rows(queryset)
             context = {
                 "paginator": None,
                 "page_obj": None,
@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# sent by the edit views once form_valid() saved the object, with the
+# sender (the model class), instance, created, request and view arguments.
+object_saved = Signal(use_caching=True)
+
+# sent by the delete views once the object is deleted, with the sender (the
+# model class), instance, pk (the instance's pk is None once it's deleted),
+# request and view arguments.
+object_deleted = Signal(use_caching=True)
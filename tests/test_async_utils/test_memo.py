@@ -0,0 +1,109 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from django_async_extensions.utils.memo import (
+    aget_memoized,
+    amemoize,
+    get_request_memo,
+    request_memo,
+)
+
+from test_generic_views.models import Author
+
+
+class TestAmemoize:
+    async def test_without_memo(self):
+        calls = []
+
+        async def lookup(value):
+            calls.append(value)
+            return value
+
+        assert get_request_memo() is None
+        assert await amemoize("key", lookup, 1) == 1
+        assert await amemoize("key", lookup, 1) == 1
+        assert calls == [1, 1]
+
+    async def test_memoized(self):
+        calls = []
+
+        async def lookup(value):
+            calls.append(value)
+            await asyncio.sleep(0)
+            return value
+
+        with request_memo():
+            results = await asyncio.gather(
+                amemoize("key", lookup, 1), amemoize("key", lookup, 1)
+            )
+            assert await amemoize("key", lookup, 1) == 1
+            assert await amemoize("other", lookup, 2) == 2
+        assert results == [1, 1]
+        assert calls == [1, 2]
+        assert get_request_memo() is None
+
+    async def test_errors_not_memoized(self):
+        calls = []
+
+        async def lookup():
+            calls.append(1)
+            raise ValueError
+
+        with request_memo():
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    await amemoize("key", lookup)
+        assert len(calls) == 2
+
+
+@pytest.mark.django_db
+class TestAgetMemoized:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cls.author = Author.objects.create(name="Randall Munroe", slug="xkcd")
+
+    def test_same_query(self):
+        async def lookup():
+            with request_memo():
+                first = await aget_memoized(Author.objects.filter(pk=self.author.pk))
+                second = await aget_memoized(Author.objects.filter(pk=self.author.pk))
+            return first, second
+
+        with assertNumQueries(1):
+            first, second = async_to_sync(lookup)()
+        assert first is second
+        assert first == self.author
+
+    def test_identity_map(self):
+        async def lookup():
+            with request_memo():
+                return (
+                    await aget_memoized(Author.objects.filter(pk=self.author.pk)),
+                    await aget_memoized(Author.objects.filter(slug="xkcd")),
+                    await aget_memoized(
+                        Author.objects.only("name").filter(slug="xkcd")
+                    ),
+                )
+
+        with assertNumQueries(3):
+            by_pk, by_slug, deferred = async_to_sync(lookup)()
+        # one instance per row, unless different fields were loaded.
+        assert by_pk is by_slug
+        assert deferred is not by_pk
+        assert deferred.get_deferred_fields() == {"slug"}
+
+    def test_discard_row(self):
+        async def lookup():
+            with request_memo() as memo:
+                first = await aget_memoized(Author.objects.filter(pk=self.author.pk))
+                memo.discard_row(Author, "default", self.author.pk)
+                second = await aget_memoized(Author.objects.filter(pk=self.author.pk))
+            return first, second
+
+        with assertNumQueries(2):
+            first, second = async_to_sync(lookup)()
+        assert first is not second
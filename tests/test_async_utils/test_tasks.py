@@ -0,0 +1,158 @@
+import asyncio
+import contextvars
+import logging
+
+from asgiref.sync import sync_to_async
+
+import pytest
+
+from django.db import transaction
+
+from django_async_extensions.utils.memo import get_request_memo, request_memo
+from django_async_extensions.utils.tasks import AsyncTaskQueue
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestAsyncTaskQueue:
+    async def test_enqueue(self):
+        calls = []
+
+        async def task(value, *, key):
+            calls.append((value, key))
+
+        queue = AsyncTaskQueue(workers=2)
+        queue.enqueue(task, 1, key="a")
+        queue.enqueue(task, 2, key="b")
+        assert calls == []
+        await queue.adrain()
+        assert sorted(calls) == [(1, "a"), (2, "b")]
+
+    async def test_workers_dont_keep_the_starting_context(self):
+        seen = []
+
+        async def task():
+            seen.append((request_id.get(), get_request_memo()))
+
+        queue = AsyncTaskQueue(workers=1)
+        token = request_id.set(1)
+        try:
+            with request_memo():
+                queue.start()
+        finally:
+            request_id.reset(token)
+        queue.enqueue(task)
+        await queue.adrain()
+        assert seen == [(None, None)]
+
+    async def test_enqueue_coroutine(self):
+        calls = []
+
+        async def task():
+            calls.append(1)
+
+        queue = AsyncTaskQueue()
+        queue.enqueue(task())
+        await queue.adrain()
+        assert calls == [1]
+
+    async def test_enqueue_from_thread(self):
+        calls = []
+
+        async def task():
+            calls.append(1)
+
+        queue = AsyncTaskQueue()
+        queue.start()
+        await sync_to_async(queue.enqueue, thread_sensitive=False)(task)
+        await asyncio.sleep(0)
+        await queue.adrain()
+        assert calls == [1]
+
+    def test_enqueue_without_loop(self):
+        calls = []
+
+        async def task():
+            calls.append(1)
+
+        # without a running queue the task is run right away.
+        AsyncTaskQueue().enqueue(task)
+        assert calls == [1]
+
+    async def test_retries(self, caplog):
+        attempts = []
+
+        async def task():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError
+
+        queue = AsyncTaskQueue(retries=2, retry_delay=0)
+        queue.enqueue(task)
+        await queue.adrain()
+        assert len(attempts) == 3
+        assert not caplog.records
+
+    async def test_retries_exhausted(self, caplog):
+        attempts = []
+
+        async def task():
+            attempts.append(1)
+            raise ValueError
+
+        queue = AsyncTaskQueue(retries=1, retry_delay=0)
+        queue.enqueue(task)
+        with caplog.at_level(logging.ERROR, "django_async_extensions.tasks"):
+            await queue.adrain()
+        assert len(attempts) == 2
+        assert caplog.records[0].message.startswith("Task")
+        assert caplog.records[0].exc_info[0] is ValueError
+
+    async def test_bounded(self, caplog):
+        async def task():
+            pass
+
+        queue = AsyncTaskQueue(workers=0, max_size=1)
+        queue.enqueue(task)
+        with pytest.raises(asyncio.QueueFull):
+            queue.enqueue(task)
+        with caplog.at_level(logging.WARNING, "django_async_extensions.tasks"):
+            await queue.adrain(timeout=0.01)
+        assert (
+            caplog.records[0].message == "Dropping 1 queued tasks after 0.01 seconds."
+        )
+
+    async def test_aenqueue_waits(self):
+        calls = []
+
+        async def task(value):
+            calls.append(value)
+
+        queue = AsyncTaskQueue(workers=1, max_size=1)
+        await queue.aenqueue(task, 1)
+        await queue.aenqueue(task, 2)
+        await queue.adrain()
+        assert calls == [1, 2]
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_enqueue_after_commit(self):
+        calls = []
+
+        async def task(value):
+            calls.append(value)
+
+        queue = AsyncTaskQueue()
+        queue.start()
+
+        def write(value, rollback=False):
+            with transaction.atomic():
+                queue.enqueue_after_commit(task, value)
+                assert queue._queue.empty()
+                if rollback:
+                    transaction.set_rollback(True)
+
+        await sync_to_async(write)(1)
+        await sync_to_async(write)(2, rollback=True)
+        await asyncio.sleep(0)
+        await queue.adrain()
+        assert calls == [1]
@@ -0,0 +1,74 @@
+from django.template import engines
+from django.template.loader import get_template
+
+from django_async_extensions.utils.templates import ITERATED, get_variable_paths
+
+
+def paths(source):
+    return get_variable_paths(engines["django"].from_string(source))
+
+
+class TestGetVariablePaths:
+    def test_variables(self):
+        assert paths("{{ object.parent.name }}{{ title|default:object.slug }}") == {
+            "object": {("parent", "name"), ("slug",)},
+            "title": {()},
+        }
+
+    def test_for_loop(self):
+        source = (
+            "{% for child in object_list %}"
+            "{{ child.parent.name }}"
+            "{% for grandchild in child.grandchild_set.all %}"
+            "{{ grandchild.pk }}"
+            "{% endfor %}"
+            "{% endfor %}"
+        )
+        assert paths(source) == {
+            "object_list": {
+                (ITERATED,),
+                ("parent", "name"),
+                ("grandchild_set", "all", ITERATED),
+                ("grandchild_set", "all", "pk"),
+            },
+        }
+
+    def test_unpacked_loop_variables(self):
+        source = "{% for key, value in items %}{{ value.name }}{% endfor %}"
+        assert paths(source) == {"items": {(ITERATED,)}}
+
+    def test_value_used(self):
+        source = "{% for child in object_list %}{{ child }}{% endfor %}"
+        assert paths(source) == {"object_list": {(ITERATED,), ()}}
+
+    def test_with_and_if(self):
+        source = (
+            "{% with parent=object.parent %}"
+            "{% if parent.name and not object.draft %}{{ parent.pk }}{% endif %}"
+            "{% endwith %}"
+        )
+        assert paths(source) == {
+            "object": {("parent",), ("parent", "name"), ("parent", "pk"), ("draft",)},
+        }
+
+    def test_tag_arguments(self):
+        assert paths("{% url 'detail' object.parent.pk %}") == {
+            "object": {("parent", "pk")},
+        }
+
+    def test_extends(self):
+        template = get_template("test_db/child_list.html")
+        result = get_variable_paths(template)
+        # the content block of the parent is overridden.
+        assert ("note_set", "count") not in result["object"]
+        assert ("name",) in result["object"]
+        assert ("parent", "name") in result["object_list"]
+
+    def test_include(self):
+        result = get_variable_paths(get_template("test_db/comment_list.html"))
+        assert result == {
+            "object_list": {(ITERATED,), ("text",), ("content_object",)},
+        }
+
+    def test_other_backends(self):
+        assert get_variable_paths(object()) == {}
@@ -0,0 +1,49 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class Parent(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Child(models.Model):
+    parent = models.ForeignKey(Parent, models.CASCADE)
+
+
+class GrandChild(models.Model):
+    child = models.ForeignKey(Child, models.CASCADE)
+
+
+class Note(models.Model):
+    parent = models.ForeignKey(Parent, models.SET_NULL, null=True)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100)
+    parents = models.ManyToManyField(Parent)
+
+
+class Account(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Invoice(models.Model):
+    account = models.ForeignKey(Account, models.PROTECT)
+
+
+class Node(models.Model):
+    parent = models.ForeignKey("self", models.CASCADE, null=True)
+
+
+class Entry(models.Model):
+    title = models.CharField(max_length=100)
+    slug = models.SlugField(unique=True)
+    draft = models.BooleanField(default=False)
+
+
+class Comment(models.Model):
+    content_type = models.ForeignKey(ContentType, models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey()
+    text = models.CharField(max_length=100)
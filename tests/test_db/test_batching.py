@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+
+from django.db import IntegrityError
+from django.db.models import QuerySet
+from django.db.models.signals import post_save
+
+from django_async_extensions.db.batching import (
+    AsyncBulkCreateBatcher,
+    AsyncObjectLoader,
+    can_batch_create,
+    get_bulk_create_batcher,
+    get_object_loader,
+)
+from django_async_extensions.views.generic import AsyncDetailView
+from django_async_extensions.views.generic.edit import AsyncCreateView
+
+from test_generic_views.models import Author, Book, Genre
+
+from .models import Entry
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncBulkCreateBatcher:
+    async def test_concurrent_creates_are_batched(self, mocker):
+        bulk_create = mocker.spy(QuerySet, "bulk_create")
+        batcher = AsyncBulkCreateBatcher(Author, max_size=10, max_delay=0.05)
+        authors = await asyncio.gather(
+            *(
+                batcher.acreate(Author(name=f"author {i}", slug=f"author-{i}"))
+                for i in range(5)
+            )
+        )
+        assert bulk_create.call_count == 1
+        assert all(author.pk for author in authors)
+        assert not any(author._state.adding for author in authors)
+        assert await Author.objects.acount() == 5
+
+    async def test_batch_is_flushed_when_full(self, mocker):
+        bulk_create = mocker.spy(QuerySet, "bulk_create")
+        batcher = AsyncBulkCreateBatcher(Author, max_size=2, max_delay=10)
+        await asyncio.gather(
+            *(
+                batcher.acreate(Author(name=f"author {i}", slug=f"author-{i}"))
+                for i in range(4)
+            )
+        )
+        assert bulk_create.call_count == 2
+        assert await Author.objects.acount() == 4
+
+    async def test_errors_are_reported_per_row(self):
+        await Genre.objects.acreate(name="Jazz")
+        batcher = AsyncBulkCreateBatcher(Genre, max_size=10, max_delay=0.05)
+        duplicate, rock = await asyncio.gather(
+            batcher.acreate(Genre(name="Jazz")),
+            batcher.acreate(Genre(name="Rock")),
+            return_exceptions=True,
+        )
+        assert isinstance(duplicate, IntegrityError)
+        assert rock.name == "Rock"
+        assert await Genre.objects.filter(name="Rock").aexists()
+
+    async def test_aflush(self):
+        batcher = AsyncBulkCreateBatcher(Author, max_size=10, max_delay=10)
+        create = asyncio.ensure_future(
+            batcher.acreate(Author(name="Randall Munroe", slug="randall-munroe"))
+        )
+        await asyncio.sleep(0)
+        await batcher.aflush()
+        author = await create
+        assert author.pk is not None
+
+    def test_get_bulk_create_batcher(self):
+        batcher = get_bulk_create_batcher(Author, max_size=3)
+        assert get_bulk_create_batcher(Author, max_size=3) is batcher
+        assert get_bulk_create_batcher(Author) is not batcher
+        assert batcher.max_size == 3
+
+    def test_can_batch_create(self):
+        assert can_batch_create(Author()) is True
+
+        def receiver(**kwargs):
+            pass
+
+        post_save.connect(receiver, sender=Author)
+        try:
+            assert can_batch_create(Author()) is False
+        finally:
+            post_save.disconnect(receiver, sender=Author)
+
+
+class BookBatchCreate(AsyncCreateView):
+    model = Book
+    fields = ["name", "slug", "pages", "pubdate", "authors"]
+    success_url = "/list/books/"
+    batch_writes = True
+    batch_max_delay = 0.05
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBatchedCreateView:
+    async def test_batched_create(self, mocker, rf):
+        author = await Author.objects.acreate(name="Randall Munroe", slug="randall")
+        bulk_create = mocker.spy(QuerySet, "bulk_create")
+        view = BookBatchCreate.as_view()
+        requests = [
+            rf.post(
+                "/",
+                {
+                    "name": f"book {i}",
+                    "slug": f"book-{i}",
+                    "pages": 100,
+                    "pubdate": "2008-10-01",
+                    "authors": [author.pk],
+                },
+            )
+            for i in range(3)
+        ]
+        responses = await asyncio.gather(*(view(request) for request in requests))
+        assert [response.status_code for response in responses] == [302] * 3
+        # one for the books, the many-to-many rows are saved per form.
+        assert [call.args[0].model for call in bulk_create.call_args_list].count(
+            Book
+        ) == 1
+        assert await Book.objects.filter(authors=author).acount() == 3
+
+    async def test_batched_create_falls_back_with_listeners(self, mocker, rf):
+        def receiver(**kwargs):
+            pass
+
+        bulk_create = mocker.spy(QuerySet, "bulk_create")
+        view = AsyncCreateView.as_view(
+            model=Author,
+            fields="__all__",
+            success_url="/list/authors/",
+            batch_writes=True,
+        )
+        post_save.connect(receiver, sender=Author)
+        try:
+            response = await view(
+                rf.post("/", {"name": "Randall Munroe", "slug": "randall-munroe"})
+            )
+        finally:
+            post_save.disconnect(receiver, sender=Author)
+        assert response.status_code == 302
+        assert bulk_create.call_count == 0
+        assert await Author.objects.acount() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncObjectLoader:
+    @pytest.fixture(autouse=True)
+    async def setup(cls):
+        cls.entries = [
+            await Entry.objects.acreate(title=f"entry {i}", slug=f"entry-{i}")
+            for i in range(3)
+        ]
+
+    async def test_concurrent_lookups_are_batched(self, mocker):
+        fetch_all = mocker.spy(QuerySet, "_fetch_all")
+        loader = AsyncObjectLoader(Entry)
+        queryset = Entry.objects.all()
+        entries = await asyncio.gather(
+            *(loader.aload(queryset, str(entry.pk)) for entry in self.entries)
+        )
+        assert entries == self.entries
+        assert fetch_all.call_count == 1
+
+    async def test_missing_object(self):
+        loader = AsyncObjectLoader(Entry, "slug")
+        queryset = Entry.objects.all()
+        results = await asyncio.gather(
+            loader.aload(queryset, "entry-0"),
+            loader.aload(queryset, "missing"),
+            return_exceptions=True,
+        )
+        assert results[0] == self.entries[0]
+        assert isinstance(results[1], Entry.DoesNotExist)
+
+    async def test_same_object(self):
+        loader = AsyncObjectLoader(Entry, "slug")
+        queryset = Entry.objects.all()
+        first, second = await asyncio.gather(
+            loader.aload(queryset, "entry-0"), loader.aload(queryset, "entry-0")
+        )
+        assert first == second == self.entries[0]
+        # each lookup gets its own instance.
+        assert first is not second
+
+    async def test_querysets_are_batched_separately(self, mocker):
+        fetch_all = mocker.spy(QuerySet, "_fetch_all")
+        await Entry.objects.filter(pk=self.entries[1].pk).aupdate(draft=True)
+        loader = AsyncObjectLoader(Entry, max_size=2)
+        published = Entry.objects.filter(draft=False)
+        results = await asyncio.gather(
+            loader.aload(published, self.entries[0].pk),
+            loader.aload(published, self.entries[1].pk),
+            loader.aload(Entry.objects.all(), self.entries[1].pk),
+            return_exceptions=True,
+        )
+        assert results[0] == self.entries[0]
+        assert isinstance(results[1], Entry.DoesNotExist)
+        assert results[2] == self.entries[1]
+        assert fetch_all.call_count == 2
+
+    def test_unique_field_required(self):
+        with pytest.raises(ValueError):
+            AsyncObjectLoader(Entry, "title")
+
+    def test_get_object_loader(self):
+        assert get_object_loader(Entry) is get_object_loader(Entry)
+        assert get_object_loader(Entry) is not get_object_loader(Entry, "slug")
+
+    async def test_detail_view(self, mocker, rf):
+        fetch_all = mocker.spy(QuerySet, "_fetch_all")
+        view = AsyncDetailView.as_view(
+            model=Entry,
+            batch_lookups=True,
+            template_name="test_generic_views/detail.html",
+        )
+        responses = await asyncio.gather(
+            *(view(rf.get("/"), slug=entry.slug) for entry in self.entries)
+        )
+        assert [response.context_data["object"] for response in responses] == (
+            self.entries
+        )
+        assert fetch_all.call_count == 1
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.test import RequestFactory
+
+from django_async_extensions.db.cache import aget_cached_object, can_cache_queryset
+from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.views.generic import AsyncDetailView
+
+from .models import Entry
+
+
+class EntryForm(AsyncModelForm):
+    class Meta:
+        model = Entry
+        fields = ["title", "slug"]
+
+
+def get_entry(**lookups):
+    return async_to_sync(aget_cached_object)(Entry.objects.all(), lookups)
+
+
+@pytest.mark.django_db
+class TestObjectCache:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cache.clear()
+        cls.entry = Entry.objects.create(title="Orbits", slug="orbits")
+        yield
+        cache.clear()
+
+    def test_can_cache_queryset(self):
+        assert can_cache_queryset(Entry.objects.all()) is True
+        assert can_cache_queryset(Entry.objects.filter(draft=False)) is False
+        assert can_cache_queryset(Entry.objects.only("title")) is False
+        assert can_cache_queryset(Entry.objects.select_related()) is False
+
+    def test_pk(self):
+        with assertNumQueries(1):
+            assert get_entry(pk=self.entry.pk) == self.entry
+        # url arguments are strings.
+        with assertNumQueries(0):
+            entry = get_entry(pk=str(self.entry.pk))
+        assert entry == self.entry
+        assert entry.title == "Orbits"
+
+    def test_slug(self):
+        with assertNumQueries(1):
+            assert get_entry(slug="orbits") == self.entry
+        with assertNumQueries(0):
+            assert get_entry(slug="orbits") == self.entry
+            # the object is cached under its primary key.
+            assert get_entry(pk=self.entry.pk) == self.entry
+
+    def test_invalidated_on_save(self):
+        get_entry(slug="orbits")
+        form = EntryForm(
+            {"title": "Orbital Decay", "slug": "decay"}, instance=self.entry
+        )
+        assert async_to_sync(form.ais_valid)()
+        async_to_sync(form.asave)()
+        with assertNumQueries(1):
+            assert get_entry(pk=self.entry.pk).title == "Orbital Decay"
+        # the old slug doesn't match the object anymore.
+        with pytest.raises(Entry.DoesNotExist):
+            get_entry(slug="orbits")
+
+    def test_invalidated_on_delete(self):
+        get_entry(pk=self.entry.pk)
+        pk = self.entry.pk
+        self.entry.delete()
+        with pytest.raises(Entry.DoesNotExist):
+            get_entry(pk=pk)
+
+    def test_filtered_queryset_not_cached(self):
+        queryset = Entry.objects.filter(draft=False)
+        for _ in range(2):
+            with assertNumQueries(1):
+                async_to_sync(aget_cached_object)(queryset, {"pk": self.entry.pk})
+
+    def test_single_flight(self, mocker):
+        aget = mocker.spy(QuerySet, "aget")
+
+        async def lookups():
+            return await asyncio.gather(
+                *(
+                    aget_cached_object(Entry.objects.all(), {"slug": "orbits"})
+                    for _ in range(5)
+                )
+            )
+
+        entries = async_to_sync(lookups)()
+        assert aget.call_count == 1
+        assert entries == [self.entry] * 5
+        # each lookup gets its own instance.
+        assert len({id(entry) for entry in entries}) == 5
+
+    def test_detail_view(self):
+        view = AsyncDetailView.as_view(
+            model=Entry,
+            object_cache=True,
+            template_name="test_generic_views/detail.html",
+        )
+        request = RequestFactory().get("/")
+        for queries in (1, 0):
+            with assertNumQueries(queries):
+                response = async_to_sync(view)(request, slug="orbits")
+            assert response.context_data["object"] == self.entry
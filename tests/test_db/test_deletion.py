@@ -0,0 +1,98 @@
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.db.models import ProtectedError
+from django.db.models.signals import pre_delete
+
+from django_async_extensions.db.deletion import afast_delete, can_fast_delete
+
+from .models import Account, Child, GrandChild, Invoice, Node, Note, Parent, Tag
+
+
+def make_family():
+    parent = Parent.objects.create(name="parent")
+    for _ in range(3):
+        child = Child.objects.create(parent=parent)
+        GrandChild.objects.bulk_create([GrandChild(child=child) for _ in range(2)])
+    note = Note.objects.create(parent=parent)
+    tag = Tag.objects.create(name="tag")
+    tag.parents.add(parent)
+    return parent, note, tag
+
+
+@pytest.mark.django_db
+class TestFastDelete:
+    def test_can_fast_delete(self):
+        assert can_fast_delete(Parent) is True
+        assert can_fast_delete(GrandChild) is True
+        # PROTECT needs to look at the rows.
+        assert can_fast_delete(Account) is False
+        # cycles could cascade forever.
+        assert can_fast_delete(Node) is False
+
+    def test_can_fast_delete_with_signals(self):
+        def receiver(**kwargs):
+            pass
+
+        pre_delete.connect(receiver, sender=GrandChild)
+        try:
+            assert can_fast_delete(Parent) is False
+        finally:
+            pre_delete.disconnect(receiver, sender=GrandChild)
+
+    def test_delete_instance(self):
+        parent, note, tag = make_family()
+        pk = parent.pk
+        result = async_to_sync(afast_delete)(parent, batch_size=2)
+        assert result == (
+            11,
+            {
+                "test_db.GrandChild": 6,
+                "test_db.Child": 3,
+                "test_db.Tag_parents": 1,
+                "test_db.Parent": 1,
+            },
+        )
+        assert parent.pk is None
+        assert not Parent.objects.filter(pk=pk).exists()
+        assert not Child.objects.exists()
+        assert not GrandChild.objects.exists()
+        note.refresh_from_db()
+        assert note.parent is None
+        assert Tag.objects.filter(pk=tag.pk).exists()
+
+    def test_delete_queries_without_cascades(self):
+        tag = Tag.objects.create(name="tag")
+        child = Child.objects.create(parent=Parent.objects.create(name="parent"))
+        grand_child = GrandChild.objects.create(child=child)
+        # a single DELETE.
+        with assertNumQueries(1):
+            async_to_sync(afast_delete)(grand_child)
+        with assertNumQueries(1):
+            async_to_sync(afast_delete)(Tag.objects.filter(name="other"))
+        assert Tag.objects.filter(pk=tag.pk).exists()
+
+    def test_delete_queryset(self):
+        make_family()
+        make_family()
+        Parent.objects.create(name="other")
+        total, counter = async_to_sync(afast_delete)(
+            Parent.objects.filter(name="parent"), batch_size=1
+        )
+        assert counter["test_db.Parent"] == 2
+        assert counter["test_db.GrandChild"] == 12
+        assert list(Parent.objects.values_list("name", flat=True)) == ["other"]
+        assert Note.objects.filter(parent=None).count() == 2
+
+    def test_falls_back_to_adelete(self):
+        account = Account.objects.create(name="account")
+        Invoice.objects.create(account=account)
+        with pytest.raises(ProtectedError):
+            async_to_sync(afast_delete)(account)
+
+        root = Node.objects.create()
+        Node.objects.create(parent=root)
+        async_to_sync(afast_delete)(root)
+        assert not Node.objects.exists()
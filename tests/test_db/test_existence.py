@@ -0,0 +1,77 @@
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.http import Http404
+from django.test import RequestFactory
+
+from django_async_extensions.db.existence import BloomFilter, ExistenceIndex
+from django_async_extensions.views.generic import AsyncDetailView
+
+from .models import Entry
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(i)
+    assert all(i in bloom for i in range(1000))
+    false_positives = sum(i in bloom for i in range(1000, 11000))
+    assert false_positives < 300
+
+
+@pytest.mark.django_db
+class TestExistenceIndex:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cls.entry = Entry.objects.create(title="Orbits", slug="orbits")
+
+    def test_not_built(self):
+        index = ExistenceIndex(Entry, "slug")
+        assert index.might_contain("missing") is True
+
+    def test_build(self):
+        index = ExistenceIndex(Entry, "slug", chunk_size=1)
+        Entry.objects.create(title="Tides", slug="tides")
+        async_to_sync(index.abuild)()
+        assert index.might_contain("orbits") is True
+        assert index.might_contain("tides") is True
+        assert index.might_contain("missing") is False
+
+    def test_pk(self):
+        index = ExistenceIndex(Entry)
+        async_to_sync(index.abuild)()
+        # url arguments are strings.
+        assert index.might_contain(str(self.entry.pk)) is True
+        assert index.might_contain("not a pk") is False
+
+    def test_saved_rows_added(self):
+        index = ExistenceIndex(Entry, "slug")
+        async_to_sync(index.abuild)()
+        Entry.objects.create(title="Tides", slug="tides")
+        assert index.might_contain("tides") is True
+        Entry.objects.bulk_create([Entry(title="Comets", slug="comets")])
+        assert index.might_contain("comets") is False
+        index.add("comets")
+        assert index.might_contain("comets") is True
+
+    def test_detail_view(self):
+        index = ExistenceIndex(Entry, "slug")
+        async_to_sync(index.abuild)()
+        view = AsyncDetailView.as_view(
+            model=Entry,
+            existence_index=index,
+            template_name="test_generic_views/detail.html",
+        )
+        request = RequestFactory().get("/")
+        with assertNumQueries(1):
+            response = async_to_sync(view)(request, slug="orbits")
+        assert response.context_data["object"] == self.entry
+        with assertNumQueries(0):
+            with pytest.raises(Http404):
+                async_to_sync(view)(request, slug="missing")
+        # lookups the index doesn't cover are queried.
+        with assertNumQueries(1):
+            with pytest.raises(Http404):
+                async_to_sync(view)(request, pk=self.entry.pk + 1)
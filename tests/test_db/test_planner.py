@@ -0,0 +1,178 @@
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.core.paginator import Page
+from django.test import RequestFactory
+
+from django_async_extensions.core.paginator import AsyncPage, AsyncPaginator
+
+from django_async_extensions.db.planner import QueryPlan, get_query_plan
+from django_async_extensions.utils.templates import ITERATED
+from django_async_extensions.views.generic import (
+    AsyncDeleteView,
+    AsyncDetailView,
+    AsyncListView,
+    AsyncUpdateView,
+)
+
+from .models import Child, Comment, Entry, GrandChild, Parent
+
+
+class IterablePage(AsyncPage, Page):
+    pass
+
+
+class IterablePaginator(AsyncPaginator):
+    def _get_page(self, *args, **kwargs):
+        return IterablePage(*args, **kwargs)
+
+
+def plan(model, *paths):
+    result = get_query_plan(model, paths)
+    return result.only, result.select_related, result.prefetch_related
+
+
+class TestGetQueryPlan:
+    def test_fields(self):
+        assert plan(Entry, ("title",), ("pk",), (ITERATED,)) == (
+            ["id", "title"],
+            [],
+            [],
+        )
+
+    def test_instance_used(self):
+        assert plan(Entry, ("title",), ()) == (None, [], [])
+        # a method may use any field.
+        assert plan(Entry, ("get_absolute_url",)) == (None, [], [])
+
+    def test_select_related(self):
+        assert plan(GrandChild, ("child", "parent", "name")) == (
+            ["child", "child__parent", "child__parent__name"],
+            ["child", "child__parent"],
+            [],
+        )
+        assert plan(Child, ("parent_id",)) == (["parent"], [], [])
+
+    def test_related_instance_used(self):
+        assert plan(Child, ("parent",)) == (
+            ["parent", "parent__id", "parent__name"],
+            ["parent"],
+            [],
+        )
+
+    def test_prefetch_related(self):
+        assert plan(Parent, ("child_set", "all", "grandchild_set", "all")) == (
+            [],
+            [],
+            ["child_set__grandchild_set"],
+        )
+        assert plan(Parent, ("child_set", "count")) == ([], [], [])
+        assert plan(GrandChild, ("child", "grandchild_set", "all", ITERATED)) == (
+            ["child"],
+            ["child"],
+            ["child__grandchild_set"],
+        )
+
+    def test_generic_foreign_key(self):
+        assert plan(Comment, ("content_object", "name")) == (
+            ["content_type", "object_id"],
+            [],
+            ["content_object"],
+        )
+
+    def test_apply(self):
+        queryset = QueryPlan(["title"], ["a"], ["b"]).apply(Entry.objects.values())
+        assert not queryset.query.select_related
+        # the fields chosen by the queryset are kept.
+        queryset = QueryPlan(["title"]).apply(Entry.objects.defer("draft"))
+        assert queryset.query.deferred_loading == (frozenset({"draft"}), True)
+
+
+@pytest.mark.django_db
+class TestPlannedViews:
+    def test_detail_view(self):
+        parent = Parent.objects.create(name="parent")
+        grandchild = GrandChild.objects.create(
+            child=Child.objects.create(parent=parent)
+        )
+        view = AsyncDetailView.as_view(model=GrandChild, plan_queries=True)
+        with assertNumQueries(1):
+            response = async_to_sync(view)(RequestFactory().get("/"), pk=grandchild.pk)
+            response.render()
+        assert response.content.decode().strip() == "parent"
+
+    def test_list_view(self):
+        for i in range(3):
+            Entry.objects.create(title=f"entry {i}", slug=f"entry-{i}")
+        view = AsyncListView.as_view(
+            queryset=Entry.objects.order_by("pk"), paginate_by=2, plan_queries=True
+        )
+        with assertNumQueries(2):
+            response = async_to_sync(view)(RequestFactory().get("/"))
+            response.render()
+        assert response.content.decode().strip() == "entry 0entry 1"
+        entries = response.context_data["object_list"]
+        assert entries[0].get_deferred_fields() == {"slug", "draft"}
+
+    def test_list_view_iterated_page(self):
+        for i in range(3):
+            Entry.objects.create(title=f"entry {i}", slug=f"entry-{i}")
+        view = AsyncListView.as_view(
+            queryset=Entry.objects.order_by("pk"),
+            paginate_by=2,
+            paginator_class=IterablePaginator,
+            template_name="test_db/entry_page.html",
+            plan_queries=True,
+        )
+        with assertNumQueries(2):
+            response = async_to_sync(view)(RequestFactory().get("/"))
+            response.render()
+        assert response.content.decode().splitlines() == [
+            "entry 0entry 1",
+            "entry-0entry-1",
+            "page 1",
+        ]
+        entries = response.context_data["object_list"]
+        assert entries[0].get_deferred_fields() == {"draft"}
+
+    def test_update_view(self):
+        # the form reads every field of the object, only relations are planned.
+        entry = Entry.objects.create(title="entry", slug="entry")
+        view = AsyncUpdateView.as_view(
+            model=Entry,
+            fields=["title", "slug", "draft"],
+            template_name="test_db/entry_detail.html",
+            plan_queries=True,
+        )
+        response = async_to_sync(view)(RequestFactory().get("/"), pk=entry.pk)
+        assert response.context_data["form"].initial["slug"] == "entry"
+        assert response.context_data["object"].get_deferred_fields() == set()
+
+        parent = Parent.objects.create(name="parent")
+        grandchild = GrandChild.objects.create(
+            child=Child.objects.create(parent=parent)
+        )
+        view = AsyncUpdateView.as_view(
+            model=GrandChild,
+            fields=["child"],
+            template_name="test_db/grandchild_detail.html",
+            plan_queries=True,
+        )
+        response = async_to_sync(view)(RequestFactory().get("/"), pk=grandchild.pk)
+        with assertNumQueries(0):
+            assert response.context_data["object"].child.parent.name == "parent"
+
+    def test_delete_view(self):
+        entry = Entry.objects.create(title="entry", slug="entry")
+        view = AsyncDeleteView.as_view(
+            model=Entry,
+            success_url="/entries/{slug}/",
+            template_name="test_db/entry_detail.html",
+            plan_queries=True,
+        )
+        response = async_to_sync(view)(RequestFactory().post("/"), pk=entry.pk)
+        assert response.status_code == 302
+        assert response.url == "/entries/entry/"
+        assert not Entry.objects.exists()
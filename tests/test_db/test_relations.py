@@ -0,0 +1,141 @@
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.core.paginator import Paginator
+from django.template.loader import get_template
+from django.test import RequestFactory
+
+from django_async_extensions.core.paginator import AsyncPaginator
+from django_async_extensions.db.relations import (
+    aprefetch_template_relations,
+    get_page_item_paths,
+    get_relation_lookup,
+    get_relation_lookups,
+)
+from django_async_extensions.views.generic import AsyncDetailView, AsyncListView
+
+from .models import Child, Comment, Entry, GrandChild, Parent, Tag
+
+
+class TestGetRelationLookup:
+    def test_forward(self):
+        assert get_relation_lookup(Child, ("parent", "name")) == "parent"
+        assert get_relation_lookup(GrandChild, ("child", "parent")) == "child__parent"
+
+    def test_reverse(self):
+        assert get_relation_lookup(Parent, ("child_set", "all", "pk")) == "child_set"
+        # the related objects aren't needed to count them.
+        assert get_relation_lookup(Parent, ("child_set", "count")) is None
+
+    def test_many_to_many(self):
+        assert get_relation_lookup(Tag, ("parents", "all", "name")) == "parents"
+        assert get_relation_lookup(Parent, ("tag_set", "all")) == "tag_set"
+
+    def test_generic_foreign_key(self):
+        assert get_relation_lookup(Comment, ("content_object", "name")) == (
+            "content_object"
+        )
+
+    def test_not_a_relation(self):
+        assert get_relation_lookup(Child, ("parent_id",)) is None
+        assert get_relation_lookup(Child, ("pk",)) is None
+        assert get_relation_lookup(Child, ()) is None
+
+    def test_get_relation_lookups(self):
+        paths = {("parent", "name"), ("parent",), ("grandchild_set", "all"), ()}
+        assert get_relation_lookups(Child, paths) == ["grandchild_set", "parent"]
+
+    def test_get_page_item_paths(self):
+        paths = {
+            ("object_list", "parent", "name"),
+            ("grandchild_set", "all"),
+            ("number",),
+            ("paginator", "count"),
+        }
+        page = Paginator([], 2).page(1)
+        # iterating a page iterates its objects.
+        assert get_page_item_paths(page, paths) == {
+            ("parent", "name"),
+            ("grandchild_set", "all"),
+        }
+        page = AsyncPaginator([], 2).page(1)
+        assert get_page_item_paths(page, paths) == {("parent", "name")}
+
+
+@pytest.mark.django_db
+class TestPrefetchTemplateRelations:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cls.parents = [Parent.objects.create(name=f"parent {i}") for i in range(3)]
+        for parent in cls.parents:
+            child = Child.objects.create(parent=parent)
+            GrandChild.objects.create(child=child)
+            GrandChild.objects.create(child=child)
+
+    def test_prefetch(self):
+        template = get_template("test_db/child_list.html")
+        context = {"object_list": Child.objects.all(), "object": self.parents[0]}
+        # the children, their parents and their grandchildren.
+        with assertNumQueries(3):
+            async_to_sync(aprefetch_template_relations)(template, context)
+        with assertNumQueries(0):
+            content = template.render(context)
+        assert "parent 2" in content
+
+    def test_deferred_foreign_key(self):
+        template = get_template("test_db/child_list.html")
+        context = {"object_list": Child.objects.only("pk")}
+        with assertNumQueries(2):
+            async_to_sync(aprefetch_template_relations)(template, context)
+
+    def test_generic_foreign_key(self):
+        entry = Entry.objects.create(title="Orbits", slug="orbits")
+        for obj in (self.parents[0], self.parents[1], entry):
+            Comment.objects.create(content_object=obj, text="nice")
+        template = get_template("test_db/comment_list.html")
+        context = {"object_list": list(Comment.objects.all())}
+        async_to_sync(aprefetch_template_relations)(template, context)
+        with assertNumQueries(0):
+            content = template.render(context)
+        assert "Entry object" in content
+
+    def test_list_view(self):
+        view = AsyncListView.as_view(
+            model=Child,
+            template_name="test_db/child_list.html",
+            prefetch_template_relations=True,
+        )
+        with assertNumQueries(3):
+            response = async_to_sync(view)(RequestFactory().get("/"))
+            response.render()
+        assert "parent 1" in response.content.decode()
+
+    def test_paginated_list_view(self):
+        view = AsyncListView.as_view(
+            model=Child,
+            queryset=Child.objects.order_by("pk"),
+            paginate_by=2,
+            template_name="test_db/child_page.html",
+            prefetch_template_relations=True,
+        )
+        # the count, the children, their parents and their grandchildren.
+        with assertNumQueries(4):
+            response = async_to_sync(view)(RequestFactory().get("/"))
+            response.render()
+        content = response.content.decode()
+        assert "parent 1" in content
+        assert "page 1" in content
+
+    def test_detail_view(self):
+        view = AsyncDetailView.as_view(
+            model=Parent,
+            template_name="test_db/base.html",
+            prefetch_template_relations=True,
+        )
+        with assertNumQueries(2):
+            response = async_to_sync(view)(
+                RequestFactory().get("/"), pk=self.parents[0].pk
+            )
+            response.render()
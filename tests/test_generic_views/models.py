@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.db.models import QuerySet
 from django.db.models.manager import BaseManager
@@ -62,3 +64,20 @@ class Page(models.Model):
 
 class BookSigning(models.Model):
     event_date = models.DateTimeField()
+
+
+class Genre(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=100, unique=True)
+    description = models.CharField(max_length=255, blank=True)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+    description = models.CharField(max_length=255, blank=True)
+
+
+class Article(models.Model):
+    title = models.CharField(max_length=100)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,196 @@
+import json
+
+import pytest
+
+from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient, RequestFactory
+
+from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.views.generic import AsyncBulkImportView
+
+from .models import Author, Genre
+
+aclient = AsyncClient()
+
+
+@pytest.fixture(autouse=True)
+def url_setting_set(settings):
+    old_root_urlconf = settings.ROOT_URLCONF
+    settings.ROOT_URLCONF = "test_generic_views.urls"
+    yield settings
+    settings.ROOT_URLCONF = old_root_urlconf
+
+
+async def read_report(response):
+    content = b"".join([chunk async for chunk in response.streaming_content])
+    return [json.loads(line) for line in content.decode().splitlines()]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkImportView:
+    async def test_import_jsonl(self):
+        body = "\n".join(
+            [
+                json.dumps({"name": "Randall Munroe", "slug": "randall-munroe"}),
+                json.dumps({"name": "Ursula K. Le Guin"}),
+                "",
+                "not json",
+                json.dumps(["not", "an", "object"]),
+                json.dumps({"name": "Roberto Bolaño", "slug": "roberto-bolano"}),
+            ]
+        )
+        res = await aclient.post(
+            "/edit/authors/import/", body, content_type="application/x-ndjson"
+        )
+        assert res.status_code == 200
+        assert res["Content-Type"] == "application/x-ndjson"
+        report = await read_report(res)
+        assert [row.get("line") for row in report[:-1]] == [2, 4, 5]
+        assert report[0]["errors"] == {
+            "slug": [{"message": "This field is required.", "code": "required"}]
+        }
+        assert report[-1] == {"created": 2, "failed": 3}
+        names = [name async for name in Author.objects.values_list("name", flat=True)]
+        assert names == ["Randall Munroe", "Roberto Bolaño"]
+
+    async def test_import_csv_upload(self):
+        upload = SimpleUploadedFile(
+            "authors.csv",
+            b"name,slug\nRandall Munroe,randall-munroe\n"
+            b'"Le Guin, Ursula K.",ursula\nToo,many,values\n',
+            content_type="text/csv",
+        )
+        res = await aclient.post("/edit/authors/import/", {"file": upload})
+        report = await read_report(res)
+        assert report == [
+            {
+                "line": 4,
+                "errors": {"__all__": [{"message": "Too many values.", "code": ""}]},
+            },
+            {"created": 2, "failed": 1},
+        ]
+        assert await Author.objects.filter(name="Le Guin, Ursula K.").aexists()
+
+    async def test_import_reports_database_errors_per_row(self):
+        # both rows are valid on their own but conflict with each other.
+        body = "\n".join(
+            json.dumps({"name": name}) for name in ["Jazz", "Jazz", "Rock"]
+        )
+        res = await aclient.post(
+            "/edit/genres/import/", body, content_type="application/jsonl"
+        )
+        report = await read_report(res)
+        assert [row.get("line") for row in report[:-1]] == [2]
+        assert report[-1] == {"created": 2, "failed": 1}
+        assert await Genre.objects.acount() == 2
+
+    async def test_import_with_model_form(self):
+        class PlainAuthorForm(forms.ModelForm):
+            class Meta:
+                model = Author
+                fields = ["name", "slug"]
+
+        view = AsyncBulkImportView.as_view(form_class=PlainAuthorForm)
+        request = RequestFactory().post(
+            "/",
+            json.dumps({"name": "Randall Munroe", "slug": "randall-munroe"}),
+            content_type="application/x-ndjson",
+        )
+        report = await read_report(await view(request))
+        assert report == [{"created": 1, "failed": 0}]
+        assert await Author.objects.filter(slug="randall-munroe").aexists()
+
+    async def test_import_with_custom_asave(self):
+        saved = []
+
+        class AuthorForm(AsyncModelForm):
+            class Meta:
+                model = Author
+                fields = ["name", "slug"]
+
+            async def asave(self, commit=True):
+                saved.append(self.cleaned_data["slug"])
+                return await super().asave(commit)
+
+        view = AsyncBulkImportView.as_view(form_class=AuthorForm)
+        body = "\n".join(
+            json.dumps({"name": name, "slug": slug})
+            for name, slug in [("Randall Munroe", "xkcd"), ("Le Guin", "ursula")]
+        )
+        request = RequestFactory().post("/", body, content_type="application/x-ndjson")
+        report = await read_report(await view(request))
+        assert report == [{"created": 2, "failed": 0}]
+        assert saved == ["xkcd", "ursula"]
+
+    async def test_unsupported_format(self):
+        res = await aclient.post(
+            "/edit/authors/import/", "name", content_type="text/plain"
+        )
+        assert res.status_code == 400
+        assert json.loads(res.content) == {"error": "Unsupported import format."}
+
+    async def test_missing_upload(self):
+        res = await aclient.post("/edit/authors/import/", {"name": "file"})
+        assert res.status_code == 400
+        assert json.loads(res.content) == {"error": "No file was uploaded."}
+
+    async def test_get_not_allowed(self):
+        res = await aclient.get("/edit/authors/import/")
+        assert res.status_code == 405
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBulkDeleteView:
+    async def create_authors(self):
+        authors = await Author.objects.abulk_create(
+            [Author(name=f"author {i}", slug=f"author-{i}") for i in range(5)]
+        )
+        await Author.objects.acreate(name="kept", slug="keep")
+        return authors
+
+    async def test_delete_selection(self):
+        authors = await self.create_authors()
+        res = await aclient.post(
+            "/edit/authors/bulk-delete/",
+            {"pk": [author.pk for author in authors[:3]]},
+        )
+        assert res.status_code == 200
+        report = await read_report(res)
+        assert report == [
+            {"deleted": 2, "total": 3},
+            {"deleted": 3, "total": 3},
+            {
+                "deleted": 3,
+                "total": 3,
+                "objects": {"test_generic_views.Author": 3},
+            },
+        ]
+        assert await Author.objects.acount() == 3
+
+    async def test_delete_all(self):
+        await self.create_authors()
+        res = await aclient.post("/edit/authors/bulk-delete/fast/", {"all": "1"})
+        report = await read_report(res)
+        assert [line["deleted"] for line in report] == [2, 4, 5, 5]
+        assert report[-1]["objects"] == {"test_generic_views.Author": 5}
+        names = [name async for name in Author.objects.values_list("name", flat=True)]
+        assert names == ["kept"]
+
+    async def test_selection_out_of_scope(self):
+        await self.create_authors()
+        kept = await Author.objects.aget(slug="keep")
+        res = await aclient.post("/edit/authors/bulk-delete/", {"pk": [kept.pk]})
+        assert res.status_code == 400
+        assert json.loads(res.content) == {
+            "error": "Some of the selected objects don't exist.",
+            "missing": [str(kept.pk)],
+        }
+        assert await Author.objects.acount() == 6
+
+    async def test_invalid_selection(self):
+        res = await aclient.post("/edit/authors/bulk-delete/", {"pk": ["nope"]})
+        assert res.status_code == 400
+        res = await aclient.post("/edit/authors/bulk-delete/")
+        assert res.status_code == 400
+        assert json.loads(res.content) == {"error": ["No objects were selected."]}
@@ -1,24 +1,51 @@
+import asyncio
+import datetime
+import gc
 import re
+import weakref
+from unittest import mock
 
 import pytest
-from pytest_django.asserts import assertRedirects, assertQuerySetEqual
+from pytest_django.asserts import (
+    assertNumQueries,
+    assertRedirects,
+    assertQuerySetEqual,
+)
+
+from asgiref.sync import async_to_sync, sync_to_async
 
 from django import forms
 from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, AsyncClient
-from django.test.client import RequestFactory
+from django.test.utils import isolate_apps
+from django.db import OperationalError, connection, models
+from django.db.models import QuerySet
+from django.db.models.signals import post_save
+from django.test.client import (
+    BOUNDARY,
+    MULTIPART_CONTENT,
+    RequestFactory,
+    encode_multipart,
+)
 from django.urls import reverse
 from django.utils.version import get_complete_version
 
+from django_async_extensions.forms.models import (
+    cached_modelform_factory,
+    clear_modelform_cache,
+)
+from django_async_extensions.utils.tasks import default_task_queue
 from django_async_extensions.views.generic import AsyncView
 from django_async_extensions.views.generic.edit import (
     AsyncFormMixin,
     AsyncModelFormMixin,
     AsyncCreateView,
 )
+from django_async_extensions.views.signals import object_deleted, object_saved
 
 from . import views
-from .models import Author, Artist
+from .models import Article, Author, Artist, Book, Genre, Tag
 from .forms import AuthorForm
 
 client = Client()
@@ -92,6 +119,27 @@ class TestBasicForm:
         res = client.post("/contact/", {"name": "Me", "message": "Hello"})
         assertRedirects(res, "/list/authors/")
 
+    def test_form_fragment(self, mocker):
+        spy = mocker.spy(views.ContactView, "get_context_data")
+        res = client.post("/contact/fragment/?fragment", {"name": "Me"})
+        assert res.status_code == 200
+        assert not hasattr(res, "context_data")
+        assert spy.call_count == 0
+        assert res["Vary"] == "X-Form-Fragment"
+        content = res.content.decode()
+        assert content.startswith("<div>")
+        assert "This field is required." in content
+        assert "<html" not in content
+
+    def test_form_fragment_full_page(self):
+        res = client.post("/contact/fragment/", {"name": "Me"})
+        assert res.status_code == 200
+        assert res.template_name == ["test_generic_views/form.html"]
+        assert res["Vary"] == "X-Form-Fragment"
+        # the mode is opt-in.
+        res = client.post("/contact/?fragment", {"name": "Me"})
+        assert res.template_name == ["test_generic_views/form.html"]
+
     async def test_late_form_validation(self):
         """
         A form can be marked invalid in the form_valid() method (#25548).
@@ -237,6 +285,40 @@ class TestCreateView:
         form_class = await MyCreateView().get_form_class()
         assert list(form_class.base_fields) == ["name", "slug"]
 
+    async def test_create_view_form_class_is_cached(self):
+        class MyCreateView(AsyncCreateView):
+            model = Author
+            fields = ["name"]
+
+        class OtherCreateView(AsyncCreateView):
+            model = Author
+            fields = ("name",)
+
+        class AllFieldsCreateView(AsyncCreateView):
+            model = Author
+            fields = "__all__"
+
+        form_class = await MyCreateView().get_form_class()
+        assert await MyCreateView().get_form_class() is form_class
+        assert await OtherCreateView().get_form_class() is form_class
+        assert await AllFieldsCreateView().get_form_class() is not form_class
+
+        clear_modelform_cache()
+        assert await MyCreateView().get_form_class() is not form_class
+
+    def test_cached_form_class_is_released_with_its_model(self):
+        with isolate_apps("test_generic_views"):
+
+            class Temporary(models.Model):
+                name = models.CharField(max_length=10)
+
+            form_class = cached_modelform_factory(Temporary, fields=["name"])
+            assert cached_modelform_factory(Temporary, fields=["name"]) is form_class
+            model_ref = weakref.ref(Temporary)
+        del Temporary, form_class
+        gc.collect()
+        assert model_ref() is None
+
     async def test_create_view_without_explicit_fields(self):
         class MyCreateView(AsyncCreateView):
             model = Author
@@ -258,6 +340,203 @@ class TestCreateView:
         with pytest.raises(ImproperlyConfigured, match=message):
             await MyCreateView().get_form_class()
 
+    def test_create_upsert(self):
+        res = client.post("/edit/genres/upsert/", {"name": "Jazz"})
+        assert res.status_code == 302
+        assert res["Location"] == "/list/genres/?created=True"
+        genre = Genre.objects.get()
+
+        # an existing name updates the row instead of failing validation.
+        res = client.post(
+            "/edit/genres/upsert/", {"name": "Jazz", "description": "Swing"}
+        )
+        assert res.status_code == 302
+        assert res["Location"] == "/list/genres/?created=False"
+        assert list(Genre.objects.values_list("pk", "description")) == [
+            (genre.pk, "Swing")
+        ]
+
+    def test_create_upsert_skips_unique_queries(self):
+        Genre.objects.create(name="Jazz")
+        # the write and, unless the write returns it, the lookup of the
+        # primary key of the written row.
+        with assertNumQueries(1 if connection.vendor == "postgresql" else 2):
+            res = client.post(
+                "/edit/genres/upsert/", {"name": "Jazz", "description": "Swing"}
+            )
+        assert res.status_code == 302
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="requires SQLite")
+    def test_create_upsert_returning_inserted(self):
+        # sqlite can't tell an inserted row from an updated one, this only
+        # checks the statement writing the row and returning its primary key.
+        inserted_sql = {"sqlite": "(%s.rowid IS NOT NULL)"}
+        Genre.objects.create(name="Jazz")
+        with mock.patch.dict(
+            "django_async_extensions.views.generic.edit._UPSERT_INSERTED_SQL",
+            inserted_sql,
+        ):
+            with assertNumQueries(1):
+                res = client.post(
+                    "/edit/genres/upsert/", {"name": "Jazz", "description": "Swing"}
+                )
+            assert res.status_code == 302
+            assert res["Location"] == "/list/genres/?created=True"
+            res = client.post("/edit/genres/upsert/", {"name": "Blues"})
+            assert res["Location"] == "/list/genres/?created=True"
+        assert list(
+            Genre.objects.order_by("name").values_list("name", "description")
+        ) == [
+            ("Blues", ""),
+            ("Jazz", "Swing"),
+        ]
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="requires SQLite")
+    def test_create_upsert_returning_inserted_auto_pk(self):
+        inserted_sql = {"sqlite": "(%s.rowid IS NOT NULL)"}
+        tag = Tag.objects.create(name="jazz")
+        view = AsyncCreateView.as_view(
+            model=Tag,
+            fields="__all__",
+            upsert=True,
+            upsert_unique_fields=["name"],
+            success_url="/tags/{id}/",
+        )
+        with mock.patch.dict(
+            "django_async_extensions.views.generic.edit._UPSERT_INSERTED_SQL",
+            inserted_sql,
+        ):
+            with assertNumQueries(1):
+                res = async_to_sync(view)(
+                    RequestFactory().post("/", {"name": "jazz", "description": "x"})
+                )
+        # the primary key of the conflicting row is returned.
+        assert res.url == "/tags/%d/" % tag.pk
+        assert list(Tag.objects.values_list("pk", "description")) == [(tag.pk, "x")]
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="requires PostgreSQL")
+    def test_create_upsert_created_auto_pk(self):
+        tag = Tag.objects.create(name="jazz")
+        for name, created in [("blues", True), ("jazz", False)]:
+            view = AsyncCreateView(
+                model=Tag,
+                fields="__all__",
+                upsert=True,
+                upsert_unique_fields=["name"],
+                success_url="/",
+            )
+            request = RequestFactory().post("/", {"name": name})
+            view.setup(request)
+            async_to_sync(view.dispatch)(request)
+            assert view.created is created
+        assert view.object.pk == tag.pk
+        assert Tag.objects.count() == 2
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="requires PostgreSQL")
+    def test_create_upsert_created(self):
+        genre = Genre.objects.create(name="Jazz")
+        with assertNumQueries(1):
+            res = client.post("/edit/genres/upsert/", {"name": "Blues"})
+        assert res["Location"] == "/list/genres/?created=True"
+        with assertNumQueries(1):
+            res = client.post("/edit/genres/upsert/", {"name": "Jazz"})
+        assert res["Location"] == "/list/genres/?created=False"
+        assert Genre.objects.count() == 2
+        assert Genre.objects.get(name="Jazz").pk == genre.pk
+
+    def test_create_upsert_do_nothing(self):
+        Genre.objects.create(name="Jazz", description="Swing")
+        res = client.post(
+            "/edit/genres/upsert/keep/", {"name": "Jazz", "description": "Bebop"}
+        )
+        assert res.status_code == 302
+        assert list(Genre.objects.values_list("description", flat=True)) == ["Swing"]
+
+    async def test_create_upsert_requires_unique_fields(self):
+        class MyCreateView(AsyncCreateView):
+            model = Genre
+            fields = "__all__"
+            upsert = True
+
+        message = "MyCreateView.upsert requires upsert_unique_fields to be set."
+        with pytest.raises(ImproperlyConfigured, match=message):
+            MyCreateView().get_upsert_unique_fields()
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_create_enqueue_after_commit(self):
+        views.indexed_authors.clear()
+        view = views.IndexedAuthorCreate.as_view()
+        request = RequestFactory().post(
+            "/", {"name": "Randall Munroe", "slug": "randall-munroe"}
+        )
+        res = await view(request)
+        assert res.status_code == 302
+        author = await Author.objects.aget()
+        await asyncio.sleep(0)
+        # the task runs once the response is sent.
+        assert views.indexed_authors == []
+        await sync_to_async(res.close)()
+        await asyncio.sleep(0)
+        await views.IndexedAuthorCreate.task_queue.adrain()
+        assert views.indexed_authors == [author.pk]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_create_enqueue_after_commit_without_loop(self):
+        # every request gets its own event loop, the task runs in close().
+        views.indexed_authors.clear()
+        view = views.IndexedAuthorCreate.as_view()
+        request = RequestFactory().post(
+            "/", {"name": "Randall Munroe", "slug": "randall-munroe"}
+        )
+        res = async_to_sync(view)(request)
+        assert views.indexed_authors == []
+        res.close()
+        assert views.indexed_authors == [Author.objects.get().pk]
+
+
+@pytest.mark.django_db
+class TestFormSetView:
+    def test_get(self):
+        Author.objects.create(name="Randall Munroe", slug="randall-munroe")
+        res = client.get("/edit/authors/formset/")
+        assert res.status_code == 200
+        assert res.context["formset"] is res.context["form"]
+        assert res.context["formset"].total_form_count() == 2
+        assert 'value="Randall Munroe"' in res.content.decode()
+
+    def test_post(self):
+        author = Author.objects.create(name="Randall Munroe", slug="randall-munroe")
+        res = client.post(
+            "/edit/authors/formset/",
+            {
+                "form-TOTAL_FORMS": "2",
+                "form-INITIAL_FORMS": "1",
+                "form-0-id": str(author.pk),
+                "form-0-name": "Randall",
+                "form-0-slug": "randall-munroe",
+                "form-1-name": "Ursula K. Le Guin",
+                "form-1-slug": "ursula",
+            },
+        )
+        assertRedirects(res, "/list/authors/")
+        assert list(Author.objects.values_list("name", flat=True)) == [
+            "Randall",
+            "Ursula K. Le Guin",
+        ]
+
+    def test_post_invalid(self):
+        res = client.post(
+            "/edit/authors/formset/",
+            {
+                "form-TOTAL_FORMS": "1",
+                "form-INITIAL_FORMS": "0",
+                "form-0-name": "Ursula K. Le Guin",
+            },
+        )
+        assert res.status_code == 200
+        assert res.context["formset"].errors == [{"slug": ["This field is required."]}]
+        assert not Author.objects.exists()
+
 
 @pytest.mark.django_db
 class TestUpdateView:
@@ -289,6 +568,76 @@ class TestUpdateView:
             Author.objects.values_list("name", flat=True), ["Randall Munroe (xkcd)"]
         )
 
+    def test_update_patch(self):
+        saves = []
+
+        def receiver(instance, update_fields, **kwargs):
+            saves.append(update_fields)
+
+        post_save.connect(receiver, sender=Author)
+        try:
+            res = client.patch(
+                "/edit/author/%d/update/" % self.author.pk,
+                "name=Randall+Munroe+%28xkcd%29",
+                content_type="application/x-www-form-urlencoded",
+            )
+        finally:
+            post_save.disconnect(receiver, sender=Author)
+        assert res.status_code == 302
+        assertRedirects(res, "/list/authors/")
+        assertQuerySetEqual(
+            Author.objects.values_list("name", "slug"),
+            [("Randall Munroe (xkcd)", "randall-munroe")],
+        )
+        assert saves == [frozenset(["name"])]
+
+    def test_update_patch_multipart(self):
+        res = client.patch(
+            "/edit/author/%d/update/" % self.author.pk,
+            encode_multipart(BOUNDARY, {"slug": "xkcd"}),
+            content_type=MULTIPART_CONTENT,
+        )
+        assert res.status_code == 302
+        assertQuerySetEqual(
+            Author.objects.values_list("name", "slug"),
+            [("Randall Munroe", "xkcd")],
+        )
+
+    def test_update_patch_multipart_large_upload(self, settings):
+        # uploads are limited like POST, only the other fields are counted.
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 100
+        upload = SimpleUploadedFile("notes.txt", b"x" * 1000)
+        res = client.patch(
+            "/edit/author/%d/update/" % self.author.pk,
+            encode_multipart(BOUNDARY, {"slug": "xkcd", "notes": upload}),
+            content_type=MULTIPART_CONTENT,
+        )
+        assert res.status_code == 302
+        assertQuerySetEqual(
+            Author.objects.values_list("name", "slug"),
+            [("Randall Munroe", "xkcd")],
+        )
+
+    def test_update_patch_multipart_malformed(self):
+        res = client.patch(
+            "/edit/author/%d/update/" % self.author.pk,
+            b"slug=xkcd",
+            content_type="multipart/form-data",
+        )
+        assert res.status_code == 400
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
+    def test_update_patch_invalid(self):
+        res = client.patch(
+            "/edit/author/%d/update/" % self.author.pk,
+            "name=" + "A" * 101,
+            content_type="application/x-www-form-urlencoded",
+        )
+        assert res.status_code == 200
+        assert list(res.context["form"].fields) == ["name"]
+        assert len(res.context["form"].errors) == 1
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
     def test_update_invalid(self):
         res = client.post(
             "/edit/author/%d/update/" % self.author.pk,
@@ -391,6 +740,119 @@ class TestUpdateView:
             Author.objects.values_list("name", flat=True), ["Randall Munroe (xkcd)"]
         )
 
+    def test_update_form_fragment(self):
+        res = client.post(
+            "/edit/author/%d/update/fragment/" % self.author.pk,
+            {"name": "A" * 101, "slug": "randall-munroe"},
+            headers={"X-Form-Fragment": "1"},
+        )
+        assert res.status_code == 200
+        content = res.content.decode()
+        assert content.startswith("<div>")
+        assert 'name="slug" value="randall-munroe"' in content
+        assert "Ensure this value has at most 100 characters" in content
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
+    def test_update_locked(self, mocker):
+        spy = mocker.spy(QuerySet, "select_for_update")
+        res = client.post(
+            "/edit/author/%d/update/locked/" % self.author.pk,
+            {"name": "Randall Munroe (xkcd)", "slug": "randall-munroe"},
+        )
+        assert res.status_code == 302
+        assertRedirects(res, "/list/authors/")
+        assert spy.call_args.kwargs == {"nowait": True, "skip_locked": False}
+        assertQuerySetEqual(
+            Author.objects.values_list("name", flat=True), ["Randall Munroe (xkcd)"]
+        )
+
+    def test_update_locked_patch(self):
+        res = client.patch(
+            "/edit/author/%d/update/locked/" % self.author.pk,
+            "name=Randall+Munroe+%28xkcd%29",
+            content_type="application/x-www-form-urlencoded",
+        )
+        assert res.status_code == 302
+        assertQuerySetEqual(
+            Author.objects.values_list("name", "slug"),
+            [("Randall Munroe (xkcd)", "randall-munroe")],
+        )
+
+    def test_update_locked_invalid(self):
+        res = client.post(
+            "/edit/author/%d/update/locked/" % self.author.pk,
+            {"name": "A" * 101, "slug": "randall-munroe"},
+        )
+        assert res.status_code == 200
+        assert len(res.context["form"].errors) == 1
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
+    def test_update_locked_nowait_conflict(self, mocker):
+        # the error of the database driver, wrapped by django.
+        cause = Exception("could not obtain lock on row")
+        cause.sqlstate = "55P03"
+        error = OperationalError("could not obtain lock on row")
+        error.__cause__ = cause
+        mocker.patch.object(
+            views.LockedAuthorUpdate,
+            "get_object",
+            mocker.AsyncMock(side_effect=error),
+        )
+        res = client.post(
+            "/edit/author/%d/update/locked/" % self.author.pk,
+            {"name": "Randall Munroe (xkcd)", "slug": "randall-munroe"},
+        )
+        assert res.status_code == 409
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
+    @pytest.mark.parametrize(
+        "args, sqlstate",
+        [
+            (None, None),
+            (("deadlock detected",), "40P01"),
+            ((2013, "Lost connection to server during query"), None),
+        ],
+    )
+    def test_update_locked_other_operational_error(self, mocker, args, sqlstate):
+        error = OperationalError("database error")
+        if args is not None:
+            error.__cause__ = Exception(*args)
+            error.__cause__.sqlstate = sqlstate
+        mocker.patch.object(
+            views.LockedAuthorUpdate,
+            "get_object",
+            mocker.AsyncMock(side_effect=error),
+        )
+        with pytest.raises(OperationalError):
+            client.post(
+                "/edit/author/%d/update/locked/" % self.author.pk,
+                {"name": "Randall Munroe (xkcd)", "slug": "randall-munroe"},
+            )
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
+    def test_update_skip_locked_conflict(self, mocker):
+        # a row locked by another transaction is skipped by the locked query.
+        calls = []
+
+        def select_for_update(self, **kwargs):
+            calls.append(kwargs)
+            return self.none()
+
+        mocker.patch.object(QuerySet, "select_for_update", select_for_update)
+        res = client.post(
+            "/edit/author/%d/update/skip-locked/" % self.author.pk,
+            {"name": "Randall Munroe (xkcd)", "slug": "randall-munroe"},
+        )
+        assert res.status_code == 409
+        # skip_locked can't be combined with the default nowait.
+        assert calls == [{"nowait": False, "skip_locked": True}]
+        res = client.post(
+            "/edit/author/%d/update/skip-locked/" % (self.author.pk + 1),
+            {"name": "Randall Munroe (xkcd)", "slug": "randall-munroe"},
+        )
+        assert res.status_code == 404
+        assertQuerySetEqual(Author.objects.all(), [self.author])
+
 
 @pytest.mark.django_db
 class TestDeleteView:
@@ -421,6 +883,20 @@ class TestDeleteView:
         assertRedirects(res, "/list/authors/")
         assertQuerySetEqual(Author.objects.all(), [])
 
+    def test_delete_fast(self):
+        book = Book.objects.create(
+            name="xkcd", slug="xkcd", pages=100, pubdate=datetime.date(2008, 10, 1)
+        )
+        book.authors.add(self.author)
+        view = views.AuthorDelete.as_view(fast_delete=True)
+        # the book relations and the author.
+        with assertNumQueries(3):
+            res = async_to_sync(view)(RequestFactory().post("/"), pk=self.author.pk)
+        assert res.status_code == 302
+        assert res.url == "/list/authors/"
+        assertQuerySetEqual(Author.objects.all(), [])
+        assert list(book.authors.all()) == []
+
     def test_delete_with_redirect(self):
         res = client.post("/edit/author/%d/delete/redirect/" % self.author.pk)
         assert res.status_code == 302
@@ -489,3 +965,197 @@ class TestDeleteView:
             "You must confirm the delete."
         ]
         assert res.context_data["form"].errors["confirm"] == ["This field is required."]
+
+
+@pytest.mark.django_db
+class TestVersionedViews:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cls.article = Article.objects.create(title="Orbital Mechanics")
+
+    def test_update_etag(self):
+        res = client.get("/edit/article/%d/update/" % self.article.pk)
+        assert res.status_code == 200
+        assert res.headers["ETag"] == '"1"'
+
+    def test_update_if_match(self):
+        url = "/edit/article/%d/update/" % self.article.pk
+        res = client.post(url, {"title": "Orbital Decay"}, headers={"If-Match": '"1"'})
+        assert res.status_code == 302
+        assertRedirects(res, "/list/authors/")
+        assertQuerySetEqual(
+            Article.objects.values_list("title", "version"), [("Orbital Decay", 2)]
+        )
+        # the first write changed the version.
+        res = client.post(url, {"title": "Orbital Period"}, headers={"If-Match": '"1"'})
+        assert res.status_code == 412
+        assertQuerySetEqual(
+            Article.objects.values_list("title", "version"), [("Orbital Decay", 2)]
+        )
+
+    def test_update_patch_if_match_any(self):
+        res = client.patch(
+            "/edit/article/%d/update/" % self.article.pk,
+            "title=Orbital+Decay",
+            content_type="application/x-www-form-urlencoded",
+            headers={"If-Match": "*"},
+        )
+        assert res.status_code == 302
+        assertQuerySetEqual(
+            Article.objects.values_list("title", "version"), [("Orbital Decay", 2)]
+        )
+
+    def test_update_conditional(self, mocker):
+        # another request writes the row after this one read it.
+        stale = Article.objects.get()
+        Article.objects.update(title="Orbital Decay", version=2)
+        mocker.patch.object(
+            views.ArticleUpdate, "get_object", mocker.AsyncMock(return_value=stale)
+        )
+        view = views.ArticleUpdate.as_view()
+        request = RequestFactory().post("/", {"title": "Orbital Period"})
+        # the check and the write are one UPDATE.
+        with assertNumQueries(1):
+            res = async_to_sync(view)(request, pk=self.article.pk)
+        assert res.status_code == 412
+        assertQuerySetEqual(
+            Article.objects.values_list("title", "version"), [("Orbital Decay", 2)]
+        )
+
+    def test_update_sets_auto_now(self):
+        updated_at = self.article.updated_at
+        res = client.post(
+            "/edit/article/%d/update/" % self.article.pk, {"title": "Orbital Decay"}
+        )
+        assert res.status_code == 302
+        assert Article.objects.get().updated_at > updated_at
+
+    def test_delete_etag(self):
+        res = client.get("/edit/article/%d/delete/" % self.article.pk)
+        assert res.status_code == 200
+        assert res.headers["ETag"] == '"%s"' % self.article.updated_at.isoformat()
+
+    def test_delete_if_match(self, subtests):
+        for url in ("/edit/article/%d/delete/", "/edit/article/%d/delete/fast/"):
+            with subtests.test(url=url):
+                article = Article.objects.create(title="Orbital Decay")
+                etag = '"%s"' % article.updated_at.isoformat()
+                res = client.post(url % article.pk, headers={"If-Match": '"stale"'})
+                assert res.status_code == 412
+                assert Article.objects.filter(pk=article.pk).exists()
+                res = client.delete(url % article.pk, headers={"If-Match": etag})
+                assert res.status_code == 302
+                assert not Article.objects.filter(pk=article.pk).exists()
+
+    def test_delete_conditional(self, mocker):
+        stale = Article.objects.get()
+        Article.objects.update(updated_at=datetime.datetime(2030, 1, 1))
+        mocker.patch.object(
+            views.ArticleDelete, "get_object", mocker.AsyncMock(return_value=stale)
+        )
+        res = client.post("/edit/article/%d/delete/" % self.article.pk)
+        assert res.status_code == 412
+        assert Article.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestEditSignals:
+    @pytest.fixture
+    def received(self):
+        received = []
+
+        async def receiver(signal, sender, **kwargs):
+            received.append((signal, sender, kwargs))
+
+        object_saved.connect(receiver, weak=False)
+        object_deleted.connect(receiver, weak=False)
+        yield received
+        object_saved.disconnect(receiver)
+        object_deleted.disconnect(receiver)
+
+    async def test_create(self, received):
+        res = await aclient.post(
+            "/edit/authors/create/",
+            {"name": "Randall Munroe", "slug": "randall-munroe"},
+        )
+        assert res.status_code == 302
+        author = await Author.objects.aget()
+        [(signal, sender, kwargs)] = received
+        assert signal is object_saved
+        assert sender is Author
+        assert kwargs["instance"] == author
+        assert kwargs["created"] is True
+        assert kwargs["request"].path == "/edit/authors/create/"
+        assert isinstance(kwargs["view"], AsyncCreateView)
+
+    async def test_update(self, received):
+        author = await Author.objects.acreate(name="Randall Munroe", slug="xkcd")
+        res = await aclient.post(
+            "/edit/author/%d/update/" % author.pk,
+            {"name": "Randall Munroe (xkcd)", "slug": "xkcd"},
+        )
+        assert res.status_code == 302
+        [(signal, sender, kwargs)] = received
+        assert signal is object_saved
+        assert kwargs["instance"] == author
+        assert kwargs["created"] is False
+
+    async def test_delete(self, received):
+        author = await Author.objects.acreate(name="Randall Munroe", slug="xkcd")
+        res = await aclient.post("/edit/author/%d/delete/" % author.pk)
+        assert res.status_code == 302
+        [(signal, sender, kwargs)] = received
+        assert signal is object_deleted
+        assert sender is Author
+        assert kwargs["pk"] == author.pk
+        assert kwargs["instance"].pk is None
+
+    async def test_receivers_concurrent_and_isolated(self, caplog):
+        first, second = asyncio.Event(), asyncio.Event()
+
+        # each receiver waits for the other one.
+        async def receiver_1(**kwargs):
+            first.set()
+            await asyncio.wait_for(second.wait(), 1)
+
+        async def receiver_2(**kwargs):
+            second.set()
+            await asyncio.wait_for(first.wait(), 1)
+
+        async def failing_receiver(**kwargs):
+            raise ValueError("index down")
+
+        receivers = [receiver_1, receiver_2, failing_receiver]
+        for receiver in receivers:
+            object_saved.connect(receiver)
+        try:
+            res = await aclient.post(
+                "/edit/authors/create/",
+                {"name": "Randall Munroe", "slug": "randall-munroe"},
+            )
+        finally:
+            for receiver in receivers:
+                object_saved.disconnect(receiver)
+        assert res.status_code == 302
+        assert first.is_set() and second.is_set()
+        assert "index down" in caplog.text
+
+    async def test_defer_signals(self, received):
+        view = AsyncCreateView.as_view(
+            model=Author,
+            fields="__all__",
+            success_url="/list/authors/",
+            defer_signals=True,
+        )
+        request = RequestFactory().post(
+            "/", {"name": "Randall Munroe", "slug": "randall-munroe"}
+        )
+        res = await view(request)
+        assert res.status_code == 302
+        await asyncio.sleep(0)
+        assert received == []
+        await sync_to_async(res.close)()
+        await asyncio.sleep(0)
+        await default_task_queue.adrain()
+        [(signal, sender, kwargs)] = received
+        assert kwargs["instance"] == await Author.objects.aget()
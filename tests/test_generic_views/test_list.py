@@ -121,6 +121,27 @@ class TestListView:
         assert res.context["author_list"][0].name == "Author 60"
         assert res.context["page_obj"].number == 3
 
+    async def test_rows(self):
+        res = await client.get("/list/authors/rows/")
+        assert res.status_code == 200
+        assert res.template_name[0] == "test_generic_views/author_list.html"
+        rows = list(res.context["object_list"])
+        assert rows == [
+            ("Roberto Bolaño", "roberto-bolano"),
+            ("Scott Rosenberg", "scott-rosenberg"),
+        ]
+        assert rows[0].slug == "roberto-bolano"
+        assert res.context["author_list"] is res.context["object_list"]
+
+    async def test_paginated_rows(self):
+        await self._make_authors(100)
+        res = await client.get("/list/authors/rows/paginated/", {"page": "2"})
+        assert res.status_code == 200
+        assert len(res.context["object_list"]) == 30
+        assert res.context["author_list"][0].name == "Author 30"
+        assert res.context["page_obj"].object_list is res.context["object_list"]
+        assert (await res.context["paginator"].acount()) == 100
+
     async def test_paginated_page_out_of_range(self):
         await self._make_authors(100)
         res = await client.get("/list/authors/paginated/42/")
@@ -81,6 +81,7 @@ urlpatterns = [
     path("detail/doesnotexist/<pk>/", views.ObjectDoesNotExistDetail.as_view()),
     # FormView
     path("contact/", views.ContactView.as_view()),
+    path("contact/fragment/", views.ContactView.as_view(form_fragments=True)),
     path("late-validation/", views.LateValidationView.as_view()),
     # Create/Update/DeleteView
     path("edit/artists/create/", views.ArtistCreate.as_view()),
@@ -101,7 +102,35 @@ urlpatterns = [
     path("edit/authors/create/restricted/", views.AuthorCreateRestricted.as_view()),
     re_path("^[eé]dit/authors/create/$", views.AuthorCreate.as_view()),
     path("edit/authors/create/special/", views.SpecializedAuthorCreate.as_view()),
+    path("edit/authors/formset/", views.AuthorFormSet.as_view()),
+    path("edit/authors/import/", views.AuthorImport.as_view()),
+    path("edit/genres/import/", views.GenreImport.as_view()),
+    path("edit/authors/bulk-delete/", views.AuthorBulkDelete.as_view()),
+    path(
+        "edit/authors/bulk-delete/fast/",
+        views.AuthorBulkDelete.as_view(fast_delete=True),
+    ),
+    path("edit/genres/upsert/", views.GenreUpsert.as_view()),
+    path(
+        "edit/genres/upsert/keep/",
+        views.GenreUpsert.as_view(upsert_update_fields=()),
+    ),
     path("edit/author/<int:pk>/update/naive/", views.NaiveAuthorUpdate.as_view()),
+    path(
+        "edit/author/<int:pk>/update/fragment/",
+        views.AuthorUpdate.as_view(form_fragments=True),
+    ),
+    path("edit/author/<int:pk>/update/locked/", views.LockedAuthorUpdate.as_view()),
+    path("edit/article/<int:pk>/update/", views.ArticleUpdate.as_view()),
+    path("edit/article/<int:pk>/delete/", views.ArticleDelete.as_view()),
+    path(
+        "edit/article/<int:pk>/delete/fast/",
+        views.ArticleDelete.as_view(fast_delete=True),
+    ),
+    path(
+        "edit/author/<int:pk>/update/skip-locked/",
+        views.LockedAuthorUpdate.as_view(lock_skip_locked=True),
+    ),
     path(
         "edit/author/<int:pk>/update/redirect/",
         views.NaiveAuthorUpdate.as_view(success_url="/edit/authors/create/"),
@@ -154,6 +183,14 @@ urlpatterns = [
         "list/authors/paginated-orphaned/",
         views.AuthorList.as_view(paginate_by=30, paginate_orphans=2),
     ),
+    path(
+        "list/authors/rows/",
+        views.AuthorList.as_view(row_fields=["name", "slug"]),
+    ),
+    path(
+        "list/authors/rows/paginated/",
+        views.AuthorList.as_view(row_fields=["name", "slug"], paginate_by=30),
+    ),
     path("list/authors/notempty/", views.AuthorList.as_view(allow_empty=False)),
     path(
         "list/authors/notempty/paginated/",
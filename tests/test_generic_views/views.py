@@ -3,6 +3,7 @@ from django.urls import reverse_lazy, reverse
 from django.utils.decorators import method_decorator
 
 from django_async_extensions.core.paginator import AsyncPaginator
+from django_async_extensions.utils.tasks import AsyncTaskQueue
 from django_async_extensions.views import generic
 
 from .forms import (
@@ -10,7 +11,7 @@ from .forms import (
     AuthorForm,
     ConfirmDeleteForm,
 )
-from .models import Artist, Author, Page, Book, BookSigning
+from .models import Article, Artist, Author, Page, Book, BookSigning, Genre
 
 
 class CustomTemplateView(generic.AsyncTemplateView):
@@ -149,6 +150,59 @@ class AuthorCreateRestricted(AuthorCreate):
     post = method_decorator(login_required)(AuthorCreate.post)
 
 
+class GenreUpsert(generic.AsyncCreateView):
+    model = Genre
+    fields = "__all__"
+    upsert = True
+    upsert_unique_fields = ["name"]
+
+    def get_success_url(self):
+        return "/list/genres/?created=%s" % self.created
+
+
+class AuthorFormSet(generic.AsyncFormSetView):
+    model = Author
+    fields = ["name", "slug"]
+    formset_kwargs = {"extra": 1, "can_delete": True}
+    success_url = "/list/authors/"
+    template_name = "test_generic_views/author_formset.html"
+
+
+class AuthorImport(generic.AsyncBulkImportView):
+    model = Author
+    fields = ["name", "slug"]
+
+
+class GenreImport(generic.AsyncBulkImportView):
+    model = Genre
+    fields = ["name", "description"]
+    batch_size = 2
+
+
+class AuthorBulkDelete(generic.AsyncBulkDeleteView):
+    queryset = Author.objects.exclude(slug="keep")
+    batch_size = 2
+
+
+indexed_authors = []
+
+
+async def index_author(pk):
+    indexed_authors.append(pk)
+
+
+class IndexedAuthorCreate(generic.AsyncCreateView):
+    model = Author
+    fields = "__all__"
+    success_url = "/list/authors/"
+    task_queue = AsyncTaskQueue()
+
+    async def form_valid(self, form):
+        response = await super().form_valid(form)
+        await self.enqueue_after_commit(index_author, self.object.pk)
+        return response
+
+
 class ArtistUpdate(generic.AsyncUpdateView):
     model = Artist
     fields = "__all__"
@@ -170,6 +224,21 @@ class AuthorUpdate(generic.AsyncUpdateView):
         return await super().get_form(*args, **kwargs)
 
 
+class LockedAuthorUpdate(generic.AsyncUpdateView):
+    model = Author
+    success_url = "/list/authors/"
+    fields = "__all__"
+    lock_for_update = True
+
+
+class ArticleUpdate(generic.AsyncUpdateView):
+    model = Article
+    fields = ["title"]
+    success_url = "/list/authors/"
+    template_name = "test_generic_views/form.html"
+    version_field = "version"
+
+
 class OneAuthorUpdate(generic.AsyncUpdateView):
     success_url = "/list/authors/"
     fields = "__all__"
@@ -205,6 +274,13 @@ class AuthorDeleteFormView(generic.AsyncDeleteView):
         return reverse("authors_list")
 
 
+class ArticleDelete(generic.AsyncDeleteView):
+    model = Article
+    success_url = "/list/authors/"
+    template_name = "test_generic_views/confirm_delete.html"
+    version_field = "updated_at"
+
+
 class SpecializedAuthorDelete(generic.AsyncDeleteView):
     queryset = Author.objects.all()
     template_name = "test_generic_views/confirm_delete.html"
@@ -0,0 +1,48 @@
+from asgiref.sync import async_to_sync
+
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_async_extensions.middleware.memo import RequestMemoMiddleware
+from django_async_extensions.utils.memo import get_request_memo
+from django_async_extensions.views.generic import AsyncDetailView
+
+from test_generic_views.models import Author
+
+
+class AuthorCheckView(AsyncDetailView):
+    model = Author
+
+    async def get(self, request, *args, **kwargs):
+        # e.g: a permission check and the view both fetch the object.
+        first = await self.get_object()
+        second = await self.get_object()
+        return HttpResponse(str(first is second))
+
+
+@pytest.mark.django_db
+class TestRequestMemoMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(cls):
+        cls.author = Author.objects.create(name="Randall Munroe", slug="xkcd")
+
+    def test_get_object_memoized(self):
+        view = AuthorCheckView.as_view()
+
+        async def get_response(request):
+            return await view(request, pk=self.author.pk)
+
+        middleware = RequestMemoMiddleware(get_response)
+        with assertNumQueries(1):
+            response = async_to_sync(middleware)(RequestFactory().get("/"))
+        assert response.content == b"True"
+        assert get_request_memo() is None
+
+    def test_without_middleware(self):
+        view = AuthorCheckView.as_view()
+        with assertNumQueries(2):
+            response = async_to_sync(view)(RequestFactory().get("/"), pk=self.author.pk)
+        assert response.content == b"False"
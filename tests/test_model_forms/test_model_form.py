@@ -23,7 +23,7 @@ from django.core.exceptions import (
     ValidationError,
 )
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import connection, models
+from django.db import DatabaseError, connection, models
 from django.db.models.query import EmptyQuerySet
 from django.forms.models import (
     ModelFormMetaclass,
@@ -39,6 +39,7 @@ from django.utils.choices import BlankChoiceIterator
 from django.utils.version import get_complete_version
 
 from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.forms.utils import clear_choices_cache
 
 from .models import (
     Article,
@@ -1801,6 +1802,160 @@ class TestModelFormBasic:
             self.c2,
         ]
 
+    async def test_m2m_editing_keeps_unchanged_rows(self):
+        await self.create_basic_data()
+        form_data = {
+            "headline": "New headline",
+            "slug": "new-headline",
+            "pub_date": "1988-01-04",
+            "writer": str(self.w_royko.pk),
+            "article": "Hello.",
+            "categories": [str(self.c1.id), str(self.c2.id)],
+        }
+        f = ArticleForm(form_data)
+        new_art = await f.asave()
+        through = Article.categories.through
+        kept = await through.objects.aget(article=new_art, category=self.c2)
+
+        # Only the difference is written, the row for c2 is left alone.
+        form_data["categories"] = [str(self.c2.id), str(self.c3.id)]
+        f = await ArticleForm.from_async(form_data, instance=new_art)
+        await f.asave()
+        assert [art async for art in new_art.categories.order_by("name")] == [
+            self.c2,
+            self.c3,
+        ]
+        assert (await through.objects.aget(article=new_art, category=self.c2)).pk == (
+            kept.pk
+        )
+
+    async def test_m2m_editing_is_atomic(self):
+        await self.create_basic_data()
+        form_data = {
+            "headline": "New headline",
+            "slug": "new-headline",
+            "pub_date": "1988-01-04",
+            "writer": str(self.w_royko.pk),
+            "article": "Hello.",
+            "categories": [str(self.c1.id)],
+        }
+        new_art = await ArticleForm(form_data).asave()
+
+        form_data["categories"] = [str(self.c2.id)]
+        f = await ArticleForm.from_async(form_data, instance=new_art)
+        with mock.patch.object(
+            models.QuerySet, "bulk_create", side_effect=DatabaseError
+        ):
+            with pytest.raises(DatabaseError):
+                await f.asave()
+        # the stale row isn't deleted when the insert fails.
+        assert [art async for art in new_art.categories.all()] == [self.c1]
+
+    async def test_m2m_editing_with_m2m_changed_receiver(self):
+        await self.create_basic_data()
+        actions = []
+
+        def receiver(action, **kwargs):
+            actions.append(action)
+
+        models.signals.m2m_changed.connect(receiver, sender=Article.categories.through)
+        try:
+            form_data = {
+                "headline": "New headline",
+                "slug": "new-headline",
+                "pub_date": "1988-01-04",
+                "writer": str(self.w_royko.pk),
+                "article": "Hello.",
+                "categories": [str(self.c1.id)],
+            }
+            f = ArticleForm(form_data)
+            new_art = await f.asave()
+        finally:
+            models.signals.m2m_changed.disconnect(
+                receiver, sender=Article.categories.through
+            )
+        assert actions == ["pre_add", "post_add"]
+        assert [art async for art in new_art.categories.all()] == [self.c1]
+
+    async def test_model_choices_are_prefetched(self):
+        await self.create_basic_data()
+        form_data = {
+            "headline": "New headline",
+            "slug": "new-headline",
+            "pub_date": "1988-01-04",
+            "writer": str(self.w_royko.pk),
+            "article": "Hello.",
+            "categories": [str(self.c1.id), str(self.c3.id)],
+        }
+        f = ArticleForm(form_data)
+        prefetched = await f._aprefetch_model_choices()
+        assert set(prefetched) == {"writer", "categories"}
+
+        assert await f.ais_valid()
+        assert f.cleaned_data["writer"] == self.w_royko
+        categories = f.cleaned_data["categories"]
+        # the submitted categories are reused instead of queried again.
+        assert categories._result_cache == [self.c1, self.c3]
+        # the fields are left as they were.
+        assert "to_python" not in f.fields["writer"].__dict__
+        assert "_check_values" not in f.fields["categories"].__dict__
+
+    async def test_model_choices_prefetch_invalid_values(self):
+        await self.create_basic_data()
+        form_data = {
+            "headline": "New headline",
+            "slug": "new-headline",
+            "pub_date": "1988-01-04",
+            "writer": "abc",
+            "article": "Hello.",
+            "categories": [str(self.c1.id), "0"],
+        }
+        f = ArticleForm(form_data)
+        assert not await f.ais_valid()
+        assert f.errors["writer"] == [
+            "Select a valid choice. That choice is not one of the available choices."
+        ]
+        assert f.errors["categories"] == [
+            "Select a valid choice. 0 is not one of the available choices."
+        ]
+
+    async def test_save_only_changed_fields(self):
+        class ChangedCategoryForm(BaseCategoryForm):
+            save_only_changed_fields = True
+
+        await self.create_basic_data()
+        saves = []
+
+        def receiver(instance, update_fields, **kwargs):
+            saves.append(update_fields)
+
+        models.signals.post_save.connect(receiver, sender=Category)
+        try:
+            form_data = {"name": "Entertainment", "slug": "fun", "url": "entertainment"}
+            f = await ChangedCategoryForm.from_async(form_data, instance=self.c1)
+            assert await f.ais_valid()
+            assert f.get_changed_model_fields() == ["slug"]
+            await f.asave()
+            assert saves == [frozenset(["slug"])]
+            assert (await Category.objects.aget(pk=self.c1.pk)).slug == "fun"
+
+            # nothing changed, nothing is written.
+            f = await ChangedCategoryForm.from_async(form_data, instance=self.c1)
+            await f.asave()
+            assert saves == [frozenset(["slug"])]
+
+            # new instances are saved as usual.
+            f = ChangedCategoryForm({"name": "New", "slug": "new", "url": "new"})
+            await f.asave()
+            assert saves[-1] is None
+
+            # the default is to save every field.
+            f = await BaseCategoryForm.from_async(form_data, instance=self.c1)
+            await f.asave()
+            assert saves[-1] is None
+        finally:
+            models.signals.post_save.disconnect(receiver, sender=Category)
+
     async def test_custom_form_fields(self):
         # Here, we define a custom ModelForm. Because it happens to have the
         # same fields as the Category model, we can just call the form's save()
@@ -1896,6 +2051,84 @@ class TestModelFormBasic:
             ),
         )
 
+    async def test_aload_choices(self):
+        await self.create_basic_data()
+        f = ArticleForm(auto_id=False)
+        await f.aload_choices()
+
+        def render():
+            with assertNumQueries(0):
+                return str(f["writer"])
+
+        assertHTMLEqual(
+            await sync_to_async(render)(),
+            '<select name="writer" required>'
+            '<option value="" selected>---------</option>'
+            '<option value="%s">Bob Woodward</option>'
+            '<option value="%s">Mike Royko</option>'
+            "</select>" % (self.w_woodward.pk, self.w_royko.pk),
+        )
+
+    async def test_choices_cache_timeout(self):
+        class CachedArticleForm(ArticleForm):
+            choices_cache_timeout = 60
+
+        await self.create_basic_data()
+        clear_choices_cache()
+        try:
+            await CachedArticleForm().aload_choices()
+            await Writer.objects.acreate(name="Carl Bernstein")
+
+            # the cached choices are reused by other instances.
+            f = CachedArticleForm(auto_id=False)
+            await f.aload_choices()
+            assert [label for _, label in f.fields["writer"].widget.choices] == [
+                "---------",
+                "Bob Woodward",
+                "Mike Royko",
+            ]
+
+            clear_choices_cache()
+            f = CachedArticleForm(auto_id=False)
+            await f.aload_choices()
+            assert [label for _, label in f.fields["writer"].widget.choices] == [
+                "---------",
+                "Bob Woodward",
+                "Carl Bernstein",
+                "Mike Royko",
+            ]
+        finally:
+            clear_choices_cache()
+
+    async def test_aload_choices_labels_follow_relations(self):
+        class ArticleChoiceField(forms.ModelChoiceField):
+            def label_from_instance(self, obj):
+                # a query per object, which can't run on the event loop.
+                return "%s by %s" % (obj.headline, obj.writer.name)
+
+        class ArticleChoiceForm(AsyncModelForm):
+            article = ArticleChoiceField(queryset=Article.objects.order_by("pk"))
+
+            class Meta:
+                model = Category
+                fields = ["name"]
+
+        await self.create_basic_data()
+        article = await Article.objects.acreate(
+            headline="Test article",
+            slug="test-article",
+            pub_date=datetime.date(1988, 1, 4),
+            writer=self.w_royko,
+        )
+        f = ArticleChoiceForm(auto_id=False)
+        await f.aload_choices()
+        assert f.fields["article"].widget.choices == [
+            ("", "---------"),
+            (mock.ANY, "Test article by Mike Royko"),
+        ]
+        assert f.fields["article"].widget.choices[1][0].value == article.pk
+        assert "Test article by Mike Royko" in await f.aas_div()
+
     @isolate_apps("test_model_forms")
     def test_callable_choices_are_lazy(self):
         call_count = 0
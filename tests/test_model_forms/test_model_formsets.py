@@ -0,0 +1,178 @@
+import pytest
+from pytest_django.asserts import assertNumQueries
+
+from asgiref.sync import async_to_sync
+
+from django.db.models import QuerySet
+
+from django_async_extensions.forms.models import (
+    AsyncInlineFormSet,
+    AsyncModelFormSet,
+    async_inlineformset_factory,
+    async_modelformset_factory,
+)
+
+from .models import Book, Category, Writer
+
+
+def management_data(prefix, total, initial):
+    return {
+        f"{prefix}-TOTAL_FORMS": str(total),
+        f"{prefix}-INITIAL_FORMS": str(initial),
+        f"{prefix}-MIN_NUM_FORMS": "0",
+        f"{prefix}-MAX_NUM_FORMS": "1000",
+    }
+
+
+CategoryFormSet = async_modelformset_factory(
+    Category, fields=["name", "slug", "url"], extra=1, can_delete=True
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncModelFormSet:
+    async def create_categories(self):
+        return [
+            await Category.objects.acreate(name="Jazz", slug="jazz", url="jazz"),
+            await Category.objects.acreate(name="Rock", slug="rock", url="rock"),
+            await Category.objects.acreate(name="Pop", slug="pop", url="pop"),
+        ]
+
+    def test_factory(self):
+        assert issubclass(CategoryFormSet, AsyncModelFormSet)
+        assert CategoryFormSet.model is Category
+
+    async def test_unbound(self):
+        await self.create_categories()
+        formset = CategoryFormSet()
+        assert await formset.ais_valid() is False
+        await formset.aload_queryset()
+        assert [form.instance.name for form in formset.forms[:3]] == [
+            "Jazz",
+            "Rock",
+            "Pop",
+        ]
+        html = await formset.aas_div()
+        assert 'value="Jazz"' in html
+
+    async def test_asave(self, mocker):
+        jazz, rock, pop = await self.create_categories()
+        data = management_data("form", 4, 3)
+        data.update(
+            {
+                # renamed
+                "form-0-id": str(jazz.pk),
+                "form-0-name": "Jazz music",
+                "form-0-slug": "jazz",
+                "form-0-url": "jazz",
+                # unchanged
+                "form-1-id": str(rock.pk),
+                "form-1-name": "Rock",
+                "form-1-slug": "rock",
+                "form-1-url": "rock",
+                # deleted
+                "form-2-id": str(pop.pk),
+                "form-2-name": "Pop",
+                "form-2-slug": "pop",
+                "form-2-url": "pop",
+                "form-2-DELETE": "on",
+                # added
+                "form-3-name": "Blues",
+                "form-3-slug": "blues",
+                "form-3-url": "blues",
+            }
+        )
+        formset = CategoryFormSet(data)
+        assert await formset.ais_valid() is True
+        bulk_update = mocker.spy(QuerySet, "bulk_update")
+        instances = await formset.asave()
+
+        assert [obj.name for obj in instances] == ["Jazz music", "Blues"]
+        assert bulk_update.call_args.kwargs["fields"] == ("name",)
+        assert [obj.name for obj in formset.new_objects] == ["Blues"]
+        assert formset.deleted_objects[0].pk is None
+        names = [name async for name in Category.objects.values_list("name", flat=True)]
+        assert names == ["Jazz music", "Rock", "Blues"]
+
+    @pytest.mark.django_db
+    def test_asave_queries(self):
+        categories = async_to_sync(self.create_categories)()
+        data = management_data("form", 5, 3)
+        for i, category in enumerate(categories):
+            data.update(
+                {
+                    f"form-{i}-id": str(category.pk),
+                    f"form-{i}-name": category.name.upper(),
+                    f"form-{i}-slug": category.slug,
+                    f"form-{i}-url": category.url,
+                }
+            )
+        for i in (3, 4):
+            data.update(
+                {
+                    f"form-{i}-name": f"new {i}",
+                    f"form-{i}-slug": f"new-{i}",
+                    f"form-{i}-url": f"new-{i}",
+                }
+            )
+        formset = async_modelformset_factory(Category, fields=["name", "slug", "url"])(
+            data
+        )
+
+        async def validate_and_save():
+            assert await formset.ais_valid() is True
+            await formset.asave()
+
+        # the queryset, the primary keys submitted by every form, one bulk
+        # update and one bulk insert.
+        with assertNumQueries(4):
+            async_to_sync(validate_and_save)()
+        assert Category.objects.filter(name="JAZZ").exists()
+        assert Category.objects.filter(slug__startswith="new-").count() == 2
+
+    async def test_invalid(self):
+        data = management_data("form", 1, 0)
+        data.update({"form-0-name": "Jazz"})
+        formset = CategoryFormSet(data)
+        assert await formset.ais_valid() is False
+        assert "slug" in (await formset.aerrors)[0]
+        with pytest.raises(ValueError):
+            await formset.asave()
+
+    async def test_asave_commit_false(self):
+        data = management_data("form", 1, 0)
+        data.update({"form-0-name": "Jazz", "form-0-slug": "jazz", "form-0-url": "j"})
+        formset = CategoryFormSet(data)
+        assert await formset.ais_valid() is True
+        [category] = await formset.asave(commit=False)
+        assert category.pk is None
+        await category.asave()
+        await formset.asave_m2m()
+        assert await Category.objects.acount() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncInlineFormSet:
+    async def test_asave(self):
+        BookFormSet = async_inlineformset_factory(Writer, Book, fields=["title"])
+        assert issubclass(BookFormSet, AsyncInlineFormSet)
+        writer = await Writer.objects.acreate(name="Ursula K. Le Guin")
+        book = await Book.objects.acreate(title="The Dispossesed", author=writer)
+        data = management_data("book_set", 2, 1)
+        data.update(
+            {
+                "book_set-0-id": str(book.pk),
+                "book_set-0-title": "The Dispossessed",
+                "book_set-1-title": "The Lathe of Heaven",
+            }
+        )
+        formset = BookFormSet(data, instance=writer)
+        assert await formset.ais_valid() is True
+        await formset.asave()
+        titles = [
+            title
+            async for title in Book.objects.filter(author=writer)
+            .order_by("title")
+            .values_list("title", flat=True)
+        ]
+        assert titles == ["The Dispossessed", "The Lathe of Heaven"]